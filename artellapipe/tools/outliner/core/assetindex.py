@@ -0,0 +1,316 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains the inverted index of scene assets used by Artella Outliner
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import logging
+
+from artellapipe.tools.outliner.core import records
+
+LOGGER = logging.getLogger()
+
+BUILD_CHUNK_SIZE = 50
+
+
+def _load_scene_assets():
+    """
+    Internal function that returns all the assets of the current scene
+    :return: list(ArtellaAssetNode)
+    """
+
+    import artellapipe
+
+    return artellapipe.AssetsMgr().get_scene_assets() or list()
+
+
+class AssetIndex(object):
+    """
+    Inverted index that maps asset types and tags with the ids of the scene assets
+    Index is built once per scene snapshot and shared by all outliners, so the assets manager is only queried once
+    """
+
+    def __init__(self, loader=None):
+
+        self._loader = loader or _load_scene_assets
+        self._nodes = dict()
+        self._order = dict()
+        self._types = dict()
+        self._tags = dict()
+        self._asset_keys = dict()
+        self._counter = 0
+        self._generation = 0
+        self._built = False
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def __contains__(self, asset_id):
+        return asset_id in self._nodes
+
+    @property
+    def is_built(self):
+        """
+        Returns whether or not the index contains a scene snapshot
+        :return: bool
+        """
+
+        return self._built
+
+    @property
+    def generation(self):
+        """
+        Returns the number of times the index was invalidated. Can be used to know whether scene assets changed
+        since data was collected from the index
+        :return: int
+        """
+
+        return self._generation
+
+    def build(self, asset_nodes=None):
+        """
+        Builds the index from the given asset nodes. If not given, scene assets are retrieved from assets manager
+        :param asset_nodes: list(ArtellaAssetNode) or None
+        """
+
+        for _ in self.iter_build(asset_nodes=asset_nodes, chunk_size=None):
+            pass
+
+    def iter_build(self, asset_nodes=None, chunk_size=BUILD_CHUNK_SIZE):
+        """
+        Builds the index in small chunks. Generator yields once scene assets are retrieved and after indexing each
+        chunk of assets, so the build can be spread over several idle callbacks
+        :param asset_nodes: list(ArtellaAssetNode) or None
+        :param chunk_size: int or None, number of assets indexed between yields. If None, all assets are indexed at once
+        """
+
+        self.clear()
+        if asset_nodes is None:
+            try:
+                asset_nodes = self._loader()
+            except Exception as exc:
+                LOGGER.error('Impossible to retrieve scene assets: {}'.format(exc))
+                asset_nodes = list()
+            yield
+        for i, asset_node in enumerate(asset_nodes, 1):
+            self.add(asset_node)
+            if chunk_size and not i % chunk_size:
+                yield
+        self._built = True
+
+    def ensure_built(self):
+        """
+        Builds the index if it does not contain a scene snapshot yet
+        """
+
+        if not self._built:
+            self.build()
+
+    def invalidate(self):
+        """
+        Discards current scene snapshot. Index will be built again the next time it is requested
+        """
+
+        self._generation += 1
+        self.clear()
+
+    def clear(self):
+        """
+        Removes all the assets of the index
+        """
+
+        self._nodes.clear()
+        self._order.clear()
+        self._types.clear()
+        self._tags.clear()
+        self._asset_keys.clear()
+        self._built = False
+
+    def add(self, asset_node):
+        """
+        Adds given asset node to the index, replacing any indexed asset with the same id
+        :param asset_node: ArtellaAssetNode
+        """
+
+        asset_id = asset_node.id
+        if asset_id in self._nodes:
+            self.remove(asset_id)
+
+        asset_type = records.get_asset_type(asset_node).lower()
+        asset_tags = frozenset(tag.lower() for tag in records.get_asset_tags(asset_node) if tag)
+        self._nodes[asset_id] = asset_node
+        self._order[asset_id] = self._counter
+        self._counter += 1
+        self._asset_keys[asset_id] = (asset_type, asset_tags)
+        if asset_type:
+            self._types.setdefault(asset_type, set()).add(asset_id)
+        for tag in asset_tags:
+            self._tags.setdefault(tag, set()).add(asset_id)
+
+    def remove(self, asset_id):
+        """
+        Removes asset with given id from the index
+        :param asset_id: str
+        :return: ArtellaAssetNode or None
+        """
+
+        asset_node = self._nodes.pop(asset_id, None)
+        if asset_node is None:
+            return None
+
+        self._order.pop(asset_id, None)
+        asset_type, asset_tags = self._asset_keys.pop(asset_id)
+        self._discard(self._types, asset_type, asset_id)
+        for tag in asset_tags:
+            self._discard(self._tags, tag, asset_id)
+
+        return asset_node
+
+    def get_node(self, asset_id):
+        """
+        Returns indexed asset node with given id
+        :param asset_id: str
+        :return: ArtellaAssetNode or None
+        """
+
+        return self._nodes.get(asset_id)
+
+    def get_nodes(self, asset_ids=None):
+        """
+        Returns asset nodes with given ids sorted in scene order
+        :param asset_ids: set(str) or None, if not given all indexed asset nodes are returned
+        :return: list(ArtellaAssetNode)
+        """
+
+        if asset_ids is None:
+            asset_ids = self._nodes.keys()
+        sorted_ids = sorted((asset_id for asset_id in asset_ids if asset_id in self._nodes), key=self._order.get)
+
+        return [self._nodes[asset_id] for asset_id in sorted_ids]
+
+    def type_names(self):
+        """
+        Returns all indexed asset types
+        :return: list(str)
+        """
+
+        return sorted(self._types.keys())
+
+    def tag_names(self):
+        """
+        Returns all indexed asset tags
+        :return: list(str)
+        """
+
+        return sorted(self._tags.keys())
+
+    def tag_count(self, tag, asset_ids=None):
+        """
+        Returns the number of assets that have the given tag
+        :param tag: str
+        :param asset_ids: set(str) or None, if given only these assets are counted
+        :return: int
+        """
+
+        tag_ids = self._tags.get(tag.lower(), set())
+        if asset_ids is None:
+            return len(tag_ids)
+
+        return len(tag_ids & asset_ids)
+
+    def with_type(self, asset_type):
+        """
+        Returns the ids of the assets of the given type
+        :param asset_type: str
+        :return: set(str)
+        """
+
+        return set(self._types.get(asset_type.lower(), ()))
+
+    def with_tag(self, tag):
+        """
+        Returns the ids of the assets that have the given tag
+        :param tag: str
+        :return: set(str)
+        """
+
+        return set(self._tags.get(tag.lower(), ()))
+
+    def match_categories(self, categories=None):
+        """
+        Returns the ids of the assets that belong to any of the given categories
+        An asset belongs to a category if its type or any of its tags matches the category
+        :param categories: list(str) or None, if not given all indexed assets are returned
+        :return: set(str)
+        """
+
+        if not categories:
+            return set(self._nodes.keys())
+
+        asset_ids = set()
+        for category in categories:
+            category = category.lower()
+            asset_ids.update(self._types.get(category, ()))
+            asset_ids.update(self._tags.get(category, ()))
+
+        return asset_ids
+
+    def match_tags(self, tags, asset_ids=None):
+        """
+        Returns the ids of the assets that have all the given tags
+        :param tags: list(str)
+        :param asset_ids: set(str) or None, if given only these assets are checked
+        :return: set(str)
+        """
+
+        matched_ids = set(self._nodes.keys()) if asset_ids is None else set(asset_ids)
+        for tag in sorted(tags, key=lambda t: len(self._tags.get(t.lower(), ()))):
+            matched_ids &= self._tags.get(tag.lower(), set())
+            if not matched_ids:
+                break
+
+        return matched_ids
+
+    def _discard(self, index, key, asset_id):
+        """
+        Internal function that removes given asset id from the given index key, removing empty keys
+        :param index: dict(str, set(str))
+        :param key: str
+        :param asset_id: str
+        """
+
+        key_ids = index.get(key)
+        if key_ids is None:
+            return
+        key_ids.discard(asset_id)
+        if not key_ids:
+            index.pop(key)
+
+
+_INDEX = AssetIndex()
+
+
+def get_index():
+    """
+    Returns the asset index of the current session
+    :return: AssetIndex
+    """
+
+    return _INDEX
+
+
+def invalidate_index():
+    """
+    Invalidates the asset index of the current session
+    Must be called each time the assets of the scene change
+    """
+
+    _INDEX.invalidate()
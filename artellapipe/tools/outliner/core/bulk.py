@@ -0,0 +1,211 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains the scope used by Artella Outliner to group bulk modifications of DCC nodes
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import logging
+from functools import wraps
+from collections import OrderedDict
+
+LOGGER = logging.getLogger()
+
+
+def _suspend_maya_refresh():
+    """
+    Internal function that suspends Maya viewport refresh
+    """
+
+    import maya.cmds as cmds
+
+    cmds.refresh(suspend=True)
+
+
+def _resume_maya_refresh():
+    """
+    Internal function that resumes Maya viewport refresh and forces a single viewport redraw
+    """
+
+    import maya.cmds as cmds
+
+    cmds.refresh(suspend=False)
+    cmds.refresh(force=True)
+
+
+def get_dcc_refresh_hooks(dcc=None, fallback_hooks=None):
+    """
+    Returns the functions used to suspend and resume viewport refresh of the current DCC
+    Hooks are the tpDcc suspend_viewport_refresh and resume_viewport_refresh functions, if the DCC implements them.
+    Resume function is expected to redraw the viewport once. Otherwise, DCC specific fallback hooks are used
+    :param dcc: object or None, DCC interface that implements the hook functions. If not given, tpDcc one is used
+    :param fallback_hooks: tuple(fn, fn) or None, hooks used if the DCC does not implement them. If dcc is not given,
+        fallback hooks of the current DCC are used
+    :return: tuple(fn, fn) or tuple(None, None)
+    """
+
+    if dcc is None:
+        import tpDcc as tp
+        dcc = tp.Dcc
+        if fallback_hooks is None and tp.is_maya():
+            fallback_hooks = (_suspend_maya_refresh, _resume_maya_refresh)
+
+    suspend_fn = getattr(dcc, 'suspend_viewport_refresh', None)
+    resume_fn = getattr(dcc, 'resume_viewport_refresh', None)
+    if suspend_fn and resume_fn:
+        return suspend_fn, resume_fn
+    if fallback_hooks:
+        return fallback_hooks
+
+    LOGGER.warning(
+        'Current DCC cannot suspend viewport refresh. Outliner bulk modifications will redraw the viewport after '
+        'each change')
+
+    return None, None
+
+
+class BulkMutation(object):
+    """
+    Scope that groups bulk modifications of DCC nodes. While the scope is active viewport refresh is suspended, and
+    the updates deferred during the scope are flushed only once, when the outermost scope is exited
+    """
+
+    def __init__(self, suspend_fn=None, resume_fn=None):
+
+        self._hooks = (suspend_fn, resume_fn) if suspend_fn or resume_fn else None
+        self._depth = 0
+        self._suspended = False
+        self._deferred = OrderedDict()
+
+    def __enter__(self):
+        self._depth += 1
+        if self._depth == 1:
+            self._suspend()
+
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._depth -= 1
+        if self._depth == 0:
+            try:
+                self._flush()
+            finally:
+                self._resume()
+
+        return False
+
+    @property
+    def is_active(self):
+        """
+        Returns whether or not a bulk mutation scope is active
+        :return: bool
+        """
+
+        return self._depth > 0
+
+    def defer(self, key, fn):
+        """
+        Defers given function until the bulk mutation scope is exited. Functions deferred with the same key are only
+        called once. If no scope is active, function is called immediately
+        :param key: object
+        :param fn: fn
+        """
+
+        if not self.is_active:
+            fn()
+            return
+
+        self._deferred.pop(key, None)
+        self._deferred[key] = fn
+
+    def _flush(self):
+        """
+        Internal function that calls all deferred functions
+        """
+
+        while self._deferred:
+            _, fn = self._deferred.popitem(last=False)
+            try:
+                fn()
+            except Exception as exc:
+                LOGGER.warning('Impossible to flush outliner bulk update | {}'.format(exc))
+
+    def _suspend(self):
+        """
+        Internal function that suspends DCC viewport refresh
+        """
+
+        suspend_fn = self._get_hooks()[0]
+        if not suspend_fn:
+            return
+        try:
+            suspend_fn()
+            self._suspended = True
+        except Exception as exc:
+            LOGGER.debug('Impossible to suspend DCC viewport refresh | {}'.format(exc))
+
+    def _resume(self):
+        """
+        Internal function that resumes DCC viewport refresh, if it was suspended
+        """
+
+        if not self._suspended:
+            return
+
+        self._suspended = False
+        resume_fn = self._get_hooks()[1]
+        if resume_fn:
+            resume_fn()
+
+    def _get_hooks(self):
+        """
+        Internal function that returns the DCC refresh hooks, retrieving them the first time they are requested
+        :return: tuple(fn, fn)
+        """
+
+        if self._hooks is None:
+            try:
+                self._hooks = get_dcc_refresh_hooks()
+            except Exception as exc:
+                LOGGER.warning('Impossible to retrieve DCC viewport refresh hooks | {}'.format(exc))
+                self._hooks = (None, None)
+
+        return self._hooks
+
+
+_BULK_MUTATION = BulkMutation()
+
+
+def get_bulk_mutation():
+    """
+    Returns the bulk mutation scope of the current session
+    :return: BulkMutation
+    """
+
+    return _BULK_MUTATION
+
+
+def bulk_mutation_decorator(undo_decorator=None):
+    """
+    Returns a decorator that runs the decorated function inside the bulk mutation scope of the current session
+    :param undo_decorator: fn or None, decorator used to group all the DCC modifications in a single undo chunk
+    :return: fn
+    """
+
+    def decorator(fn):
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            with get_bulk_mutation():
+                return fn(*args, **kwargs)
+
+        return undo_decorator(wrapper) if undo_decorator else wrapper
+
+    return decorator
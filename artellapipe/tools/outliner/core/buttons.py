@@ -12,11 +12,13 @@ __license__ = "MIT"
 __maintainer__ = "Tomas Poveda"
 __email__ = "tpovedatd@gmail.com"
 
+from Qt.QtCore import *
 from Qt.QtWidgets import *
 
-import tpDcc
 from tpDcc.libs.qt.widgets import dividers
 
+from artellapipe.tools.outliner.core import icons
+
 
 class DisplayButtonsWidget(QWidget, object):
     def __init__(self, parent=None):
@@ -24,7 +26,6 @@ class DisplayButtonsWidget(QWidget, object):
 
         self.setMinimumWidth(100)
         self.setSizePolicy(QSizePolicy.Maximum, QSizePolicy.Preferred)
-        self.setMouseTracking(True)
 
         self.main_layout = QHBoxLayout()
         self.main_layout.setContentsMargins(0, 0, 0, 0)
@@ -43,21 +44,40 @@ class DisplayButtonsWidget(QWidget, object):
 
 class AssetDisplayButtons(DisplayButtonsWidget, object):
 
-    open_eye_icon = tpDcc.ResourcesMgr().icon('eye')
-    closed_eye_icon = tpDcc.ResourcesMgr().icon('eye_closed')
+    OPEN_EYE_ICON = 'eye'
+    CLOSED_EYE_ICON = 'eye_closed'
 
     def __init__(self, parent=None):
         super(AssetDisplayButtons, self).__init__(parent=parent)
 
+    @property
+    def open_eye_icon(self):
+        """
+        Returns the icon displayed while the asset is visible. Icon is loaded the first time it is requested
+        :return: QIcon
+        """
+
+        return icons.get_icon(self.OPEN_EYE_ICON)
+
+    @property
+    def closed_eye_icon(self):
+        """
+        Returns the icon displayed while the asset is hidden. Icon is loaded the first time it is requested
+        :return: QIcon
+        """
+
+        return icons.get_icon(self.CLOSED_EYE_ICON)
+
     def custom_ui(self):
 
         self.setMinimumWidth(25)
 
         self.view_btn = QPushButton()
-        self.view_btn.setIcon(tpDcc.ResourcesMgr().icon('eye'))
+        self.view_btn.setIcon(self.open_eye_icon)
         self.view_btn.setFlat(True)
         self.view_btn.setFixedWidth(25)
         self.view_btn.setSizePolicy(QSizePolicy.Maximum, QSizePolicy.Preferred)
+        self.view_btn.setAttribute(Qt.WA_TransparentForMouseEvents)
         self.main_layout.addWidget(self.view_btn)
 
         self.main_layout.addWidget(dividers.get_horizontal_separator_widget())
@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains the queue used to buffer scene changes of suspended Artella Outliners
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+from collections import OrderedDict
+
+DELTA_ADD = 'add'
+DELTA_REMOVE = 'remove'
+DELTA_UPDATE = 'update'
+
+DEFAULT_MAX_SIZE = 500
+
+
+class DeltaQueue(object):
+    """
+    Buffers scene asset changes. Only the net change of each asset is stored, so an asset that is added and removed
+    again before the queue is flushed is not stored at all. If the queue grows over its maximum size, changes are
+    discarded and the queue is flagged as overflowed, so its owner can do a full refresh instead
+    """
+
+    def __init__(self, max_size=DEFAULT_MAX_SIZE):
+
+        self._max_size = max_size
+        self._deltas = OrderedDict()
+        self._overflowed = False
+
+    def __len__(self):
+        return len(self._deltas)
+
+    @property
+    def overflowed(self):
+        """
+        Returns whether or not changes were discarded because the queue was full
+        :return: bool
+        """
+
+        return self._overflowed
+
+    def push_add(self, asset_id, payload=None):
+        """
+        Queues the addition of an asset
+        :param asset_id: str
+        :param payload: object, data needed to add the asset
+        """
+
+        previous = self._deltas.get(asset_id)
+        if previous is None:
+            self._push(asset_id, DELTA_ADD, payload)
+        elif previous[0] == DELTA_REMOVE:
+            self._deltas[asset_id] = (DELTA_UPDATE, payload)
+        else:
+            self._deltas[asset_id] = (previous[0], payload)
+
+    def push_update(self, asset_id, payload=None):
+        """
+        Queues the update of an asset
+        :param asset_id: str
+        :param payload: object, data needed to update the asset
+        """
+
+        previous = self._deltas.get(asset_id)
+        if previous is None:
+            self._push(asset_id, DELTA_UPDATE, payload)
+        elif previous[0] == DELTA_ADD:
+            self._deltas[asset_id] = (DELTA_ADD, payload)
+        else:
+            self._deltas[asset_id] = (DELTA_UPDATE, payload)
+
+    def push_remove(self, asset_id):
+        """
+        Queues the removal of an asset
+        :param asset_id: str
+        """
+
+        previous = self._deltas.get(asset_id)
+        if previous is None:
+            self._push(asset_id, DELTA_REMOVE, None)
+        elif previous[0] == DELTA_ADD:
+            self._deltas.pop(asset_id)
+        else:
+            self._deltas[asset_id] = (DELTA_REMOVE, None)
+
+    def take(self):
+        """
+        Returns all queued changes and empties the queue
+        :return: list(tuple(str, str, object)), list of (operation, asset id, payload) in arrival order
+        """
+
+        deltas = [(operation, asset_id, payload) for asset_id, (operation, payload) in self._deltas.items()]
+        self.clear()
+
+        return deltas
+
+    def clear(self):
+        """
+        Discards all queued changes and resets overflow flag
+        """
+
+        self._deltas.clear()
+        self._overflowed = False
+
+    def _push(self, asset_id, operation, payload):
+        """
+        Internal function that queues a change of an asset that has no queued changes yet
+        :param asset_id: str
+        :param operation: str
+        :param payload: object
+        """
+
+        if self._overflowed:
+            return
+        if len(self._deltas) >= self._max_size:
+            self._deltas.clear()
+            self._overflowed = True
+            return
+
+        self._deltas[asset_id] = (operation, payload)
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains the event dispatcher that routes mouse events to Artella Outliner items
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+from Qt.QtCore import *
+
+HIT_ROW = 'row'
+HIT_EXPAND = 'expand'
+HIT_VIEW = 'view'
+
+
+class ItemEventDispatcher(QObject, object):
+    """
+    Event filter installed in the widget that contains the items of an outliner
+    Items do not handle mouse events themselves: events are propagated to the container, where the dispatcher
+    hit-tests them and notifies the outliner. This way the outliner only needs one connection per signal, no matter
+    the number of items it contains
+    """
+
+    itemPressed = Signal(object, object)
+    itemDoubleClicked = Signal(object)
+    itemContextRequested = Signal(object)
+    expandPressed = Signal(object)
+    viewPressed = Signal(object)
+
+    def __init__(self, item_at_fn, parent=None):
+        super(ItemEventDispatcher, self).__init__(parent)
+
+        self._item_at_fn = item_at_fn
+
+    def watch(self, container_widget):
+        """
+        Starts dispatching the events of the given items container widget
+        :param container_widget: QWidget
+        """
+
+        container_widget.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        """
+        Overrides base QObject eventFilter function
+        :param obj: QObject
+        :param event: QEvent
+        :return: bool
+        """
+
+        event_type = event.type()
+        if event_type not in (QEvent.MouseButtonPress, QEvent.MouseButtonDblClick, QEvent.ContextMenu):
+            return False
+
+        item = self._item_at_fn(obj, event.pos())
+        if item is None:
+            return False
+
+        if event_type == QEvent.ContextMenu:
+            self.itemContextRequested.emit(item)
+            return True
+
+        if event.button() not in (Qt.LeftButton, Qt.RightButton):
+            return False
+
+        hit = item.hit_test(item.mapFrom(obj, event.pos()))
+        if event_type == QEvent.MouseButtonDblClick:
+            if event.button() == Qt.LeftButton and hit == HIT_ROW:
+                self.itemDoubleClicked.emit(item)
+        elif hit == HIT_EXPAND:
+            if event.button() == Qt.LeftButton:
+                self.expandPressed.emit(item)
+        elif hit == HIT_VIEW:
+            if event.button() == Qt.LeftButton:
+                self.viewPressed.emit(item)
+        else:
+            self.itemPressed.emit(item, event)
+
+        return True
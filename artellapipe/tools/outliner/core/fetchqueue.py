@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains the queue used by Artella Outliner to fetch item children lazily
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+
+class FetchQueue(object):
+    """
+    Tracks the expanded items whose children were not fetched yet. Children of an item are only created when the
+    item is fetched explicitly or when it is visible in the viewport, so expanding all the items of a big outliner
+    does not create all the children rows at once
+    Items must implement can_fetch_more and fetch_more functions and is_expanded property
+    """
+
+    def __init__(self, fetch_fn=None):
+
+        self._fetch_fn = fetch_fn
+        self._pending = set()
+
+    def __len__(self):
+        return len(self._pending)
+
+    def __contains__(self, item):
+        return item in self._pending
+
+    def add(self, item):
+        """
+        Queues given item so its children are fetched once it is visible
+        :param item: OutlinerItem
+        :return: bool, True if the item was queued; False if its children were already fetched
+        """
+
+        if not item.can_fetch_more():
+            return False
+
+        self._pending.add(item)
+
+        return True
+
+    def discard(self, item):
+        """
+        Removes given item from the queue
+        :param item: OutlinerItem
+        """
+
+        self._pending.discard(item)
+
+    def clear(self):
+        """
+        Removes all the queued items
+        """
+
+        self._pending.clear()
+
+    def fetch(self, item):
+        """
+        Creates the children of the given item if they were not created yet
+        :param item: OutlinerItem
+        :return: bool, True if the children of the item were fetched; False otherwise
+        """
+
+        self._pending.discard(item)
+        if not item.can_fetch_more():
+            return False
+
+        item.fetch_more()
+        if self._fetch_fn:
+            self._fetch_fn(item)
+
+        return True
+
+    def fetch_visible(self, visible_items):
+        """
+        Fetches the children of the queued items that are visible. Queued items that were collapsed in the meantime
+        are discarded, so they are fetched the next time they are expanded
+        :param visible_items: list(OutlinerItem), items that are visible in the viewport, in display order
+        :return: list(OutlinerItem), items whose children were fetched
+        """
+
+        if not self._pending:
+            return list()
+
+        fetched_items = list()
+        for item in visible_items:
+            if item not in self._pending:
+                continue
+            self._pending.discard(item)
+            if item.is_expanded and self.fetch(item):
+                fetched_items.append(item)
+
+        return fetched_items
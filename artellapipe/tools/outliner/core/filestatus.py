@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains functions to check the status of asset files on disk
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import os
+import hashlib
+import threading
+from collections import namedtuple
+
+STATUS_MISSING = 'missing'
+STATUS_LOCAL = 'local'
+STATUS_PUBLISHED = 'published'
+STATUS_MODIFIED = 'modified'
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+FileStatus = namedtuple('FileStatus', ['path', 'mtime', 'size', 'checksum', 'status'])
+
+
+def get_file_checksum(file_path):
+    """
+    Returns MD5 checksum of the given file
+    :param file_path: str
+    :return: str or None
+    """
+
+    md5 = hashlib.md5()
+    try:
+        with open(file_path, 'rb') as fh:
+            for chunk in iter(lambda: fh.read(HASH_CHUNK_SIZE), b''):
+                md5.update(chunk)
+    except (IOError, OSError):
+        return None
+
+    return md5.hexdigest()
+
+
+class FileStatusCache(object):
+    """
+    Thread safe cache of file statuses. Statuses are keyed by file path and validated against modification times, so
+    a file is only hashed again when it (or its published version) changes on disk
+    """
+
+    def __init__(self):
+
+        self._cache = dict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._cache)
+
+    def clear(self):
+        """
+        Removes all cached statuses
+        """
+
+        with self._lock:
+            self._cache.clear()
+
+    def get_status(self, file_path, published_path=None):
+        """
+        Returns the status of the given file, computing it only if the file changed since the last check
+        This function accesses the disk, so it should not be called from the main thread
+        :param file_path: str
+        :param published_path: str or None, path of the published version of the file
+        :return: FileStatus
+        """
+
+        try:
+            file_stat = os.stat(file_path)
+        except (IOError, OSError):
+            return FileStatus(file_path, None, None, None, STATUS_MISSING)
+
+        published_mtime = None
+        if published_path:
+            try:
+                published_mtime = os.stat(published_path).st_mtime
+            except (IOError, OSError):
+                published_mtime = None
+
+        cache_key = (file_path, published_path)
+        with self._lock:
+            cached_published_mtime, cached_status = self._cache.get(cache_key, (None, None))
+        if cached_status and cached_status.mtime == file_stat.st_mtime and \
+                cached_status.size == file_stat.st_size and cached_published_mtime == published_mtime:
+            return cached_status
+
+        checksum = None
+        status = STATUS_LOCAL
+        if published_mtime is not None:
+            checksum = get_file_checksum(file_path)
+            published_checksum = get_file_checksum(published_path)
+            status = STATUS_PUBLISHED if checksum == published_checksum else STATUS_MODIFIED
+
+        file_status = FileStatus(file_path, file_stat.st_mtime, file_stat.st_size, checksum, status)
+        with self._lock:
+            self._cache[cache_key] = (published_mtime, file_status)
+
+        return file_status
+
+
+_CACHE = FileStatusCache()
+
+
+def get_cache():
+    """
+    Returns the file status cache of the current session
+    :return: FileStatusCache
+    """
+
+    return _CACHE
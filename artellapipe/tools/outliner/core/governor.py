@@ -0,0 +1,253 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains the governor that pauses Artella Outliner background work while the DCC is busy
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import time
+import logging
+from collections import OrderedDict
+
+LOGGER = logging.getLogger()
+
+DEFAULT_POLL_INTERVAL = 0.05
+DEFAULT_COOLDOWN = 0.3
+DEFAULT_BUSY_INTERVAL = 250
+
+
+# Probes used by the governor and the names of the tpDcc functions that implement them
+DCC_PROBES = OrderedDict([
+    ('playback', 'is_playing_back'),
+    ('scrubbing', 'is_timeline_scrubbing'),
+    ('viewport', 'is_viewport_manipulated')
+])
+
+
+def _is_maya_playing():
+    """
+    Internal function that returns whether or not Maya is playing back the timeline
+    :return: bool
+    """
+
+    import maya.cmds as cmds
+
+    return bool(cmds.play(query=True, state=True))
+
+
+def _is_maya_scrubbing():
+    """
+    Internal function that returns whether or not the user is scrubbing Maya time slider
+    :return: bool
+    """
+
+    import maya.cmds as cmds
+    import maya.mel as mel
+
+    time_slider = mel.eval('$outliner_tmp_var = $gPlayBackSlider')
+
+    return bool(cmds.timeControl(time_slider, query=True, pressed=True))
+
+
+def _is_maya_viewport_manipulated():
+    """
+    Internal function that returns whether or not the user is manipulating a Maya viewport
+    :return: bool
+    """
+
+    from Qt.QtCore import Qt
+    from Qt.QtWidgets import QApplication
+    import maya.cmds as cmds
+
+    if QApplication.mouseButtons() == Qt.NoButton:
+        return False
+    panel = cmds.getPanel(underPointer=True)
+
+    return bool(panel) and cmds.getPanel(typeOf=panel) == 'modelPanel'
+
+
+# Probes used if the tpDcc backend of Maya does not implement them
+MAYA_PROBES = OrderedDict([
+    ('playback', _is_maya_playing),
+    ('scrubbing', _is_maya_scrubbing),
+    ('viewport', _is_maya_viewport_manipulated)
+])
+
+
+def get_dcc_probes(dcc=None, fallback_probes=None):
+    """
+    Returns the functions used to check if the current DCC is busy
+    tpDcc functions are used when the DCC implements them. Otherwise, DCC specific fallback probes are used
+    :param dcc: object or None, DCC interface that implements the probe functions. If not given, tpDcc one is used
+    :param fallback_probes: dict(str, fn) or None, probes used if the DCC does not implement them. If dcc is not
+        given, fallback probes of the current DCC are used
+    :return: OrderedDict(str, fn)
+    """
+
+    if dcc is None:
+        import tpDcc as tp
+        dcc = tp.Dcc
+        if fallback_probes is None and tp.is_maya():
+            fallback_probes = MAYA_PROBES
+    fallback_probes = fallback_probes or dict()
+
+    probes = OrderedDict()
+    for name, fn_name in DCC_PROBES.items():
+        probe_fn = getattr(dcc, fn_name, None) or fallback_probes.get(name)
+        if probe_fn is None:
+            LOGGER.debug('Current DCC does not implement "{}". Outliner work governor skips "{}" probe'.format(
+                fn_name, name))
+            continue
+        probes[name] = probe_fn
+
+    if not probes:
+        LOGGER.warning(
+            'No busy probes available for current DCC. Outliner background work will not pause during playback or '
+            'viewport interaction')
+
+    return probes
+
+
+class WorkGovernor(object):
+    """
+    Decides when outliner background and idle work can run. DCC is polled through a set of probes (playback,
+    scrubbing, viewport manipulation ...) and work is paused while any of them is active, and for a short cooldown
+    afterwards, so the tool never competes with the viewport for the main thread
+    """
+
+    def __init__(self, probes=None, poll_interval=DEFAULT_POLL_INTERVAL, cooldown=DEFAULT_COOLDOWN,
+                 busy_interval=DEFAULT_BUSY_INTERVAL, clock=None):
+
+        self._probes = probes
+        self._poll_interval = poll_interval
+        self._cooldown = cooldown
+        self._busy_interval = busy_interval
+        self._clock = clock or time.time
+        self._last_poll = None
+        self._busy_reason = None
+        self._last_busy = None
+
+    @property
+    def busy_interval(self):
+        """
+        Returns the interval (in milliseconds) used by throttled timers while the DCC is busy
+        :return: int
+        """
+
+        return self._busy_interval
+
+    @property
+    def busy_reason(self):
+        """
+        Returns the name of the probe that detected the DCC as busy in the last poll
+        :return: str or None
+        """
+
+        return self._busy_reason
+
+    def add_probe(self, name, probe_fn):
+        """
+        Registers a new function used to check if the DCC is busy
+        :param name: str
+        :param probe_fn: fn, function that returns True while the DCC is busy
+        """
+
+        self._get_probes()[name] = probe_fn
+        self._last_poll = None
+
+    def remove_probe(self, name):
+        """
+        Unregisters the probe with given name
+        :param name: str
+        """
+
+        self._get_probes().pop(name, None)
+        self._last_poll = None
+
+    def is_busy(self):
+        """
+        Returns whether or not the DCC is busy. Probes are polled at most once per poll interval
+        :return: bool
+        """
+
+        now = self._clock()
+        if self._last_poll is None or now - self._last_poll >= self._poll_interval:
+            self._last_poll = now
+            self._busy_reason = None
+            for name, probe_fn in self._get_probes().items():
+                try:
+                    is_busy = probe_fn()
+                except Exception as exc:
+                    LOGGER.debug('Impossible to check DCC state with probe "{}" | {}'.format(name, exc))
+                    continue
+                if is_busy:
+                    self._busy_reason = name
+                    self._last_busy = now
+                    break
+
+        return self._busy_reason is not None
+
+    def can_run(self):
+        """
+        Returns whether or not background work can run. Work is paused while the DCC is busy and during the cooldown
+        that follows, so short pauses while scrubbing do not trigger bursts of work
+        :return: bool
+        """
+
+        if self.is_busy():
+            return False
+
+        return self._last_busy is None or self._clock() - self._last_busy >= self._cooldown
+
+    def gate_timer(self, timer, idle_interval=0):
+        """
+        Returns whether or not the work of the given timer can run now. While the DCC is busy, timer is throttled to
+        the busy interval, and its idle interval is restored once the DCC is idle again
+        :param timer: QTimer
+        :param idle_interval: int, interval (in milliseconds) of the timer while the DCC is idle
+        :return: bool
+        """
+
+        if self.can_run():
+            if timer.interval() != idle_interval:
+                timer.setInterval(idle_interval)
+            return True
+
+        if timer.interval() != self._busy_interval:
+            timer.setInterval(self._busy_interval)
+
+        return False
+
+    def _get_probes(self):
+        """
+        Internal function that returns the registered probes, retrieving DCC ones the first time they are requested
+        :return: OrderedDict(str, fn)
+        """
+
+        if self._probes is None:
+            try:
+                self._probes = get_dcc_probes()
+            except Exception as exc:
+                LOGGER.warning('Impossible to retrieve DCC probes for outliner work governor | {}'.format(exc))
+                self._probes = OrderedDict()
+
+        return self._probes
+
+
+_GOVERNOR = WorkGovernor()
+
+
+def get_governor():
+    """
+    Returns the work governor of the current session
+    :return: WorkGovernor
+    """
+
+    return _GOVERNOR
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains the cache of icons used by Artella Outliner
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+
+def _load_resource_icon(icon_name):
+    """
+    Internal function that loads the icon with given name from tpDcc resources
+    :param icon_name: str
+    :return: QIcon
+    """
+
+    import tpDcc
+
+    return tpDcc.ResourcesMgr().icon(icon_name)
+
+
+class IconCache(object):
+    """
+    Caches the icons used by outliner widgets. Icons are not loaded when modules are imported but the first time they
+    are requested, and they are shared by all the widgets that display them
+    """
+
+    def __init__(self, loader=None):
+
+        self._loader = loader or _load_resource_icon
+        self._icons = dict()
+
+    def __len__(self):
+        return len(self._icons)
+
+    def __contains__(self, icon_name):
+        return icon_name in self._icons
+
+    def get(self, icon_name):
+        """
+        Returns icon with given name, loading it if necessary
+        :param icon_name: str
+        :return: QIcon
+        """
+
+        icon = self._icons.get(icon_name)
+        if icon is None:
+            icon = self._icons[icon_name] = self._loader(icon_name)
+
+        return icon
+
+    def clear(self):
+        """
+        Removes all cached icons. They will be loaded again the next time they are requested
+        """
+
+        self._icons.clear()
+
+
+_CACHE = IconCache()
+
+
+def get_cache():
+    """
+    Returns the icon cache of the current session
+    :return: IconCache
+    """
+
+    return _CACHE
+
+
+def get_icon(icon_name):
+    """
+    Returns icon with given name from the icon cache of the current session
+    :param icon_name: str
+    :return: QIcon
+    """
+
+    return _CACHE.get(icon_name)
@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains the pool used to recycle Artella Outliner item widgets
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+DEFAULT_POOL_SIZE = 1000
+
+
+class ItemPool(object):
+    """
+    Bounded pool of released item widgets. Pooled widgets are rebound to a new asset instead of being destroyed and
+    created again. Widgets released while the pool is full are not pooled and must be destroyed by the caller
+    """
+
+    def __init__(self, max_size=DEFAULT_POOL_SIZE):
+
+        self._max_size = max_size
+        self._items = dict()
+        self._size = 0
+        self._requests = 0
+        self._reuses = 0
+        self._releases = 0
+        self._discards = 0
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def max_size(self):
+        """
+        Returns the maximum number of widgets the pool can store
+        :return: int
+        """
+
+        return self._max_size
+
+    @property
+    def reuse_rate(self):
+        """
+        Returns the ratio of acquire requests that were served with a pooled widget
+        :return: float
+        """
+
+        return float(self._reuses) / self._requests if self._requests else 0.0
+
+    def acquire(self, item_class):
+        """
+        Returns a pooled widget of the given class
+        :param item_class: type
+        :return: QWidget or None, None if there is no pooled widget of the given class
+        """
+
+        self._requests += 1
+        class_items = self._items.get(item_class)
+        if not class_items:
+            return None
+
+        self._reuses += 1
+        self._size -= 1
+
+        return class_items.pop()
+
+    def release(self, item):
+        """
+        Stores given widget in the pool so it can be reused
+        :param item: QWidget
+        :return: bool, True if the widget was pooled; False if the pool is full
+        """
+
+        if self._size >= self._max_size:
+            self._discards += 1
+            return False
+
+        self._items.setdefault(type(item), list()).append(item)
+        self._size += 1
+        self._releases += 1
+
+        return True
+
+    def clear(self):
+        """
+        Removes all pooled widgets from the pool
+        :return: list(QWidget), removed widgets
+        """
+
+        pooled_items = [item for class_items in self._items.values() for item in class_items]
+        self._items.clear()
+        self._size = 0
+
+        return pooled_items
+
+    def stats(self):
+        """
+        Returns usage statistics of the pool
+        :return: dict
+        """
+
+        return {
+            'size': self._size,
+            'max_size': self._max_size,
+            'requests': self._requests,
+            'reuses': self._reuses,
+            'releases': self._releases,
+            'discards': self._discards,
+            'reuse_rate': self.reuse_rate
+        }
+
+    def report(self):
+        """
+        Returns a human readable report of the pool usage statistics
+        :return: str
+        """
+
+        return 'Item pool: {size}/{max_size} pooled, {reuses}/{requests} reused ({reuse_rate:.0%}), ' \
+               '{discards} discarded'.format(**self.stats())
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains the name index used by Artella Outliner global search
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import re
+from collections import namedtuple
+
+SCORE_EXACT = 0
+SCORE_PREFIX = 1
+SCORE_WORD_PREFIX = 2
+SCORE_SUBSTRING = 3
+
+WORD_SEPARATORS_REGEX = re.compile(r'[_:|\s\-\.]+')
+
+SearchResult = namedtuple('SearchResult', ['name', 'category', 'asset_id', 'score'])
+
+
+def get_match_score(name, text):
+    """
+    Returns how well the given text matches the given name. Lower scores are better matches
+    :param name: str, lower case name
+    :param text: str, lower case search text
+    :return: int or None, None if the text does not match the name
+    """
+
+    index = name.find(text)
+    if index == -1:
+        return None
+    if index == 0:
+        return SCORE_EXACT if len(name) == len(text) else SCORE_PREFIX
+    for word in WORD_SEPARATORS_REGEX.split(name):
+        if word.startswith(text):
+            return SCORE_WORD_PREFIX
+
+    return SCORE_SUBSTRING
+
+
+class NameIndex(object):
+    """
+    Index of the names of the assets of all outliner categories
+    """
+
+    def __init__(self):
+
+        self._entries = dict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        """
+        Removes all the entries of the index
+        """
+
+        self._entries.clear()
+
+    def add(self, name, category, asset_id):
+        """
+        Adds a new asset name into the index
+        :param name: str
+        :param category: str, category the asset is listed in
+        :param asset_id: str
+        """
+
+        self._entries[(category, asset_id)] = (name.lower(), name)
+
+    def remove(self, category, asset_id):
+        """
+        Removes the asset with given id listed in the given category from the index
+        :param category: str
+        :param asset_id: str
+        :return: bool
+        """
+
+        return self._entries.pop((category, asset_id), None) is not None
+
+    def remove_category(self, category):
+        """
+        Removes all the assets listed in the given category from the index
+        :param category: str
+        """
+
+        for key in [key for key in self._entries if key[0] == category]:
+            self._entries.pop(key)
+
+    def search(self, text, limit=None):
+        """
+        Returns the assets whose name matches the given text sorted by relevance
+        :param text: str
+        :param limit: int or None, maximum number of results to return
+        :return: list(SearchResult)
+        """
+
+        text = (text or '').strip().lower()
+        if not text:
+            return list()
+
+        results = list()
+        for (category, asset_id), (lower_name, name) in self._entries.items():
+            score = get_match_score(lower_name, text)
+            if score is not None:
+                results.append(SearchResult(name, category, asset_id, score))
+        results.sort(key=lambda result: (result.score, len(result.name), result.name, result.category))
+
+        return results[:limit] if limit else results
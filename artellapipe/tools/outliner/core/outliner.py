@@ -12,8 +12,12 @@ __license__ = "MIT"
 __maintainer__ = "Tomas Poveda"
 __email__ = "tpovedatd@gmail.com"
 
+import logging
+
 import artellapipe
 
+LOGGER = logging.getLogger()
+
 # Defines ID of the tool
 TOOL_ID = 'artellapipe-tools-outliner'
 
@@ -65,3 +69,38 @@ class OutlinerToolset(artellapipe.Toolset, object):
         outliner_widget = outliner.ArtellaOutlinerWidget(
             project=self._project, config=self._config, settings=self._settings, parent=self)
         return [outliner_widget]
+
+
+def _install_prewarm():
+    """
+    Internal function that schedules outliner prewarm installation
+    Tool module is imported when the DCC starts to build tool menus and shelves, so prewarm starts while the DCC is
+    idle after startup instead of the first time the tool is opened. Tool configuration is only read once the DCC
+    event loop is running, so importing this module does not load any configuration
+    """
+
+    try:
+        from Qt.QtCore import QTimer
+        from Qt.QtWidgets import QApplication
+    except ImportError:
+        return
+    if QApplication.instance() is None:
+        return
+
+    QTimer.singleShot(0, _on_install_prewarm)
+
+
+def _on_install_prewarm():
+    """
+    Internal callback function that installs outliner prewarm once the DCC event loop is idle
+    """
+
+    from artellapipe.tools.outliner.core import prewarm
+
+    try:
+        prewarm.install()
+    except Exception as exc:
+        LOGGER.warning('Impossible to install Outliner prewarm: {}'.format(exc))
+
+
+_install_prewarm()
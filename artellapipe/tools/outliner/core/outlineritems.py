@@ -12,6 +12,8 @@ __license__ = "MIT"
 __maintainer__ = "Tomas Poveda"
 __email__ = "tpovedatd@gmail.com"
 
+import logging
+
 from Qt.QtCore import *
 from Qt.QtWidgets import *
 from Qt.QtGui import *
@@ -19,6 +21,10 @@ from Qt.QtGui import *
 import tpDcc as tp
 from tpDcc.libs.qt.core import base
 
+from artellapipe.tools.outliner.core import records, dispatcher, icons, snapshot
+
+LOGGER = logging.getLogger()
+
 
 class OutlinerTreeItemWidget(base.BaseWidget, object):
 
@@ -27,28 +33,25 @@ class OutlinerTreeItemWidget(base.BaseWidget, object):
     contextRequested = Signal(QObject)
     removed = Signal(QObject)
 
-    def __init__(self, name, parent=None):
+    def __init__(self, name, display_name=None, parent=None):
 
         self._parent = parent
         self._long_name = name
-        ns = tp.Dcc.node_namespace(name, check_node=False)
-        if ns:
-            if ns.startswith(':'):
-                ns = ns[1:]
-        else:
-            ns = name.split('|')[-1]
-        self._name = ns
+        if display_name is None:
+            display_name = records.get_display_name(name, tp.Dcc.node_namespace(name, check_node=False))
+        self._name = display_name
         self._block_callbacks = False
         self._is_selected = False
         self._parent_elem = None
         self._child_elem = dict()
+        self._child_widget = None
+        self.child_layout = None
 
         super(OutlinerTreeItemWidget, self).__init__(parent=parent)
 
     def ui(self):
         super(OutlinerTreeItemWidget, self).ui()
 
-        self.setMouseTracking(True)
         self.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
 
         self._item_widget = QFrame()
@@ -58,13 +61,6 @@ class OutlinerTreeItemWidget(base.BaseWidget, object):
         self._item_widget.setLayout(self._item_layout)
         self.main_layout.addWidget(self._item_widget)
 
-        self._child_widget = QWidget()
-        self.child_layout = QVBoxLayout()
-        self.child_layout.setContentsMargins(0, 0, 0, 0)
-        self.child_layout.setSpacing(0)
-        self._child_widget.setLayout(self.child_layout)
-        self.main_layout.addWidget(self._child_widget)
-
     @property
     def name(self):
         """
@@ -101,7 +97,7 @@ class OutlinerTreeItemWidget(base.BaseWidget, object):
 
         widget.parent_elem = self
         self._child_elem[name] = widget
-        self.child_layout.addWidget(widget)
+        self._get_child_widget().layout().addWidget(widget)
 
     def remove_child(self, name):
         """
@@ -109,24 +105,69 @@ class OutlinerTreeItemWidget(base.BaseWidget, object):
         :param name: str
         """
 
-        if name in self._child_elem:
-            widget = self._child_elem[name]
-            widget.setParent(None)
+        widget = self.take_child(name)
+        if widget is not None:
             widget.deleteLater()
 
+    def take_child(self, name):
+        """
+        Removes child with given name from the item without destroying it
+        :param name: str
+        :return: QWidget or None
+        """
+
+        widget = self._child_elem.pop(name, None)
+        if widget is not None:
+            self.child_layout.removeWidget(widget)
+            widget.setParent(None)
+
+        return widget
+
+    def take_children(self):
+        """
+        Removes all the children of the item without destroying them
+        :return: list(QWidget)
+        """
+
+        return [self.take_child(name) for name in list(self._child_elem.keys())]
+
+    def _get_child_widget(self):
+        """
+        Internal function that returns the widget that contains the children of the item
+        Children widget is only created the first time it is requested
+        :return: QWidget
+        """
+
+        if self._child_widget is None:
+            self._child_widget = QWidget()
+            self.child_layout = QVBoxLayout()
+            self.child_layout.setContentsMargins(0, 0, 0, 0)
+            self.child_layout.setSpacing(0)
+            self._child_widget.setLayout(self.child_layout)
+            self.main_layout.addWidget(self._child_widget)
+
+        return self._child_widget
+
 
 class OutlinerItem(OutlinerTreeItemWidget, object):
 
     ICON_NAME = 'teapot'
     DISPLAY_BUTTONS = None
 
-    def __init__(self, asset_node, parent=None):
+    def __init__(self, asset_node, record=None, display_name=None, parent=None):
 
         self._asset_node = asset_node
+        self._snapshot = snapshot.get_snapshot(asset_node, collect_overrides=False)
+        self._record = record
         self._expand_enable = True
         self._display_buttons = None
+        self._children_fetched = False
+
+        if display_name is None and record is not None:
+            display_name = record.name
 
-        super(OutlinerItem, self).__init__(name=asset_node.get_short_name(), parent=parent)
+        super(OutlinerItem, self).__init__(
+            name=self._snapshot.short_name, display_name=display_name, parent=parent)
 
     @property
     def asset_node(self):
@@ -138,59 +179,58 @@ class OutlinerItem(OutlinerTreeItemWidget, object):
         return self._asset_node
 
     @property
-    def expand_enable(self):
+    def snapshot(self):
         """
-        Returns whether children are expanded or not
-        :return: bool
+        Returns the snapshot of the wrapped asset node properties
+        :return: AssetSnapshot
         """
 
-        return self._expand_enable
+        return self._snapshot
 
     @property
-    def display_buttons(self):
+    def record(self):
         """
-        Returns display buttons widget
-        :return: AssetDisplayButtons
+        Returns the data record of the wrapped asset node
+        :return: AssetRecord or None
         """
 
-        return self._display_buttons
+        return self._record
 
-    def mousePressEvent(self, event):
+    @property
+    def expand_enable(self):
         """
-        Overrides base OutlinerTreeItemWidget mousePressEvent function
-        :param event: QMouseEvent
+        Returns whether children are expanded or not
+        :return: bool
         """
 
-        if event.button() == Qt.LeftButton or event.button() == Qt.RightButton:
-            if self.is_selected:
-                self.deselect()
-            else:
-                self.select()
-            self.clicked.emit(self, event)
+        return self._expand_enable
 
-    def mouseDoubleClickEvent(self, event):
+    @property
+    def children_fetched(self):
         """
-        Overrides base OutlinerTreeItemWidget mouseDoubleClickEvent function
-        :param event: QMouseEvent
+        Returns whether or not children of the item were already requested
+        :return: bool
         """
 
-        if event.button() == Qt.LeftButton:
-            if self._display_buttons:
-                self._expand_btn.setChecked(not self._expand_btn.isChecked())
-                self._toggle_children()
+        return self._children_fetched
 
-    def contextMenuEvent(self, event):
+    @property
+    def is_expanded(self):
         """
-        Overrides base OutlinerTreeItemWidget contextMenuEvent function
-        :param event: QMouseEvent
+        Returns whether or not the item is expanded
+        :return: bool
         """
 
-        if not self.is_selected:
-            self.select()
+        return self._expand_btn.isChecked()
 
-        menu = QMenu(self)
-        menu.setStyleSheet('background-color: rgb(68,68,68);')
-        self.contextRequested.emit(self)
+    @property
+    def display_buttons(self):
+        """
+        Returns display buttons widget
+        :return: AssetDisplayButtons
+        """
+
+        return self._display_buttons
 
     def ui(self):
         super(OutlinerItem, self).ui()
@@ -212,6 +252,7 @@ class OutlinerItem(OutlinerTreeItemWidget, object):
         self._expand_btn.setChecked(True)
         self._expand_btn.setFixedWidth(25)
         self._expand_btn.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Minimum)
+        self._expand_btn.setAttribute(Qt.WA_TransparentForMouseEvents)
         self._item_layout.addWidget(self._expand_btn, 0, 0, 1, 1)
 
         if self.DISPLAY_BUTTONS:
@@ -220,13 +261,9 @@ class OutlinerItem(OutlinerTreeItemWidget, object):
         else:
             self._expand_btn.setVisible(False)
 
-        asset_icon = self._asset_node.get_icon()
-        if not asset_icon or asset_icon.isNull():
-            asset_icon = tp.ResourcesMgr().icon(self.ICON_NAME)
-        pixmap = asset_icon.pixmap(asset_icon.availableSizes()[-1]).scaled(20, 20, Qt.KeepAspectRatio)
         self._icon_lbl = QLabel()
         self._icon_lbl.setMaximumWidth(18)
-        self._icon_lbl.setPixmap(pixmap)
+        self._icon_lbl.setPixmap(self._get_icon_pixmap())
         self._asset_lbl = QLabel(self._name)
 
         self._item_layout.setColumnStretch(1, 5)
@@ -241,10 +278,55 @@ class OutlinerItem(OutlinerTreeItemWidget, object):
             self._item_layout.addWidget(self._asset_lbl, 0, 2, 1, 1)
             self._expand_enable = False
 
-        self.collapse()
+        self._expand_btn.setChecked(False)
 
-    def setup_signals(self):
-        self._expand_btn.clicked.connect(self._on_toggle_children)
+    def rebind(self, asset_node, record=None, display_name=None):
+        """
+        Binds the item to a new asset node, so the widget can be reused instead of creating a new one
+        Children of the item are destroyed and the item is collapsed and deselected
+        :param asset_node: ArtellaAssetNode
+        :param record: AssetRecord or None
+        :param display_name: str or None
+        """
+
+        asset_snapshot = snapshot.get_snapshot(asset_node, collect_overrides=False)
+        name = asset_snapshot.short_name
+        if display_name is None:
+            if record is not None:
+                display_name = record.name
+            else:
+                display_name = records.get_display_name(name, tp.Dcc.node_namespace(name, check_node=False))
+
+        for child in self.take_children():
+            child.deleteLater()
+
+        self._asset_node = asset_node
+        self._snapshot = asset_snapshot
+        self._record = record
+        self._long_name = name
+        self._name = display_name
+        self._children_fetched = False
+        self._is_selected = False
+        self._item_widget.setStyleSheet('QFrame { background-color: rgb(55,55,55);}')
+        self._expand_btn.setChecked(False)
+        if self._child_widget is not None:
+            self._child_widget.setVisible(False)
+        if self._display_buttons:
+            self._display_buttons.show()
+        self._icon_lbl.setPixmap(self._get_icon_pixmap())
+        self._asset_lbl.setText(display_name)
+
+    def hit_test(self, pos):
+        """
+        Returns the part of the item located at the given position
+        :param pos: QPoint, position in item coordinates
+        :return: str, dispatcher.HIT_EXPAND or dispatcher.HIT_ROW
+        """
+
+        if self._expand_btn.isVisible() and self._expand_btn.rect().contains(self._expand_btn.mapFrom(self, pos)):
+            return dispatcher.HIT_EXPAND
+
+        return dispatcher.HIT_ROW
 
     def get_file_widget(self, category):
         """
@@ -255,9 +337,30 @@ class OutlinerItem(OutlinerTreeItemWidget, object):
 
         return self._child_elem.get(category)
 
+    def can_fetch_more(self):
+        """
+        Returns whether or not children of the item still need to be fetched
+        :return: bool
+        """
+
+        return not self._children_fetched
+
+    def fetch_more(self):
+        """
+        Creates the children container of the item and marks its children as fetched
+        Children widgets are created by the outliner that owns the item
+        """
+
+        if not self.can_fetch_more():
+            return
+
+        self._children_fetched = True
+        self._get_child_widget().setVisible(self.is_expanded)
+
     def expand(self):
         """
         Expands all the children items of the current item
+        Children that were not fetched yet are not created. Use OutlinerTree expand_item function to fetch them
         """
 
         self._expand_btn.setChecked(True)
@@ -266,8 +369,8 @@ class OutlinerItem(OutlinerTreeItemWidget, object):
     def collapse(self):
         """
         Collapses all the children items of the current item
-        :return:
         """
+
         self._expand_btn.setChecked(False)
         self._toggle_children()
 
@@ -277,6 +380,8 @@ class OutlinerItem(OutlinerTreeItemWidget, object):
         """
 
         self._is_selected = True
+        if self._record is not None:
+            self._record.set_flag(records.FLAG_SELECTED, True)
         self._item_widget.setStyleSheet('QFrame { background-color: rgb(21,60,97);}')
 
     def deselect(self):
@@ -285,6 +390,8 @@ class OutlinerItem(OutlinerTreeItemWidget, object):
         """
 
         self._is_selected = False
+        if self._record is not None:
+            self._record.set_flag(records.FLAG_SELECTED, False)
         self._item_widget.setStyleSheet('QFrame { background-color: rgb(55,55,55);}')
 
     def set_select(self, select=False):
@@ -300,6 +407,23 @@ class OutlinerItem(OutlinerTreeItemWidget, object):
 
         return self.is_selected
 
+    def _get_icon_pixmap(self):
+        """
+        Internal function that returns the pixmap displayed by the item icon
+        Asset icon is retrieved when the item is displayed, so it is not loaded for assets without items
+        :return: QPixmap
+        """
+
+        try:
+            asset_icon = self._asset_node.get_icon()
+        except Exception as exc:
+            LOGGER.debug('Impossible to retrieve icon of asset node {} | {}'.format(self._asset_node, exc))
+            asset_icon = None
+        if not asset_icon or asset_icon.isNull():
+            asset_icon = icons.get_icon(self.ICON_NAME)
+
+        return asset_icon.pixmap(asset_icon.availableSizes()[-1]).scaled(20, 20, Qt.KeepAspectRatio)
+
     def _create_menu(self, menu):
         """
         Internal function that creates contextual menu of the item
@@ -315,20 +439,53 @@ class OutlinerItem(OutlinerTreeItemWidget, object):
         Toggles all children widgets
         """
 
-        state = self._expand_btn.isChecked()
-        self._child_widget.setVisible(state)
+        if self._child_widget is not None:
+            self._child_widget.setVisible(self._expand_btn.isChecked() and self._children_fetched)
+
+
+class OutlinerFileItem(OutlinerTreeItemWidget, object):
+
+    STATUS_COLORS = {
+        'missing': 'rgb(200,80,80)',
+        'local': 'rgb(200,200,200)',
+        'published': 'rgb(80,200,80)',
+        'modified': 'rgb(220,160,60)'
+    }
 
-    def _on_toggle_children(self):
+    def __init__(self, category, file_path=None, parent=None):
+
+        self._category = category
+        self._file_path = file_path
+        self._status = None
+
+        super(OutlinerFileItem, self).__init__(name=category, display_name=category, parent=parent)
+
+    @property
+    def category(self):
         """
-        Internal callback function that is called when expand button is clicked
+        Returns the file category of the item
+        :return: str
         """
 
-        self._toggle_children()
+        return self._category
+
+    @property
+    def file_path(self):
+        """
+        Returns path of the file wrapped by the item
+        :return: str or None
+        """
 
+        return self._file_path
 
-class OutlinerFileItem(OutlinerTreeItemWidget, object):
-    def __init__(self, category, parent=None):
-        super(OutlinerFileItem, self).__init__(name=category, parent=parent)
+    @property
+    def status(self):
+        """
+        Returns the last known status of the file wrapped by the item
+        :return: str or None
+        """
+
+        return self._status
 
     @staticmethod
     def get_category_pixmap():
@@ -337,8 +494,6 @@ class OutlinerFileItem(OutlinerTreeItemWidget, object):
     def ui(self):
         super(OutlinerFileItem, self).ui()
 
-        self.setMouseTracking(True)
-
         self._item_widget.setFrameStyle(QFrame.Raised | QFrame.StyledPanel)
         self.setStyleSheet('background-color: rgb(68,68,68);')
 
@@ -350,3 +505,17 @@ class OutlinerFileItem(OutlinerTreeItemWidget, object):
 
         self.target_lbl = QLabel(self._name.title())
         self._item_layout.addWidget(self.target_lbl, 0, 2, 1, 1)
+
+        self._status_lbl = QLabel('checking ...' if self._file_path else '')
+        self._status_lbl.setToolTip(self._file_path or '')
+        self._item_layout.addWidget(self._status_lbl, 0, 3, 1, 1)
+
+    def set_status(self, status):
+        """
+        Updates the status of the file wrapped by the item
+        :param status: str
+        """
+
+        self._status = status
+        self._status_lbl.setText(status)
+        self._status_lbl.setStyleSheet('color: {};'.format(self.STATUS_COLORS.get(status, 'rgb(200,200,200)')))
@@ -12,7 +12,7 @@ __license__ = "MIT"
 __maintainer__ = "Tomas Poveda"
 __email__ = "tpovedatd@gmail.com"
 
-from collections import defaultdict
+import logging
 
 from Qt.QtCore import *
 from Qt.QtWidgets import *
@@ -21,6 +21,12 @@ import tpDcc as tp
 from tpDcc.libs.qt.core import base
 from tpDcc.libs.qt.widgets import search
 
+from artellapipe.tools.outliner.core import records, statestore, query, sorting, teardown, dispatcher, deltas
+from artellapipe.tools.outliner.core import governor, fetchqueue
+from artellapipe.tools.outliner.core import outlineritems
+
+LOGGER = logging.getLogger()
+
 
 class OutlinerTree(base.BaseWidget, object):
     """
@@ -29,12 +35,30 @@ class OutlinerTree(base.BaseWidget, object):
 
     CATEGORIES = None
     NAME = None
+    MAX_QUEUED_DELTAS = deltas.DEFAULT_MAX_SIZE
+
+    refreshed = Signal()
+    staleItemsFound = Signal(list)
 
     def __init__(self, project, parent=None):
 
         self._project = project
-        self._widget_tree = defaultdict(list)
+        self._records = records.AssetRecordTable()
+        self._state_store = statestore.AssetStateStore(self._records)
+        self._items = dict()
         self._widgets = list()
+        self._pending_fetch = fetchqueue.FetchQueue(self._on_fetch_item_children)
+        self._group_instances = False
+        self._filter_ids = None
+        self._sort_key = sorting.DEFAULT_SORT_KEY
+        self._sort_reverse = False
+        self._sorted_widgets = sorting.SortedIndex(self._get_widget_sort_key)
+        self._teardown_queue = teardown.TeardownQueue()
+        self._suspended = False
+        self._refresh_pending = False
+        self._delta_queue = deltas.DeltaQueue(max_size=self.MAX_QUEUED_DELTAS)
+        self._validate_pending = False
+        self._validated_ids = set()
 
         super(OutlinerTree, self).__init__(parent=parent)
 
@@ -47,11 +71,21 @@ class OutlinerTree(base.BaseWidget, object):
         if event.button() == Qt.LeftButton:
             tp.Dcc.clear_selection()
 
+    def hideEvent(self, event):
+        """
+        Overrides BaseWidget hideEvent function
+        Suspended outliners stop painting while they are hidden
+        :param event: QHideEvent
+        """
+
+        if self._suspended:
+            self._scroll_area.setUpdatesEnabled(False)
+
+        super(OutlinerTree, self).hideEvent(event)
+
     def ui(self):
         super(OutlinerTree, self).ui()
 
-        self.setMouseTracking(True)
-
         top_layout = QGridLayout()
         top_layout.setAlignment(Qt.AlignLeft)
         top_layout.setContentsMargins(0, 0, 0, 0)
@@ -67,33 +101,221 @@ class OutlinerTree(base.BaseWidget, object):
         self._collapse_all_btn = QPushButton()
         self._collapse_all_btn.setIcon(tp.ResourcesMgr().icon('collapse'))
         self._collapse_all_btn.setSizePolicy(QSizePolicy.Maximum, QSizePolicy.Preferred)
+        self._group_btn = QPushButton()
+        self._group_btn.setIcon(tp.ResourcesMgr().icon('group'))
+        self._group_btn.setToolTip('Group instances of the same asset')
+        self._group_btn.setCheckable(True)
+        self._group_btn.setSizePolicy(QSizePolicy.Maximum, QSizePolicy.Preferred)
 
         top_layout.addWidget(self._refresh_btn, 0, 0, 1, 1)
         top_layout.addWidget(self._expand_all_btn, 0, 1, 1, 1)
         top_layout.addWidget(self._collapse_all_btn, 0, 2, 1, 1)
+        top_layout.addWidget(self._group_btn, 0, 3, 1, 1)
+
+        self._sort_combo = QComboBox()
+        self._sort_combo.setToolTip('Sort assets by')
+        self._sort_combo.addItems([sort_name.title() for sort_name in sorting.get_sort_key_names()])
+        top_layout.addWidget(self._sort_combo, 0, 4, 1, 1)
 
         self._search_widget = search.SearchFindWidget()
+        self._search_widget.setToolTip(
+            'Filter assets by name or with filters: type:prop tag:hero hidden:true lod:proxy has:override ns:env_*')
         self.main_layout.addWidget(self._search_widget)
 
-        scroll_widget = QWidget()
         self._scroll_area = QScrollArea()
         self._scroll_area.setWidgetResizable(True)
         self._scroll_area.setStyleSheet('QScrollArea { background-color: rgb(57,57,57);}')
         self._scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        self._scroll_area.setWidget(scroll_widget)
-
-        self._outliner_layout = QVBoxLayout()
-        self._outliner_layout.setContentsMargins(1, 1, 1, 1)
-        self._outliner_layout.setSpacing(0)
-        self._outliner_layout.addStretch()
-        scroll_widget.setLayout(self._outliner_layout)
+        self._dispatcher = dispatcher.ItemEventDispatcher(self._get_item_at, parent=self)
+        self._create_scroll_widget()
         self.main_layout.addWidget(self._scroll_area)
 
+        self._teardown_timer = QTimer(self)
+        self._teardown_timer.setInterval(0)
+
+        self._deltas_timer = QTimer(self)
+        self._deltas_timer.setInterval(0)
+
     def setup_signals(self):
         self._refresh_btn.clicked.connect(self._on_refresh_outliner)
         self._expand_all_btn.clicked.connect(self._on_expand_all_assets)
         self._collapse_all_btn.clicked.connect(self._on_collapse_all_assets)
+        self._group_btn.toggled.connect(self.set_group_instances)
+        self._sort_combo.currentIndexChanged.connect(self._on_sort_key_changed)
         self._search_widget.textChanged.connect(self._on_search_text_changed)
+        self._scroll_area.verticalScrollBar().valueChanged.connect(self._on_viewport_scrolled)
+        self._teardown_timer.timeout.connect(self._on_teardown_timeout)
+        self._deltas_timer.timeout.connect(self._on_deltas_timeout)
+        self._dispatcher.itemPressed.connect(self._on_item_pressed)
+        self._dispatcher.itemDoubleClicked.connect(self._on_item_double_clicked)
+        self._dispatcher.itemContextRequested.connect(self._on_item_context_requested)
+        self._dispatcher.expandPressed.connect(self.toggle_item)
+        self._dispatcher.viewPressed.connect(self._on_item_view_pressed)
+
+    @property
+    def records(self):
+        """
+        Returns the table that contains the records of all the assets of this outliner
+        :return: AssetRecordTable
+        """
+
+        return self._records
+
+    @property
+    def state_store(self):
+        """
+        Returns the columnar store that contains the state of all the assets of this outliner
+        :return: AssetStateStore
+        """
+
+        return self._state_store
+
+    @property
+    def search_text(self):
+        """
+        Returns current text of the search widget
+        :return: str
+        """
+
+        return self._search_widget.get_text()
+
+    @property
+    def group_instances(self):
+        """
+        Returns whether or not instances of the same asset are displayed in a single row
+        :return: bool
+        """
+
+        return self._group_instances
+
+    def set_group_instances(self, flag):
+        """
+        Sets whether or not instances of the same asset are displayed in a single row
+        :param flag: bool
+        """
+
+        flag = bool(flag)
+        if flag == self._group_instances:
+            return
+
+        self._group_instances = flag
+        self._group_btn.blockSignals(True)
+        try:
+            self._group_btn.setChecked(flag)
+        finally:
+            self._group_btn.blockSignals(False)
+        self.refresh()
+
+    @property
+    def sort_key(self):
+        """
+        Returns the name of the key used to sort outliner items
+        :return: str
+        """
+
+        return self._sort_key
+
+    def set_sort_key(self, sort_key, reverse=False):
+        """
+        Sets the key used to sort outliner items. Items are reordered in a single layout reset
+        :param sort_key: str, name of a sort key registered in sorting module
+        :param reverse: bool
+        :return: bool
+        """
+
+        if not sorting.get_sort_key(sort_key):
+            LOGGER.warning('Sort key "{}" is not registered!'.format(sort_key))
+            return False
+
+        if sort_key == self._sort_key and reverse == self._sort_reverse:
+            return True
+
+        self._sort_key = sort_key
+        self._sort_reverse = reverse
+        sort_keys = sorting.get_sort_key_names()
+        self._sort_combo.blockSignals(True)
+        try:
+            if self._sort_combo.count() != len(sort_keys):
+                self._sort_combo.clear()
+                self._sort_combo.addItems([sort_name.title() for sort_name in sort_keys])
+            self._sort_combo.setCurrentIndex(sort_keys.index(sort_key))
+        finally:
+            self._sort_combo.blockSignals(False)
+
+        self._sorted_widgets.reset(self._widgets, reverse=reverse)
+        scroll_widget = self._scroll_area.widget()
+        scroll_widget.setUpdatesEnabled(False)
+        try:
+            while self._outliner_layout.count():
+                self._outliner_layout.takeAt(0)
+            for asset_widget in self._sorted_widgets:
+                self._outliner_layout.addWidget(asset_widget)
+            self._outliner_layout.addStretch()
+        finally:
+            scroll_widget.setUpdatesEnabled(True)
+
+        return True
+
+    def set_filter_ids(self, asset_ids=None):
+        """
+        Restricts the items displayed by the outliner to the assets with the given ids
+        Filter is combined with the search text
+        :param asset_ids: set(str) or None, if None, filter is disabled
+        """
+
+        self._filter_ids = frozenset(asset_ids) if asset_ids is not None else None
+        self._on_search_text_changed(self._search_widget.get_text())
+
+    def query_records(self, **criteria):
+        """
+        Returns the records of the outliner that match the given criteria
+        :param criteria: dict, keyword arguments supported by AssetStateStore.mask function
+        :return: list(AssetRecord)
+        """
+
+        return self._state_store.select(**criteria)
+
+    def search_records(self, query_text=None):
+        """
+        Returns the records of the outliner that match the given filter query
+        :param query_text: str or None, if not given, current search text is used
+        :return: list(AssetRecord)
+        """
+
+        if query_text is None:
+            query_text = self._search_widget.get_text()
+        search_query = query.get_query(query_text)
+
+        return search_query.select(self._state_store, self._get_query_context())
+
+    def get_item(self, asset_id):
+        """
+        Returns outliner item widget of the asset with the given id
+        :param asset_id: str
+        :return: OutlinerItem or None
+        """
+
+        return self._items.get(asset_id)
+
+    def scroll_to_item(self, asset_id):
+        """
+        Scrolls the outliner to the item of the asset with the given id and selects it
+        If the item is hidden by current search text, search text is cleared
+        :param asset_id: str
+        :return: bool
+        """
+
+        record = self._records.get(asset_id)
+        if record is None:
+            return False
+
+        if not record.has_flag(records.FLAG_MATCHES_FILTER) and self._search_widget.get_text():
+            self._search_widget.set_text('')
+            self._on_search_text_changed('')
+
+        self.select_item(asset_id)
+
+        return asset_id in self._items
 
     def select_item(self, asset_id):
         """
@@ -106,26 +328,30 @@ class OutlinerTree(base.BaseWidget, object):
 
         self.clear_selection()
 
-        for asset_widget in self._widget_tree.keys():
-            if asset_widget.asset_node.id == asset_id:
-                asset_widget.blockSignals(True)
-                try:
-                    asset_widget.set_select(True)
-                    self._scroll_area.ensureWidgetVisible(asset_widget)
-                finally:
-                    asset_widget.blockSignals(False)
+        asset_widget = self._items.get(asset_id)
+        if not asset_widget:
+            return
+
+        asset_widget.blockSignals(True)
+        try:
+            asset_widget.set_select(True)
+            self._scroll_area.ensureWidgetVisible(asset_widget)
+        finally:
+            asset_widget.blockSignals(False)
 
     def clear_selection(self):
         if not self._widgets:
             return
 
-        for asset_widget in self._widget_tree.keys():
-            if asset_widget._is_selected:
-                asset_widget.blockSignals(True)
-                try:
-                    asset_widget.deselect()
-                finally:
-                    asset_widget.blockSignals(False)
+        for record in self._records.with_flags(records.FLAG_SELECTED):
+            asset_widget = self._items.get(record.id)
+            if not asset_widget:
+                continue
+            asset_widget.blockSignals(True)
+            try:
+                asset_widget.deselect()
+            finally:
+                asset_widget.blockSignals(False)
 
     def append_widget(self, asset):
         """
@@ -134,7 +360,9 @@ class OutlinerTree(base.BaseWidget, object):
         """
 
         self._widgets.append(asset)
-        self._outliner_layout.insertWidget(0, asset)
+        if asset.record is not None:
+            self._items[asset.record.id] = asset
+        self._outliner_layout.insertWidget(self._sorted_widgets.insert(asset), asset)
 
     def remove_widget(self, asset):
         """
@@ -143,35 +371,56 @@ class OutlinerTree(base.BaseWidget, object):
         """
 
         if asset in self._widgets:
-            for i in range(self._outliner_layout.count()):
-                child = self._outliner_layout.itemAt(i)
-                if child.widget() == asset:
-                    child.widget().deleteLater()
-                    self._widgets.pop(self._widgets.index(asset))
-                    self._widget_tree.pop(asset)
-                    self._outliner_layout.removeItem(child)
-                    break
+            self._sorted_widgets.remove(asset)
+            self._outliner_layout.removeWidget(asset)
+            if not self._release_widget(asset):
+                asset.hide()
+                self._schedule_teardown([asset])
+            self._widgets.pop(self._widgets.index(asset))
+            self._pending_fetch.discard(asset)
+            if asset.record is not None:
+                self._items.pop(asset.record.id, None)
+                self._records.remove(asset.record.id)
 
     def clear_items(self):
         """
         Clears all the items in the outliner
-        :return:
+        Old items are detached at once and destroyed in small batches when the event loop is idle
         """
+
         del self._widgets[:]
+        self._sorted_widgets.clear()
+
+        stale_widgets = list()
         while self._outliner_layout.count():
             child = self._outliner_layout.takeAt(0)
-            if child.widget() is not None:
-                child.widget().deleteLater()
+            child_widget = child.widget()
+            if child_widget is not None and not self._release_widget(child_widget):
+                stale_widgets.append(child_widget)
 
-        self._outliner_layout.setSpacing(0)
-        self._outliner_layout.addStretch()
+        old_scroll_widget = self._scroll_area.takeWidget()
+        self._create_scroll_widget()
+        if old_scroll_widget is not None:
+            stale_widgets.append(old_scroll_widget)
+        self._schedule_teardown(stale_widgets)
 
     def refresh(self):
         """
         Refresh the items in the outliner
+        If the outliner is suspended, refresh is delayed until the outliner is resumed
         """
 
-        self._widget_tree = defaultdict(list)
+        if self._suspended:
+            self._refresh_pending = True
+            return
+
+        self._refresh_pending = False
+        self._validate_pending = False
+        self._validated_ids.clear()
+        self._delta_queue.clear()
+        self._records.clear()
+        self._items.clear()
+        self._pending_fetch.clear()
         self.clear_items()
         self._init()
         can_expand = False
@@ -183,6 +432,196 @@ class OutlinerTree(base.BaseWidget, object):
             self._collapse_all_btn.setVisible(False)
 
         self._on_search_text_changed(self._search_widget.get_text())
+        self._state_store.sync()
+        self.refreshed.emit()
+
+    @property
+    def is_suspended(self):
+        """
+        Returns whether or not the outliner is suspended
+        :return: bool
+        """
+
+        return self._suspended
+
+    def suspend(self):
+        """
+        Suspends the outliner. Suspended outliners do not paint while hidden and do not update their items: scene
+        changes are queued and applied once the outliner is resumed
+        """
+
+        if self._suspended:
+            return
+
+        self._suspended = True
+        if not self.isVisible():
+            self._scroll_area.setUpdatesEnabled(False)
+
+    def resume(self):
+        """
+        Resumes the outliner, applying all the scene changes queued while it was suspended in a single batch
+        If too many changes were queued, outliner is fully refreshed instead
+        """
+
+        if not self._suspended:
+            return
+
+        self._suspended = False
+        self._scroll_area.setUpdatesEnabled(True)
+        self._flush_scene_deltas()
+        if self._validate_pending:
+            QTimer.singleShot(0, self._validate_visible_items)
+
+    def add_scene_assets(self, asset_nodes):
+        """
+        Notifies the outliner that the given assets were added to (or changed in) the scene
+        Changes are always queued, so they are applied after any change queued before. Queue is flushed right away
+        unless the outliner is suspended or the DCC is busy
+        :param asset_nodes: list(ArtellaAssetNode)
+        """
+
+        for asset_node in asset_nodes:
+            if asset_node.id in self._records:
+                self._delta_queue.push_update(asset_node.id, asset_node)
+            else:
+                self._delta_queue.push_add(asset_node.id, asset_node)
+        self._process_scene_deltas()
+
+    def remove_scene_assets(self, asset_ids):
+        """
+        Notifies the outliner that the assets with the given ids were removed from the scene
+        Changes are always queued, so they are applied after any change queued before. Queue is flushed right away
+        unless the outliner is suspended or the DCC is busy
+        :param asset_ids: list(str)
+        """
+
+        for asset_id in asset_ids:
+            self._delta_queue.push_remove(asset_id)
+        self._process_scene_deltas()
+
+    def invalidate_items(self):
+        """
+        Marks all the items of the outliner as possibly stale. Items are validated (and repaired if their DCC nodes
+        do not exist anymore) lazily, the next time they become visible
+        """
+
+        self._validated_ids.clear()
+        self._validate_pending = True
+        QTimer.singleShot(0, self._validate_visible_items)
+
+    def repair_items(self, stale_items):
+        """
+        Repairs the given stale items without refreshing the whole outliner
+        Other items of the outliner are validated lazily, because they can be stale too
+        :param stale_items: list(OutlinerItem)
+        :return: list(str), ids of the assets that were removed from the outliner
+        """
+
+        removed_ids = self._repair_items(stale_items)
+        if removed_ids:
+            self.staleItemsFound.emit(removed_ids)
+        self.invalidate_items()
+
+        return removed_ids
+
+    def expand_item(self, item, fetch=True):
+        """
+        Expands the given item
+        :param item: OutlinerItem
+        :param fetch: bool, whether to fetch item children if they were not fetched yet. If False, children will be
+            fetched the next time the item is expanded or fetch_item is called
+        """
+
+        item.expand()
+        if fetch:
+            self.fetch_item(item)
+
+    def toggle_item(self, item):
+        """
+        Expands or collapses the given item
+        :param item: OutlinerItem
+        """
+
+        if item.is_expanded:
+            item.collapse()
+        else:
+            self.expand_item(item)
+
+    def fetch_item(self, item):
+        """
+        Creates the children of the given item if they were not created yet
+        :param item: OutlinerItem
+        """
+
+        self._pending_fetch.fetch(item)
+
+    def get_items_in_viewport(self):
+        """
+        Returns the items that are currently visible in the scroll area viewport
+        :return: list(OutlinerItem)
+        """
+
+        viewport = self._scroll_area.viewport()
+        viewport_rect = QRect(
+            0, self._scroll_area.verticalScrollBar().value(), viewport.width(), viewport.height())
+
+        return [item for item in self._widgets if item.isVisible() and item.geometry().intersects(viewport_rect)]
+
+    def _fetch_visible_items(self):
+        """
+        Internal function that fetches the children of the expanded items that are visible in the viewport
+        """
+
+        if self._pending_fetch:
+            self._pending_fetch.fetch_visible(self.get_items_in_viewport())
+
+    def _validate_visible_items(self):
+        """
+        Internal function that repairs the visible items whose DCC nodes do not exist anymore
+        """
+
+        if not self._validate_pending or self._suspended:
+            return
+
+        stale_items = list()
+        for item in self.get_items_in_viewport():
+            record_id = item.record.id if item.record is not None else None
+            if record_id in self._validated_ids:
+                continue
+            if self._is_item_stale(item):
+                stale_items.append(item)
+            elif record_id is not None:
+                self._validated_ids.add(record_id)
+        if not stale_items:
+            return
+
+        removed_ids = self._repair_items(stale_items)
+        if removed_ids:
+            self.staleItemsFound.emit(removed_ids)
+
+    def _is_item_stale(self, item):
+        """
+        Internal function that returns whether or not the DCC nodes of the given item do not exist anymore
+        Overrides in custom outliners
+        :param item: OutlinerItem
+        :return: bool
+        """
+
+        return False
+
+    def _repair_items(self, stale_items):
+        """
+        Internal function that repairs the given stale items. By default, stale items are removed from the outliner
+        Overrides in custom outliners to re-resolve stale items
+        :param stale_items: list(OutlinerItem)
+        :return: list(str), ids of the assets that were removed from the outliner
+        """
+
+        removed_ids = [item.record.id for item in stale_items if item.record is not None]
+        if removed_ids:
+            self.remove_scene_assets(removed_ids)
+
+        return removed_ids
 
     def _init(self):
         """
@@ -192,6 +631,274 @@ class OutlinerTree(base.BaseWidget, object):
 
         pass
 
+    def _process_scene_deltas(self):
+        """
+        Internal function that applies queued scene changes if the outliner is not suspended and the DCC is idle
+        Otherwise, changes are scheduled to be applied later
+        """
+
+        if self._suspended or not governor.get_governor().can_run():
+            self._schedule_scene_deltas()
+            return
+
+        self._flush_scene_deltas()
+
+    def _schedule_scene_deltas(self):
+        """
+        Internal function that schedules queued scene changes to be applied once the DCC is idle
+        Suspended outliners apply their queued changes when they are resumed
+        """
+
+        if not self._suspended and not self._deltas_timer.isActive():
+            self._deltas_timer.start()
+
+    def _flush_scene_deltas(self):
+        """
+        Internal function that applies all queued scene changes in a single batch
+        If too many changes were queued, outliner is fully refreshed instead
+        """
+
+        self._deltas_timer.stop()
+        if self._refresh_pending or self._delta_queue.overflowed:
+            self.refresh()
+            return
+
+        queued_deltas = self._delta_queue.take()
+        if queued_deltas:
+            self._apply_scene_deltas(queued_deltas)
+
+    def _apply_scene_deltas(self, scene_deltas):
+        """
+        Internal function that applies the given scene changes to the outliner items in a single batch
+        :param scene_deltas: list(tuple(str, str, object)), list of (operation, asset id, asset node)
+        """
+
+        removed_ids = [asset_id for operation, asset_id, _ in scene_deltas if operation != deltas.DELTA_ADD]
+        added_nodes = [asset_node for operation, _, asset_node in scene_deltas if operation != deltas.DELTA_REMOVE]
+        if not removed_ids and not added_nodes:
+            return
+
+        scroll_widget = self._scroll_area.widget()
+        scroll_widget.setUpdatesEnabled(False)
+        try:
+            valid_update = self._update_assets(removed_ids, added_nodes)
+        finally:
+            scroll_widget.setUpdatesEnabled(True)
+        if not valid_update:
+            self.refresh()
+            return
+
+        self._on_search_text_changed(self._search_widget.get_text())
+        self._state_store.sync()
+        self.refreshed.emit()
+
+    def _update_assets(self, removed_ids, added_nodes):
+        """
+        Internal function that removes and adds the given assets from the outliner without refreshing it
+        Overrides in custom outliners that support incremental updates
+        :param removed_ids: list(str)
+        :param added_nodes: list(ArtellaAssetNode)
+        :return: bool, False if the outliner must be fully refreshed instead
+        """
+
+        return False
+
+    def _create_scroll_widget(self):
+        """
+        Internal function that creates the widget that contains the items of the outliner
+        """
+
+        scroll_widget = QWidget()
+        self._outliner_layout = QVBoxLayout()
+        self._outliner_layout.setContentsMargins(1, 1, 1, 1)
+        self._outliner_layout.setSpacing(0)
+        self._outliner_layout.addStretch()
+        scroll_widget.setLayout(self._outliner_layout)
+        self._scroll_area.setWidget(scroll_widget)
+        self._dispatcher.watch(scroll_widget)
+
+    def _schedule_teardown(self, widgets):
+        """
+        Internal function that queues given detached widgets to be destroyed in batches
+        :param widgets: list(QWidget)
+        """
+
+        if not widgets:
+            return
+
+        self._teardown_queue.schedule(widgets)
+        if not self._teardown_timer.isActive():
+            self._teardown_timer.start()
+
+    def _get_item_at(self, container_widget, pos):
+        """
+        Internal function that returns the outliner item located at the given position of the items container
+        :param container_widget: QWidget
+        :param pos: QPoint
+        :return: OutlinerItem or None
+        """
+
+        child = container_widget.childAt(pos)
+        while child is not None and child is not container_widget:
+            if isinstance(child, outlineritems.OutlinerItem):
+                return child
+            child = child.parentWidget()
+
+        return None
+
+    def _release_widget(self, asset_widget):
+        """
+        Internal function that is called when an item is removed from the outliner
+        Overrides in custom outliners to recycle item widgets
+        :param asset_widget: OutlinerItem
+        :return: bool, True if the widget was recycled; False if it must be destroyed
+        """
+
+        return False
+
+    def _get_widget_sort_key(self, asset_widget):
+        """
+        Internal function that returns the key used to sort the given outliner item
+        :param asset_widget: OutlinerItem
+        :return: tuple
+        """
+
+        record = self._get_widget_record(asset_widget)
+        if record is None:
+            return (1, )
+
+        return (0, ) + sorting.get_sort_key(self._sort_key)(record, self._records) + (record.id, )
+
+    def _get_widget_record(self, asset_widget):
+        """
+        Internal function that returns the record used to sort the given outliner item
+        Overrides in custom outliners that append items without record
+        :param asset_widget: OutlinerItem
+        :return: AssetRecord or None
+        """
+
+        return asset_widget.record
+
+    def _get_query_context(self):
+        """
+        Internal function that returns the context used to evaluate filter queries over the outliner records
+        Overrides in custom outliners to provide asset tags
+        :return: QueryContext
+        """
+
+        return query.QueryContext(self._records)
+
+    def _on_fetch_item_children(self, item):
+        """
+        Internal callback function that is called when the children of an item are requested for the first time
+        Overrides in custom outliners
+        :param item: OutlinerItem
+        """
+
+        pass
+
+    def _on_item_pressed(self, item, event):
+        """
+        Internal callback function that is called when an item row is pressed
+        Item clicked signal is emitted so external listeners are notified as well
+        :param item: OutlinerItem
+        :param event: QMouseEvent
+        """
+
+        item.set_select(not item.is_selected)
+        item.clicked.emit(item, event)
+        self._on_item_clicked(item, event)
+
+    def _on_item_clicked(self, item, event):
+        """
+        Internal callback function that is called after the selection state of a pressed item is toggled
+        Overrides in custom outliners
+        :param item: OutlinerItem
+        :param event: QMouseEvent
+        """
+
+        pass
+
+    def _on_item_double_clicked(self, item):
+        """
+        Internal callback function that is called when an item row is double clicked
+        :param item: OutlinerItem
+        """
+
+        item.doubleClicked.emit()
+        if item.display_buttons:
+            self.toggle_item(item)
+
+    def _on_item_context_requested(self, item):
+        """
+        Internal callback function that is called when the context menu of an item is requested
+        :param item: OutlinerItem
+        """
+
+        if not item.is_selected:
+            item.select()
+
+        item.contextRequested.emit(item)
+        self._on_show_context_menu(item)
+
+    def _on_show_context_menu(self, item):
+        """
+        Internal callback function that shows the context menu of the given item
+        Overrides in custom outliners
+        :param item: OutlinerItem
+        """
+
+        pass
+
+    def _on_item_view_pressed(self, item):
+        """
+        Internal callback function that is called when the view button of an item is pressed
+        Emits viewSolo signal of the item on Alt + Click and its viewToggled signal otherwise, if the item has them
+        Overrides in custom outliners
+        :param item: OutlinerItem
+        """
+
+        if QApplication.keyboardModifiers() & Qt.AltModifier:
+            if hasattr(item, 'viewSolo'):
+                item.viewSolo.emit(item, not item.is_solo)
+        elif hasattr(item, 'viewToggled'):
+            item.viewToggled.emit(item)
+
+    def _on_teardown_timeout(self):
+        """
+        Internal callback function that destroys next batch of detached widgets
+        """
+
+        if not governor.get_governor().gate_timer(self._teardown_timer):
+            return
+
+        self._teardown_queue.run_batch()
+        if self._teardown_queue.is_empty:
+            self._teardown_timer.stop()
+
+    def _on_deltas_timeout(self):
+        """
+        Internal callback function that applies queued scene changes once the DCC is idle
+        """
+
+        if self._suspended:
+            self._deltas_timer.stop()
+            return
+        if not governor.get_governor().gate_timer(self._deltas_timer):
+            return
+
+        self._flush_scene_deltas()
+
+    def _on_sort_key_changed(self, index):
+        """
+        Internal callback function that is called when sort combo box index changes
+        :param index: int
+        """
+
+        sort_keys = sorting.get_sort_key_names()
+        if 0 <= index < len(sort_keys):
+            self.set_sort_key(sort_keys[index], reverse=self._sort_reverse)
+
     def _on_refresh_outliner(self):
         """
         Internal callback function that is called when Refresh button is clicked
@@ -205,25 +912,53 @@ class OutlinerTree(base.BaseWidget, object):
         Internal callback function that is called when Expand button is clicked
         """
 
-        for asset_widget in self._widget_tree.keys():
-            asset_widget.expand()
+        visible_items = self.get_items_in_viewport()
+        for asset_widget in visible_items:
+            self.expand_item(asset_widget)
+
+        visible_items = set(visible_items)
+        for asset_widget in self._widgets:
+            if asset_widget in visible_items:
+                continue
+            self.expand_item(asset_widget, fetch=False)
+            self._pending_fetch.add(asset_widget)
+
+        QTimer.singleShot(0, self._fetch_visible_items)
 
     def _on_collapse_all_assets(self):
         """
         Internal callback function that is called when Collapse button is clicked
         """
 
-        for asset_widget in self._widget_tree.keys():
+        for asset_widget in self._widgets:
             asset_widget.collapse()
 
+    def _on_viewport_scrolled(self, value):
+        """
+        Internal callback function that is called when the outliner is scrolled
+        :param value: int
+        """
+
+        self._fetch_visible_items()
+        self._validate_visible_items()
+
     def _on_search_text_changed(self, new_text):
-        all_assets = self._widget_tree.keys()
-        if not new_text:
-            for asset in all_assets:
-                asset.setVisible(True)
-        else:
-            for asset in all_assets:
-                if new_text in asset.name or new_text.title() in asset.name:
-                    asset.setVisible(True)
-                else:
-                    asset.setVisible(False)
+        try:
+            matched_ids = set(record.id for record in self.search_records(new_text))
+        except query.QueryError as exc:
+            LOGGER.debug('Search text is not a valid filter query, matching names only | {}'.format(exc))
+            title_text = new_text.title()
+            matched_ids = set(
+                record.id for record in self._records if new_text in record.name or title_text in record.name)
+
+        for record in self._records:
+            matches = record.id in matched_ids
+            if matches and self._filter_ids is not None:
+                matches = record.id in self._filter_ids
+            self._records.set_flag(record, records.FLAG_MATCHES_FILTER, matches)
+            asset_widget = self._items.get(record.id)
+            if asset_widget:
+                asset_widget.setVisible(matches)
+
+        if self._pending_fetch:
+            QTimer.singleShot(0, self._fetch_visible_items)
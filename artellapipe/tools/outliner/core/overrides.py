@@ -0,0 +1,195 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains the registry of asset overrides used by Artella Outliner
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import logging
+from collections import OrderedDict
+
+LOGGER = logging.getLogger()
+
+
+def _load_registered_overrides():
+    """
+    Internal function that returns the overrides registered in Shot Assembler
+    :return: dict(str, ArtellaBaseOverride)
+    """
+
+    from artellapipe.tools.shotmanager.apps import shotassembler
+
+    return shotassembler.ShotAssembler.registered_overrides() or dict()
+
+
+class OverrideRegistry(object):
+    """
+    Caches registered overrides during the session. Registry must be invalidated each time override plugins change
+    """
+
+    def __init__(self, loader=None):
+
+        self._loader = loader or _load_registered_overrides
+        self._overrides = None
+
+    @property
+    def is_loaded(self):
+        """
+        Returns whether or not registered overrides are cached
+        :return: bool
+        """
+
+        return self._overrides is not None
+
+    def get_overrides(self):
+        """
+        Returns all registered overrides
+        :return: OrderedDict(str, ArtellaBaseOverride)
+        """
+
+        if self._overrides is None:
+            self._overrides = OrderedDict()
+            try:
+                registered_overrides = self._loader()
+            except Exception as exc:
+                LOGGER.error('Impossible to retrieve registered overrides: {}'.format(exc))
+                registered_overrides = dict()
+            for override in registered_overrides.values():
+                self._overrides[override.OVERRIDE_NAME] = override
+
+        return self._overrides
+
+    def get_override(self, override_name):
+        """
+        Returns registered override with given name
+        :param override_name: str
+        :return: ArtellaBaseOverride or None
+        """
+
+        return self.get_overrides().get(override_name)
+
+    def invalidate(self):
+        """
+        Clears cached overrides. They will be retrieved again the next time they are requested
+        """
+
+        self._overrides = None
+
+
+_REGISTRY = OverrideRegistry()
+
+
+def get_registry():
+    """
+    Returns the override registry of the current session
+    :return: OverrideRegistry
+    """
+
+    return _REGISTRY
+
+
+def invalidate_registry():
+    """
+    Invalidates the override registry of the current session
+    Must be called each time override plugins are loaded or unloaded
+    """
+
+    _REGISTRY.invalidate()
+
+
+class SceneOverridesCache(object):
+    """
+    Caches the overrides of all scene assets during a refresh cycle
+    Overrides are still queried asset by asset, but each asset is only queried once per refresh cycle, even if it is
+    listed in several outliners
+    """
+
+    def __init__(self):
+
+        self._overrides = dict()
+        self._cycle = 0
+
+    def __contains__(self, node_name):
+        return node_name in self._overrides
+
+    @property
+    def cycle(self):
+        """
+        Returns current refresh cycle
+        :return: int
+        """
+
+        return self._cycle
+
+    def begin_cycle(self):
+        """
+        Starts a new refresh cycle. Overrides collected during previous cycles are discarded
+        """
+
+        self._overrides.clear()
+        self._cycle += 1
+
+    def collect(self, asset_nodes):
+        """
+        Collects the overrides of the given asset nodes that are not cached yet
+        Each asset node is queried individually; assets already cached during current refresh cycle are skipped
+        :param asset_nodes: list(ArtellaAssetNode)
+        :return: dict(str, list(ArtellaBaseOverride)), dictionary that maps node names with their overrides
+        """
+
+        for asset_node in asset_nodes:
+            node_name = asset_node.node
+            if node_name in self._overrides:
+                continue
+            try:
+                self._overrides[node_name] = list(asset_node.get_overrides() or list())
+            except Exception as exc:
+                LOGGER.warning('Impossible to retrieve overrides of "{}" | {}'.format(node_name, exc))
+                self._overrides[node_name] = list()
+
+        return self._overrides
+
+    def invalidate(self, node_name):
+        """
+        Discards cached overrides of the given node. They will be collected again the next time they are requested
+        :param node_name: str
+        """
+
+        self._overrides.pop(node_name, None)
+
+    def get(self, node_name):
+        """
+        Returns cached overrides of the given node
+        :param node_name: str
+        :return: list(ArtellaBaseOverride)
+        """
+
+        return self._overrides.setdefault(node_name, list())
+
+    def count(self, node_name):
+        """
+        Returns the number of cached overrides of the given node
+        :param node_name: str
+        :return: int
+        """
+
+        return len(self._overrides.get(node_name, ()))
+
+
+_SCENE_CACHE = SceneOverridesCache()
+
+
+def get_scene_cache():
+    """
+    Returns the scene overrides cache of the current session
+    :return: SceneOverridesCache
+    """
+
+    return _SCENE_CACHE
@@ -0,0 +1,243 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains visibility and LOD state presets for Artella Outliner
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import os
+import json
+import logging
+
+from artellapipe.tools.outliner.core import records
+
+LOGGER = logging.getLogger()
+
+PRESETS_VERSION = 1
+PRESETS_EXTENSION = '.outliner_presets.json'
+
+
+def get_scene_presets_file(scene_path):
+    """
+    Returns path where presets of the given scene are stored
+    :param scene_path: str
+    :return: str or None
+    """
+
+    if not scene_path:
+        return None
+
+    return os.path.splitext(scene_path)[0] + PRESETS_EXTENSION
+
+
+def get_record_state(record):
+    """
+    Returns the visibility and LOD state stored in the given record
+    :param record: AssetRecord
+    :return: tuple(bool, bool), whether the record is visible and whether it is proxy
+    """
+
+    return record.has_flag(records.FLAG_VISIBLE), record.has_flag(records.FLAG_PROXY)
+
+
+class StatePreset(object):
+    """
+    Stores visibility and LOD state of a group of DCC nodes
+    Only nodes whose state differs from the default one (visible and hires) are stored
+    """
+
+    __slots__ = ('name', 'hidden', 'proxy')
+
+    def __init__(self, name, hidden=None, proxy=None):
+
+        self.name = name
+        self.hidden = frozenset(hidden or ())
+        self.proxy = frozenset(proxy or ())
+
+    @classmethod
+    def capture(cls, name, asset_records, state_fn=None):
+        """
+        Creates a new preset storing the current state of the given records
+        :param name: str
+        :param asset_records: list(AssetRecord)
+        :param state_fn: fn or None, function that returns the current (visible, proxy) state of a record. If not
+            given, the state stored in the records is used
+        :return: StatePreset
+        """
+
+        state_fn = state_fn or get_record_state
+        hidden = set()
+        proxy = set()
+        for record in asset_records:
+            if not record.node:
+                continue
+            is_visible, is_proxy = state_fn(record)
+            if not is_visible:
+                hidden.add(record.node)
+            if is_proxy:
+                proxy.add(record.node)
+
+        return cls(name, hidden=hidden, proxy=proxy)
+
+    @classmethod
+    def from_dict(cls, name, preset_dict):
+        """
+        Creates a new preset from the given serialized data
+        :param name: str
+        :param preset_dict: dict
+        :return: StatePreset
+        """
+
+        return cls(name, hidden=preset_dict.get('hidden'), proxy=preset_dict.get('proxy'))
+
+    def to_dict(self):
+        """
+        Returns serialized data of the preset
+        :return: dict
+        """
+
+        preset_dict = dict()
+        if self.hidden:
+            preset_dict['hidden'] = sorted(self.hidden)
+        if self.proxy:
+            preset_dict['proxy'] = sorted(self.proxy)
+
+        return preset_dict
+
+    def diff(self, asset_records, state_fn=None):
+        """
+        Returns the records whose state differs from the one stored in the preset
+        :param asset_records: list(AssetRecord)
+        :param state_fn: fn or None, function that returns the current (visible, proxy) state of a record. If not
+            given, the state stored in the records is used
+        :return: dict, with to_show, to_hide, to_proxy and to_hires lists of records
+        """
+
+        state_fn = state_fn or get_record_state
+        plan = {'to_show': list(), 'to_hide': list(), 'to_proxy': list(), 'to_hires': list()}
+        for record in asset_records:
+            if not record.node:
+                continue
+            is_visible, is_proxy = state_fn(record)
+            should_be_visible = record.node not in self.hidden
+            should_be_proxy = record.node in self.proxy
+            if is_visible != should_be_visible:
+                plan['to_show' if should_be_visible else 'to_hide'].append(record)
+            if is_proxy != should_be_proxy:
+                plan['to_proxy' if should_be_proxy else 'to_hires'].append(record)
+
+        return plan
+
+
+class StatePresetsFile(object):
+    """
+    Reads and writes the state presets of a scene from disk
+    """
+
+    def __init__(self, file_path):
+
+        self._file_path = file_path
+        self._presets = None
+
+    @property
+    def file_path(self):
+        """
+        Returns path where presets are stored
+        :return: str
+        """
+
+        return self._file_path
+
+    def preset_names(self):
+        """
+        Returns the names of all the stored presets
+        :return: list(str)
+        """
+
+        return sorted(self._load().keys())
+
+    def get_preset(self, name):
+        """
+        Returns preset with given name
+        :param name: str
+        :return: StatePreset or None
+        """
+
+        return self._load().get(name)
+
+    def add_preset(self, preset):
+        """
+        Stores given preset, overriding any existing preset with the same name
+        :param preset: StatePreset
+        :return: bool
+        """
+
+        self._load()[preset.name] = preset
+
+        return self._save()
+
+    def remove_preset(self, name):
+        """
+        Removes preset with given name
+        :param name: str
+        :return: bool
+        """
+
+        if self._load().pop(name, None) is None:
+            return False
+
+        return self._save()
+
+    def _load(self):
+        """
+        Internal function that loads presets from disk the first time they are accessed
+        :return: dict(str, StatePreset)
+        """
+
+        if self._presets is not None:
+            return self._presets
+
+        self._presets = dict()
+        if not self._file_path or not os.path.isfile(self._file_path):
+            return self._presets
+
+        try:
+            with open(self._file_path, 'r') as fh:
+                presets_data = json.load(fh)
+        except Exception as exc:
+            LOGGER.warning('Impossible to load outliner presets from "{}" | {}'.format(self._file_path, exc))
+            return self._presets
+
+        for preset_name, preset_dict in presets_data.get('presets', dict()).items():
+            self._presets[preset_name] = StatePreset.from_dict(preset_name, preset_dict)
+
+        return self._presets
+
+    def _save(self):
+        """
+        Internal function that stores presets into disk
+        :return: bool
+        """
+
+        if not self._file_path:
+            return False
+
+        presets_data = {
+            'version': PRESETS_VERSION,
+            'presets': dict((preset.name, preset.to_dict()) for preset in self._presets.values())
+        }
+        try:
+            with open(self._file_path, 'w') as fh:
+                json.dump(presets_data, fh, separators=(',', ':'), sort_keys=True)
+        except Exception as exc:
+            LOGGER.warning('Impossible to save outliner presets into "{}" | {}'.format(self._file_path, exc))
+            return False
+
+        return True
@@ -0,0 +1,502 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains functions to prewarm Artella Outliner while the DCC is idle
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import time
+import logging
+import importlib
+
+from artellapipe.tools.outliner.core import icons, assetindex, overrides, governor, snapshot
+
+LOGGER = logging.getLogger()
+
+CONFIG_NAME = 'artellapipe-tools-outliner'
+DEFAULT_INTERVAL = 50
+DEFAULT_TIME_BUDGET = 0.005
+
+# Prewarm configuration used if the tool configuration does not define it (or some of its keys)
+DEFAULT_CONFIG = {
+    'enabled': False, 'interval': DEFAULT_INTERVAL, 'time_budget': DEFAULT_TIME_BUDGET, 'scene': True,
+    'modules': [], 'icons': []
+}
+
+PREWARM_MODULES = [
+    'artellapipe.tools.outliner.widgets.items',
+    'artellapipe.tools.outliner.widgets.baseoutliner',
+    'artellapipe.tools.outliner.widgets.outliner',
+]
+
+PREWARM_ICONS = [
+    'eye', 'eye_closed', 'editor', 'save', 'delete', 'add', 'low_poly', 'high_poly'
+]
+
+
+class Prewarmer(object):
+    """
+    Runs prewarm tasks in small time slices. Each task is a generator function that yields after each unit of work,
+    so a slice can stop as soon as its time budget is spent. Slices are skipped while the DCC is busy
+    """
+
+    def __init__(self, time_budget=DEFAULT_TIME_BUDGET, can_run=None, clock=None):
+
+        self._time_budget = time_budget
+        self._can_run = can_run
+        self._clock = clock or time.time
+        self._tasks = list()
+        self._current = None
+        self._finished_tasks = list()
+
+    @property
+    def is_finished(self):
+        """
+        Returns whether or not all the prewarm tasks were run
+        :return: bool
+        """
+
+        return self._current is None and not self._tasks
+
+    @property
+    def pending_tasks(self):
+        """
+        Returns the names of the tasks that were not run yet
+        :return: list(str)
+        """
+
+        pending_tasks = [name for name, _ in self._tasks]
+        if self._current is not None:
+            pending_tasks.insert(0, self._current[0])
+
+        return pending_tasks
+
+    @property
+    def finished_tasks(self):
+        """
+        Returns the names of the tasks that were already run
+        :return: list(str)
+        """
+
+        return self._finished_tasks
+
+    def add_task(self, name, task_fn):
+        """
+        Appends a new prewarm task
+        :param name: str
+        :param task_fn: fn, generator function that yields after each unit of work
+        """
+
+        self._tasks.append((name, task_fn))
+
+    def is_finished_task(self, name):
+        """
+        Returns whether or not the task with given name was already run
+        :param name: str
+        :return: bool
+        """
+
+        return name in self._finished_tasks
+
+    def run_slice(self):
+        """
+        Runs prewarm work until the time budget of the slice is spent
+        Nothing is done if the DCC is busy
+        :return: bool, True if there is still work to do; False otherwise
+        """
+
+        if self.is_finished:
+            return False
+        if self._can_run and not self._can_run():
+            return True
+
+        end_time = self._clock() + self._time_budget if self._time_budget else None
+        while not self.is_finished:
+            if self._current is None:
+                name, task_fn = self._tasks.pop(0)
+                self._current = (name, task_fn())
+            name, steps = self._current
+            try:
+                next(steps)
+            except StopIteration:
+                self._current = None
+                self._finished_tasks.append(name)
+            except Exception as exc:
+                LOGGER.warning('Outliner prewarm task "{}" failed: {}'.format(name, exc))
+                self._current = None
+            if end_time is not None and self._clock() >= end_time:
+                break
+
+        return not self.is_finished
+
+    def cancel(self):
+        """
+        Cancels all the pending prewarm tasks
+        """
+
+        del self._tasks[:]
+        self._current = None
+
+
+def _import_modules(module_names):
+    """
+    Internal generator function that imports the given modules one by one
+    :param module_names: list(str)
+    """
+
+    for module_name in module_names:
+        importlib.import_module(module_name)
+        yield
+
+
+def _load_icons(icon_names):
+    """
+    Internal generator function that loads the given icons one by one
+    :param icon_names: list(str)
+    """
+
+    for icon_name in icon_names:
+        icons.get_icon(icon_name)
+        yield
+
+
+def _resolve_outliner_classes(outliners_data):
+    """
+    Internal generator function that imports the modules of the given outliner classes one by one, so registering
+    the outliners when the tool is opened does not pay the imports
+    :param outliners_data: dict, outliners configuration with the full path of each outliner class
+    """
+
+    for outliner_type, outliner_info in outliners_data.items():
+        full_outliner_class = (outliner_info or dict()).get('class', None)
+        if not full_outliner_class:
+            continue
+        outliner_module, _, outliner_class = full_outliner_class.rpartition('.')
+        try:
+            mod = importlib.import_module(outliner_module)
+        except Exception as exc:
+            LOGGER.warning('Impossible to prewarm Outliner class "{}": {}'.format(full_outliner_class, exc))
+        else:
+            if not hasattr(mod, outliner_class):
+                LOGGER.warning('No Outliner Class "{}" found in Module: "{}"'.format(outliner_class, outliner_module))
+        yield
+
+
+def _get_scene_name():
+    """
+    Internal function that returns the name of the current DCC scene
+    :return: str
+    """
+
+    import tpDcc as tp
+
+    return tp.Dcc.scene_name()
+
+
+def get_scene_key():
+    """
+    Returns a key that identifies the current scene contents: the scene name, the number of times the asset index
+    was invalidated and the number of scene changes notified by the DCC. If the key changes, data prewarmed for the
+    scene is stale
+    :return: tuple(str, int, int)
+    """
+
+    return _get_scene_name(), assetindex.get_index().generation, _SCENE_CHANGES
+
+
+def _add_maya_scene_callbacks(callback):
+    """
+    Internal function that registers the given callback to be called each time Maya scene or its references change
+    :param callback: fn
+    :return: list(int), ids of the registered callbacks
+    """
+
+    import maya.api.OpenMaya as OpenMaya
+
+    scene_messages = (
+        OpenMaya.MSceneMessage.kAfterNew, OpenMaya.MSceneMessage.kAfterOpen, OpenMaya.MSceneMessage.kAfterImport,
+        OpenMaya.MSceneMessage.kAfterCreateReference, OpenMaya.MSceneMessage.kAfterRemoveReference,
+        OpenMaya.MSceneMessage.kAfterLoadReference, OpenMaya.MSceneMessage.kAfterUnloadReference)
+    callback_ids = [
+        OpenMaya.MSceneMessage.addCallback(scene_message, lambda *args: callback()) for scene_message in scene_messages]
+    callback_ids.append(OpenMaya.MDGMessage.addNodeRemovedCallback(lambda *args: callback()))
+
+    return callback_ids
+
+
+def _remove_maya_scene_callbacks(callback_ids):
+    """
+    Internal function that unregisters the given Maya callbacks
+    :param callback_ids: list(int)
+    """
+
+    import maya.api.OpenMaya as OpenMaya
+
+    OpenMaya.MMessage.removeCallbacks(callback_ids)
+
+
+def _install_scene_callbacks():
+    """
+    Internal function that registers the DCC callbacks used to know when prewarmed scene data becomes stale
+    :return: bool, True if scene changes are tracked; False otherwise
+    """
+
+    global _SCENE_CALLBACK_IDS
+
+    if _SCENE_CALLBACK_IDS is not None:
+        return True
+
+    import tpDcc as tp
+
+    if not tp.is_maya():
+        return False
+
+    _SCENE_CALLBACK_IDS = _add_maya_scene_callbacks(_on_scene_changed)
+
+    return True
+
+
+def _uninstall_scene_callbacks():
+    """
+    Internal function that unregisters the DCC callbacks used to track scene changes
+    """
+
+    global _SCENE_CALLBACK_IDS
+
+    if _SCENE_CALLBACK_IDS is None:
+        return
+
+    try:
+        _remove_maya_scene_callbacks(_SCENE_CALLBACK_IDS)
+    except Exception as exc:
+        LOGGER.warning('Impossible to remove Outliner prewarm scene callbacks: {}'.format(exc))
+    _SCENE_CALLBACK_IDS = None
+
+
+def _on_scene_changed():
+    """
+    Internal callback function that is called each time the DCC scene changes
+    Scene data prewarmed before the change becomes stale
+    """
+
+    global _SCENE_CHANGES
+
+    _SCENE_CHANGES += 1
+
+
+def _build_scene_data():
+    """
+    Internal generator function that builds the asset index of the scene
+    Asset snapshots are not captured, they are captured by each outliner only for the assets it displays
+    """
+
+    global _SCENE_DATA_KEY
+
+    # Key is taken before building the index, so scene changes notified while the index is built make it stale
+    _SCENE_DATA_KEY = None
+    scene_key = get_scene_key()
+    asset_index = assetindex.get_index()
+    for _ in asset_index.iter_build():
+        yield
+
+    overrides.get_scene_cache().begin_cycle()
+    snapshot.get_cache().clear()
+    _SCENE_DATA_KEY = scene_key
+
+
+def _is_dcc_busy():
+    """
+    Internal function that returns whether or not user is interacting with the DCC
+    :return: bool
+    """
+
+    from Qt.QtCore import Qt
+    from Qt.QtWidgets import QApplication
+
+    return QApplication.mouseButtons() != Qt.NoButton or QApplication.activePopupWidget() is not None
+
+
+def create_prewarmer(config=None, can_run=None):
+    """
+    Returns a prewarmer with all the outliner prewarm tasks
+    :param config: dict or None, prewarm configuration
+    :param can_run: fn or None, function that returns whether or not prewarm work can run
+    :return: Prewarmer
+    """
+
+    config = config or dict()
+    prewarmer = Prewarmer(time_budget=config.get('time_budget', DEFAULT_TIME_BUDGET), can_run=can_run)
+    prewarmer.add_task('modules', lambda: _import_modules(PREWARM_MODULES + list(config.get('modules', list()))))
+    prewarmer.add_task('icons', lambda: _load_icons(PREWARM_ICONS + list(config.get('icons', list()))))
+    if config.get('outliners', None):
+        prewarmer.add_task('classes', lambda: _resolve_outliner_classes(config['outliners']))
+    if config.get('scene', True):
+        prewarmer.add_task('scene', _build_scene_data)
+
+    return prewarmer
+
+
+_PREWARMER = None
+_PREWARM_TIMER = None
+_SCENE_DATA_KEY = None
+_SCENE_CHANGES = 0
+_SCENE_CALLBACK_IDS = None
+
+
+def _get_tool_config():
+    """
+    Internal function that returns the configuration of the outliner tool for the current project
+    :return: ArtellaConfiguration or None
+    """
+
+    import tpDcc as tp
+    import artellapipe
+
+    project = getattr(artellapipe, 'project', None)
+    if not project:
+        return None
+
+    return tp.ConfigsMgr().get_config(
+        config_name=CONFIG_NAME, package_name=project.get_clean_name(), root_package_name='artellapipe',
+        environment=project.get_environment())
+
+
+def load_config(tool_config=None):
+    """
+    Returns the prewarm configuration stored in the given tool configuration. Default values are used for the keys
+    the tool configuration does not define
+    :param tool_config: ArtellaConfiguration or None
+    :return: dict, prewarm configuration, with the outliners configuration stored in "outliners" key
+    """
+
+    config = dict(DEFAULT_CONFIG)
+    if tool_config is None:
+        return config
+
+    config.update(tool_config.get('prewarm', default=dict()) or dict())
+    config['outliners'] = tool_config.get('outliners', default=dict()) or dict()
+
+    return config
+
+
+def install(tool_config=None):
+    """
+    Hook called once the DCC finishes its startup. Starts prewarming the outliner if it is enabled in tool configuration
+    Nothing is done if DCC has no UI
+    :param tool_config: ArtellaConfiguration or None, configuration of the outliner tool. If not given, configuration
+        of the current project is loaded
+    :return: bool
+    """
+
+    from Qt.QtWidgets import QApplication
+
+    if QApplication.instance() is None:
+        return False
+
+    if tool_config is None:
+        try:
+            tool_config = _get_tool_config()
+        except Exception as exc:
+            LOGGER.warning('Impossible to load Outliner configuration to prewarm it: {}'.format(exc))
+            return False
+    config = load_config(tool_config)
+    if not config.get('enabled', False):
+        return False
+
+    return start(config)
+
+
+def start(config=None):
+    """
+    Starts prewarming the outliner while the DCC is idle
+    Work is done in small slices, and slices are skipped during playback or while the user interacts with the DCC
+    :param config: dict or None, prewarm configuration
+    :return: bool
+    """
+
+    global _PREWARMER, _PREWARM_TIMER
+
+    from Qt.QtCore import QTimer
+
+    stop()
+    config = config or dict()
+    if config.get('scene', True):
+        try:
+            track_scene = _install_scene_callbacks()
+        except Exception as exc:
+            LOGGER.warning('Impossible to track scene changes to prewarm Outliner scene data: {}'.format(exc))
+            track_scene = False
+        if not track_scene:
+            LOGGER.debug('Scene changes cannot be tracked in current DCC. Outliner scene data is not prewarmed')
+            config = dict(config, scene=False)
+    work_governor = governor.get_governor()
+    _PREWARMER = create_prewarmer(config, can_run=lambda: work_governor.can_run() and not _is_dcc_busy())
+    _PREWARM_TIMER = QTimer()
+    _PREWARM_TIMER.setInterval(config.get('interval', DEFAULT_INTERVAL))
+    _PREWARM_TIMER.timeout.connect(_on_prewarm_timeout)
+    _PREWARM_TIMER.start()
+
+    return True
+
+
+def stop():
+    """
+    Stops prewarming the outliner
+    """
+
+    global _PREWARMER, _PREWARM_TIMER
+
+    if _PREWARM_TIMER is not None:
+        _PREWARM_TIMER.stop()
+        _PREWARM_TIMER.deleteLater()
+    if _PREWARMER is not None:
+        _PREWARMER.cancel()
+    _PREWARMER = None
+    _PREWARM_TIMER = None
+
+
+def consume_scene_data():
+    """
+    Returns whether or not scene data was prewarmed for the current scene. Data prewarmed before a different scene was
+    opened or before scene assets changed is discarded. Prewarmed scene data can only be used once, so following calls
+    return False until scene data is prewarmed again
+    :return: bool
+    """
+
+    global _SCENE_DATA_KEY
+
+    scene_data_key = _SCENE_DATA_KEY
+    _SCENE_DATA_KEY = None
+    _uninstall_scene_callbacks()
+    if scene_data_key is None:
+        return False
+
+    try:
+        scene_key = get_scene_key()
+    except Exception as exc:
+        LOGGER.warning('Impossible to check prewarmed Outliner scene data: {}'.format(exc))
+        return False
+    if scene_key != scene_data_key:
+        LOGGER.debug('Outliner prewarmed scene data is stale. Scene data will be collected again')
+        return False
+
+    return True
+
+
+def _on_prewarm_timeout():
+    """
+    Internal callback function that runs a prewarm slice each time prewarm timer times out
+    """
+
+    if _PREWARMER is None or _PREWARMER.run_slice():
+        return
+
+    LOGGER.debug('Outliner prewarmed: {}'.format(', '.join(_PREWARMER.finished_tasks)))
+    stop()
@@ -0,0 +1,357 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains the filter query language used by Artella Outliner search
+Queries are composed of space separated terms. Terms with a key (type:prop, tag:hero, hidden:true, lod:proxy,
+has:override, selected:true, ns:env_*, name:tree*) filter by asset state and terms without key match asset names.
+Terms can be negated with a leading dash (-type:prop)
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import re
+import fnmatch
+from collections import OrderedDict, namedtuple
+
+from artellapipe.tools.outliner.core import records, statestore
+
+MAX_CACHED_QUERIES = 64
+
+TERM_REGEX = re.compile(r'(-)?(?:([A-Za-z_]+):)?("[^"]*"|\S+)')
+TRUE_VALUES = ('true', 'yes', 'on', '1')
+FALSE_VALUES = ('false', 'no', 'off', '0')
+LOD_VALUES = {'proxy': statestore.LOD_PROXY, 'low': statestore.LOD_PROXY, 'hires': statestore.LOD_HIRES,
+              'high': statestore.LOD_HIRES}
+
+QueryTerm = namedtuple('QueryTerm', ['key', 'value', 'negated'])
+
+
+class QueryError(ValueError):
+    """
+    Exception raised when a filter query is not valid
+    """
+
+    pass
+
+
+class QueryContext(object):
+    """
+    Provides the data a query needs to evaluate records that is not stored in the records themselves
+    """
+
+    def __init__(self, record_table, tag_lookup=None):
+
+        self._table = record_table
+        self._tag_lookup = tag_lookup
+        self._tags = dict()
+
+    def type_name(self, record):
+        """
+        Returns the type name of the given record
+        :param record: AssetRecord
+        :return: str
+        """
+
+        return self._table.type_name(record.type_id)
+
+    def has_tag(self, record, tag):
+        """
+        Returns whether or not the given record has the given tag
+        :param record: AssetRecord
+        :param tag: str
+        :return: bool
+        """
+
+        tag_ids = self._tags.get(tag)
+        if tag_ids is None:
+            tag_ids = self._tags[tag] = set(self._tag_lookup(tag)) if self._tag_lookup else set()
+
+        return record.id in tag_ids
+
+
+def _parse_bool(term):
+    value = term.value.lower()
+    if value in TRUE_VALUES:
+        return True
+    if value in FALSE_VALUES:
+        return False
+
+    raise QueryError('Invalid value "{}" for "{}" filter. Expected true or false'.format(term.value, term.key))
+
+
+def _is_pattern(value):
+    return any(char in value for char in '*?[')
+
+
+def _name_matcher(text):
+    title_text = text.title()
+
+    def _match(record, context):
+        return text in record.name or title_text in record.name
+
+    return _match
+
+
+def _pattern_matcher(pattern, attr_name):
+    pattern_regex = re.compile(fnmatch.translate(pattern.lower()))
+
+    def _match(record, context):
+        return bool(pattern_regex.match((getattr(record, attr_name) or '').lower()))
+
+    return _match
+
+
+def _type_matcher(pattern):
+    pattern_regex = re.compile(fnmatch.translate(pattern.lower()))
+
+    def _match(record, context):
+        return bool(pattern_regex.match(context.type_name(record)))
+
+    return _match
+
+
+def _tag_matcher(tag):
+    tag = tag.lower()
+
+    def _match(record, context):
+        return context.has_tag(record, tag)
+
+    return _match
+
+
+def _flag_matcher(flag, state):
+
+    def _match(record, context):
+        return ((record.flags & flag) != 0) == state
+
+    return _match
+
+
+def _negate(matcher):
+
+    def _match(record, context):
+        return not matcher(record, context)
+
+    return _match
+
+
+class AssetQuery(object):
+    """
+    Compiled filter query. Terms supported by AssetStateStore are resolved with a single vectorized mask; the rest of
+    terms are compiled into predicates that are only evaluated over the records that passed the mask
+    """
+
+    def __init__(self, text):
+
+        self._text = text or ''
+        self._terms = self.parse(self._text)
+        self._criteria = dict()
+        self._predicates = list()
+        self._compile()
+
+    def __repr__(self):
+        return '<AssetQuery "{}">'.format(self._text)
+
+    @property
+    def text(self):
+        """
+        Returns the text of the query
+        :return: str
+        """
+
+        return self._text
+
+    @property
+    def terms(self):
+        """
+        Returns the parsed terms of the query
+        :return: list(QueryTerm)
+        """
+
+        return self._terms
+
+    @property
+    def criteria(self):
+        """
+        Returns the criteria of the query that are resolved with AssetStateStore masks
+        :return: dict
+        """
+
+        return self._criteria
+
+    @property
+    def is_empty(self):
+        """
+        Returns whether or not the query has no terms
+        :return: bool
+        """
+
+        return not self._terms
+
+    @staticmethod
+    def parse(text):
+        """
+        Parses given query text
+        :param text: str
+        :return: list(QueryTerm)
+        """
+
+        terms = list()
+        for negated, key, value in TERM_REGEX.findall(text or ''):
+            if value.startswith('"') and value.endswith('"'):
+                value = value[1:-1]
+            if not value:
+                continue
+            terms.append(QueryTerm(key.lower(), value, bool(negated)))
+
+        return terms
+
+    def matches(self, record, context):
+        """
+        Returns whether or not the given record matches the query
+        :param record: AssetRecord
+        :param context: QueryContext
+        :return: bool
+        """
+
+        if not self._matches_criteria(record, context):
+            return False
+
+        return all(predicate(record, context) for predicate in self._predicates)
+
+    def filter(self, asset_records, context):
+        """
+        Returns the records that match the query
+        :param asset_records: list(AssetRecord)
+        :param context: QueryContext
+        :return: list(AssetRecord)
+        """
+
+        return [record for record in asset_records if self.matches(record, context)]
+
+    def select(self, state_store, context):
+        """
+        Returns the records of the given state store that match the query
+        State store must be synchronized with its records table before calling this function
+        :param state_store: AssetStateStore
+        :param context: QueryContext
+        :return: list(AssetRecord)
+        """
+
+        candidates = state_store.records(state_store.mask(**self._criteria))
+        if not self._predicates:
+            return candidates
+
+        return [record for record in candidates if all(predicate(record, context) for predicate in self._predicates)]
+
+    def _matches_criteria(self, record, context):
+        """
+        Internal function that evaluates mask criteria of the query over a single record
+        :param record: AssetRecord
+        :param context: QueryContext
+        :return: bool
+        """
+
+        types = self._criteria.get('types')
+        if types is not None and context.type_name(record) not in types:
+            return False
+        for key, flag in (('visible', records.FLAG_VISIBLE), ('selected', records.FLAG_SELECTED),
+                          ('has_override', records.FLAG_HAS_OVERRIDE)):
+            value = self._criteria.get(key)
+            if value is not None and record.has_flag(flag) != value:
+                return False
+        lod = self._criteria.get('lod')
+        if lod is not None and record.has_flag(records.FLAG_PROXY) != (lod == statestore.LOD_PROXY):
+            return False
+
+        return True
+
+    def _set_criteria(self, key, value):
+        """
+        Internal function that adds a state store criteria to the query
+        Contradictory criteria (hidden:true visible:true) are kept as predicates so the query matches nothing
+        :param key: str
+        :param value: object
+        """
+
+        if key in self._criteria and self._criteria[key] != value:
+            self._predicates.append(lambda record, context: False)
+            return
+
+        self._criteria[key] = value
+
+    def _compile(self):
+        """
+        Internal function that compiles query terms into state store criteria and predicates
+        """
+
+        types = list()
+        for term in self._terms:
+            key = term.key
+            if key in ('type', 'category'):
+                if term.negated or _is_pattern(term.value):
+                    matcher = _type_matcher(term.value)
+                else:
+                    types.append(term.value.lower())
+                    continue
+            elif key in ('hidden', 'visible', 'selected'):
+                state = _parse_bool(term) != term.negated
+                if key == 'hidden':
+                    key, state = 'visible', not state
+                self._set_criteria(key, state)
+                continue
+            elif key == 'lod':
+                lod = LOD_VALUES.get(term.value.lower())
+                if lod is None:
+                    raise QueryError('Invalid value "{}" for "lod" filter. Expected proxy or hires'.format(term.value))
+                if term.negated:
+                    lod = statestore.LOD_HIRES if lod == statestore.LOD_PROXY else statestore.LOD_PROXY
+                self._set_criteria('lod', lod)
+                continue
+            elif key == 'has':
+                if term.value.lower() not in ('override', 'overrides'):
+                    raise QueryError('Invalid value "{}" for "has" filter. Expected override'.format(term.value))
+                self._set_criteria('has_override', not term.negated)
+                continue
+            elif key == 'tag':
+                matcher = _tag_matcher(term.value)
+            elif key in ('ns', 'namespace'):
+                matcher = _pattern_matcher(term.value, 'namespace')
+            elif key == 'name':
+                matcher = _pattern_matcher(term.value, 'short_name')
+            elif not key:
+                matcher = _name_matcher(term.value)
+            else:
+                raise QueryError('Unknown filter "{}"'.format(term.key))
+
+            self._predicates.append(_negate(matcher) if term.negated else matcher)
+
+        if types:
+            self._criteria['types'] = types
+
+
+_QUERIES_CACHE = OrderedDict()
+
+
+def get_query(text):
+    """
+    Returns the compiled query of the given text. Compiled queries are cached, so each query text is parsed only once
+    :param text: str
+    :return: AssetQuery
+    """
+
+    text = (text or '').strip()
+    query = _QUERIES_CACHE.pop(text, None)
+    if query is None:
+        query = AssetQuery(text)
+    _QUERIES_CACHE[text] = query
+    while len(_QUERIES_CACHE) > MAX_CACHED_QUERIES:
+        _QUERIES_CACHE.popitem(last=False)
+
+    return query
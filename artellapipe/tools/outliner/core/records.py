@@ -0,0 +1,480 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains compact asset records used by Artella Outliner data layer
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import re
+from collections import OrderedDict
+
+FLAG_VISIBLE = 1 << 0
+FLAG_PROXY = 1 << 1
+FLAG_SELECTED = 1 << 2
+FLAG_HAS_OVERRIDE = 1 << 3
+FLAG_MATCHES_FILTER = 1 << 4
+FLAG_SYNCED = 1 << 5
+
+DEFAULT_FLAGS = FLAG_VISIBLE | FLAG_MATCHES_FILTER
+
+
+def get_display_name(name, namespace=None):
+    """
+    Returns the name used to display an asset in the outliner
+    :param name: str, short name of the asset node
+    :param namespace: str or None, namespace of the asset node
+    :return: str
+    """
+
+    if namespace:
+        return namespace[1:] if namespace.startswith(':') else namespace
+
+    return name.split('|')[-1]
+
+
+def get_asset_type(asset_node):
+    """
+    Returns the type (category) of the given asset node
+    :param asset_node: ArtellaAssetNode
+    :return: str
+    """
+
+    asset = getattr(asset_node, 'asset', None)
+    if asset is not None:
+        get_category = getattr(asset, 'get_category', None)
+        if get_category:
+            try:
+                return get_category() or ''
+            except Exception:
+                pass
+
+    return getattr(asset_node, 'category', None) or ''
+
+
+def get_asset_tags(asset_node):
+    """
+    Returns the tags of the given asset node
+    :param asset_node: ArtellaAssetNode
+    :return: list(str)
+    """
+
+    asset = getattr(asset_node, 'asset', None)
+    get_tags = getattr(asset, 'get_tags', None) if asset is not None else None
+    if get_tags:
+        try:
+            return list(get_tags() or list())
+        except Exception:
+            pass
+
+    return list(getattr(asset_node, 'tags', None) or list())
+
+
+def is_asset_proxy(asset_node):
+    """
+    Returns whether or not the given asset node has its proxy model loaded in the DCC
+    :param asset_node: ArtellaAssetNode
+    :return: bool
+    """
+
+    is_proxy = getattr(asset_node, 'is_proxy', None)
+    if callable(is_proxy):
+        try:
+            return bool(is_proxy())
+        except Exception:
+            return False
+
+    return bool(is_proxy)
+
+
+def get_asset_id(asset_node):
+    """
+    Returns the id of the asset the given node is an instance of
+    :param asset_node: ArtellaAssetNode
+    :return: str or None, None if the asset node does not reference any asset
+    """
+
+    asset = getattr(asset_node, 'asset', None)
+    if asset is None:
+        return None
+
+    for attr_name in ('get_id', 'get_name'):
+        fn = getattr(asset, attr_name, None)
+        if not fn:
+            continue
+        try:
+            asset_id = fn()
+        except Exception:
+            continue
+        if asset_id:
+            return str(asset_id)
+
+    return None
+
+
+def get_asset_key(display_name, asset_id=None):
+    """
+    Returns the key that identifies the asset a node is an instance of. Nodes that reference the same asset share the
+    same key. If the asset id is not known, key is computed from the display name of the node
+    :param display_name: str, name used to display the asset node
+    :param asset_id: str or None, id of the asset the node is an instance of (see get_asset_id)
+    :return: str
+    """
+
+    if asset_id:
+        return asset_id
+
+    return re.sub(r'[_]?\d+$', '', display_name) or display_name
+
+
+def group_records(asset_records):
+    """
+    Groups given records by the asset they are an instance of
+    :param asset_records: list(AssetRecord)
+    :return: OrderedDict(int, list(AssetRecord)), dictionary that maps group ids with their records
+    """
+
+    groups = OrderedDict()
+    for record in asset_records:
+        groups.setdefault(record.group_id, list()).append(record)
+
+    return groups
+
+
+class AssetRecord(object):
+    """
+    Compact representation of a scene asset. Records do not hold any reference to Qt widgets or to the wrapped
+    asset node, so they can be stored in large numbers and read by views, search and bulk operations
+    Records only reference the table that owns them, so flag changes are notified to the table observers
+    """
+
+    __slots__ = (
+        'index', 'id', 'short_name', 'namespace', 'node', 'type_id', 'group_id', 'flags', 'override_ids', 'table')
+
+    def __init__(self, index, asset_id, short_name, namespace, node, type_id=0, group_id=0, flags=DEFAULT_FLAGS,
+                 override_ids=()):
+
+        self.index = index
+        self.id = asset_id
+        self.short_name = short_name
+        self.namespace = namespace
+        self.node = node
+        self.type_id = type_id
+        self.group_id = group_id
+        self.flags = flags
+        self.override_ids = override_ids
+        self.table = None
+
+    def __repr__(self):
+        return '<AssetRecord {} ({})>'.format(self.id, self.namespace)
+
+    @property
+    def name(self):
+        """
+        Returns the name used to display the record
+        :return: str
+        """
+
+        return self.namespace
+
+    def has_flag(self, flag):
+        """
+        Returns whether or not given flag is enabled in this record
+        :param flag: int
+        :return: bool
+        """
+
+        return bool(self.flags & flag)
+
+    def set_flag(self, flag, state):
+        """
+        Enables or disables given flag in this record, notifying the table that owns the record
+        :param flag: int
+        :param state: bool
+        """
+
+        if self.table is not None:
+            self.table.set_flag(self, flag, state)
+        elif state:
+            self.flags |= flag
+        else:
+            self.flags &= ~flag
+
+
+class AssetRecordTable(object):
+    """
+    Table that stores asset records of an outliner in flat arrays
+    Record types and override names are interned so records only store small integers
+    """
+
+    def __init__(self):
+
+        self._records = list()
+        self._nodes = list()
+        self._by_id = dict()
+        self._type_names = ['']
+        self._type_ids = {'': 0}
+        self._override_names = list()
+        self._override_ids = dict()
+        self._group_keys = list()
+        self._group_ids = dict()
+        self._observers = list()
+
+    def __len__(self):
+        return len(self._records)
+
+    def __iter__(self):
+        return iter(self._records)
+
+    def __contains__(self, record_id):
+        return record_id in self._by_id
+
+    @property
+    def type_names(self):
+        """
+        Returns list of interned type names. The index of each type name is its type id
+        :return: list(str)
+        """
+
+        return self._type_names
+
+    def add_observer(self, observer):
+        """
+        Registers an object that is notified each time records are added or removed (records_changed function) and
+        each time the flags of a record change (record_flags_changed function)
+        :param observer: object
+        """
+
+        if observer not in self._observers:
+            self._observers.append(observer)
+
+    def remove_observer(self, observer):
+        """
+        Unregisters given observer
+        :param observer: object
+        """
+
+        if observer in self._observers:
+            self._observers.remove(observer)
+
+    def add(self, asset_node, namespace=None, flags=DEFAULT_FLAGS, asset_snapshot=None):
+        """
+        Creates a new record for the given asset node and stores it in the table
+        :param asset_node: ArtellaAssetNode
+        :param namespace: str or None, namespace of the asset node
+        :param flags: int, initial flags of the record
+        :param asset_snapshot: AssetSnapshot or None, if given, asset node properties are read from it
+        :return: AssetRecord
+        """
+
+        if asset_snapshot is not None:
+            short_name, node, asset_type = asset_snapshot.short_name, asset_snapshot.node, asset_snapshot.category
+            asset_id = asset_snapshot.asset_id
+        else:
+            short_name, node, asset_type = asset_node.get_short_name(), asset_node.node, get_asset_type(asset_node)
+            asset_id = get_asset_id(asset_node)
+        display_name = get_display_name(short_name, namespace)
+        record = AssetRecord(
+            index=len(self._records), asset_id=asset_node.id, short_name=short_name,
+            namespace=display_name, node=node, type_id=self.type_id(asset_type),
+            group_id=self.group_id(get_asset_key(display_name, asset_id)), flags=flags)
+
+        if record.id in self._by_id:
+            self.remove(record.id)
+            record.index = len(self._records)
+
+        record.table = self
+        self._records.append(record)
+        self._nodes.append(asset_node)
+        self._by_id[record.id] = record
+        self._notify_records_changed()
+
+        return record
+
+    def remove(self, record_id):
+        """
+        Removes the record with given id from the table
+        Last record of the table is moved into the removed slot, so removal does not shift the arrays
+        :param record_id: str
+        :return: AssetRecord or None
+        """
+
+        record = self._by_id.pop(record_id, None)
+        if record is None:
+            return None
+
+        index = record.index
+        last_record = self._records.pop()
+        last_node = self._nodes.pop()
+        if last_record is not record:
+            last_record.index = index
+            self._records[index] = last_record
+            self._nodes[index] = last_node
+        record.table = None
+        self._notify_records_changed()
+
+        return record
+
+    def clear(self):
+        """
+        Removes all the records of the table
+        """
+
+        for record in self._records:
+            record.table = None
+        del self._records[:]
+        del self._nodes[:]
+        self._by_id.clear()
+        self._notify_records_changed()
+
+    def get(self, record_id, default=None):
+        """
+        Returns record with given id
+        :param record_id: str
+        :param default: object, value returned if no record is found
+        :return: AssetRecord
+        """
+
+        return self._by_id.get(record_id, default)
+
+    def get_node(self, record):
+        """
+        Returns asset node wrapped by given record
+        :param record: AssetRecord
+        :return: ArtellaAssetNode
+        """
+
+        return self._nodes[record.index]
+
+    def type_id(self, type_name):
+        """
+        Returns the type id of the given type name, registering it if necessary
+        :param type_name: str
+        :return: int
+        """
+
+        type_name = (type_name or '').lower()
+        type_id = self._type_ids.get(type_name)
+        if type_id is None:
+            type_id = len(self._type_names)
+            self._type_names.append(type_name)
+            self._type_ids[type_name] = type_id
+
+        return type_id
+
+    def type_name(self, type_id):
+        """
+        Returns the type name of the given type id
+        :param type_id: int
+        :return: str
+        """
+
+        return self._type_names[type_id]
+
+    def group_id(self, group_key):
+        """
+        Returns the group id of the given asset key, registering it if necessary
+        :param group_key: str
+        :return: int
+        """
+
+        group_id = self._group_ids.get(group_key)
+        if group_id is None:
+            group_id = len(self._group_keys)
+            self._group_keys.append(group_key)
+            self._group_ids[group_key] = group_id
+
+        return group_id
+
+    def group_key(self, group_id):
+        """
+        Returns the asset key of the given group id
+        :param group_id: int
+        :return: str
+        """
+
+        return self._group_keys[group_id]
+
+    def override_id(self, override_name):
+        """
+        Returns the id of the given override name, registering it if necessary
+        :param override_name: str
+        :return: int
+        """
+
+        override_id = self._override_ids.get(override_name)
+        if override_id is None:
+            override_id = len(self._override_names)
+            self._override_names.append(override_name)
+            self._override_ids[override_name] = override_id
+
+        return override_id
+
+    def override_name(self, override_id):
+        """
+        Returns the override name of the given override id
+        :param override_id: int
+        :return: str
+        """
+
+        return self._override_names[override_id]
+
+    def set_overrides(self, record, override_names):
+        """
+        Updates the overrides stored in the given record
+        :param record: AssetRecord
+        :param override_names: list(str)
+        """
+
+        record.override_ids = tuple(self.override_id(override_name) for override_name in override_names)
+        self.set_flag(record, FLAG_HAS_OVERRIDE, bool(record.override_ids))
+
+    def set_flag(self, record, flag, state):
+        """
+        Enables or disables given flag in the given record
+        :param record: AssetRecord
+        :param flag: int
+        :param state: bool
+        """
+
+        flags = record.flags | flag if state else record.flags & ~flag
+        if flags == record.flags:
+            return
+
+        record.flags = flags
+        if record.table is self:
+            for observer in self._observers:
+                observer.record_flags_changed(record)
+
+    def find(self, predicate):
+        """
+        Returns all records that match given predicate
+        :param predicate: fn, function that receives an AssetRecord and returns a bool
+        :return: list(AssetRecord)
+        """
+
+        return [record for record in self._records if predicate(record)]
+
+    def with_flags(self, flags, state=True):
+        """
+        Returns all records that have (or have not) all given flags enabled
+        :param flags: int
+        :param state: bool
+        :return: list(AssetRecord)
+        """
+
+        return [record for record in self._records if ((record.flags & flags) == flags) == state]
+
+    def _notify_records_changed(self):
+        """
+        Internal function that notifies observers that records were added or removed
+        """
+
+        for observer in self._observers:
+            observer.records_changed()
@@ -0,0 +1,199 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains immutable snapshots of the asset node properties used by Artella Outliner
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import logging
+from collections import namedtuple
+
+from artellapipe.tools.outliner.core import records, overrides
+
+LOGGER = logging.getLogger()
+
+AssetSnapshot = namedtuple(
+    'AssetSnapshot', ['id', 'name', 'short_name', 'node', 'category', 'tags', 'asset_id', 'override_names'])
+
+
+def _get_property(asset_node, attr_name, default=None):
+    """
+    Internal function that returns the value of the given asset node property (or getter function)
+    :param asset_node: ArtellaAssetNode
+    :param attr_name: str
+    :param default: object, value returned if the property cannot be retrieved
+    :return: object
+    """
+
+    try:
+        value = getattr(asset_node, attr_name, default)
+        if callable(value):
+            value = value()
+    except Exception as exc:
+        LOGGER.debug('Impossible to retrieve "{}" of asset node {} | {}'.format(attr_name, asset_node, exc))
+        return default
+
+    return value
+
+
+def take_snapshot(asset_node, override_names=()):
+    """
+    Returns a snapshot of the properties of the given asset node
+    :param asset_node: ArtellaAssetNode
+    :param override_names: tuple(str) or None, names of the overrides of the asset node. None if the overrides of the
+        asset node were not collected yet
+    :return: AssetSnapshot
+    """
+
+    short_name = _get_property(asset_node, 'get_short_name') or ''
+
+    return AssetSnapshot(
+        id=asset_node.id, name=_get_property(asset_node, 'name') or short_name, short_name=short_name,
+        node=_get_property(asset_node, 'node'), category=records.get_asset_type(asset_node),
+        tags=tuple(records.get_asset_tags(asset_node)), asset_id=records.get_asset_id(asset_node),
+        override_names=tuple(override_names) if override_names is not None else None)
+
+
+class AssetSnapshotCache(object):
+    """
+    Caches the snapshots of the scene asset nodes during a refresh cycle
+    Snapshots are captured the first time each asset is displayed and invalidated one by one when scene changes,
+    so DCC and file system are only queried once per asset and refresh cycle
+    """
+
+    def __init__(self, overrides_cache=None):
+
+        self._overrides_cache = overrides_cache
+        self._snapshots = dict()
+
+    def __len__(self):
+        return len(self._snapshots)
+
+    def __contains__(self, asset_id):
+        return asset_id in self._snapshots
+
+    def capture(self, asset_nodes, collect_overrides=True):
+        """
+        Captures the snapshots of the given asset nodes that are not cached yet
+        :param asset_nodes: list(ArtellaAssetNode)
+        :param collect_overrides: bool, whether or not to collect the overrides of the asset nodes. If False, override
+            names of new snapshots are None until collect_overrides function is called
+        :return: list(AssetSnapshot), snapshots of the given asset nodes
+        """
+
+        for asset_node in asset_nodes:
+            if asset_node.id not in self._snapshots:
+                self._snapshots[asset_node.id] = take_snapshot(asset_node, override_names=None)
+        if collect_overrides:
+            self.collect_overrides(asset_nodes)
+
+        return [self._snapshots[asset_node.id] for asset_node in asset_nodes]
+
+    def collect_overrides(self, asset_nodes):
+        """
+        Collects the overrides of the given asset nodes whose snapshots do not store them yet
+        :param asset_nodes: list(ArtellaAssetNode)
+        :return: list(AssetSnapshot), snapshots of the given asset nodes
+        """
+
+        asset_snapshots = [self.get(asset_node, collect_overrides=False) for asset_node in asset_nodes]
+        missing_nodes = [
+            asset_node for asset_node, asset_snapshot in zip(asset_nodes, asset_snapshots)
+            if asset_snapshot.override_names is None]
+        if not missing_nodes:
+            return asset_snapshots
+
+        scene_overrides = self._get_overrides_cache().collect(missing_nodes)
+        for asset_node in missing_nodes:
+            asset_snapshot = self._snapshots[asset_node.id]
+            node_overrides = scene_overrides.get(asset_snapshot.node, ())
+            self._snapshots[asset_node.id] = asset_snapshot._replace(
+                override_names=tuple(override.OVERRIDE_NAME for override in node_overrides))
+
+        return [self._snapshots[asset_node.id] for asset_node in asset_nodes]
+
+    def get(self, asset_node, collect_overrides=True):
+        """
+        Returns the snapshot of the given asset node, capturing it if necessary
+        :param asset_node: ArtellaAssetNode
+        :param collect_overrides: bool, whether or not to collect the overrides of the asset node if necessary
+        :return: AssetSnapshot
+        """
+
+        asset_snapshot = self._snapshots.get(asset_node.id)
+        if asset_snapshot is None or (collect_overrides and asset_snapshot.override_names is None):
+            asset_snapshot = self.capture([asset_node], collect_overrides=collect_overrides)[0]
+
+        return asset_snapshot
+
+    def update(self, asset_id, **properties):
+        """
+        Replaces the given properties of the cached snapshot of the asset with given id
+        :param asset_id: str
+        :param properties: dict, properties to replace
+        :return: AssetSnapshot or None
+        """
+
+        asset_snapshot = self._snapshots.get(asset_id)
+        if asset_snapshot is None:
+            return None
+
+        asset_snapshot = self._snapshots[asset_id] = asset_snapshot._replace(**properties)
+
+        return asset_snapshot
+
+    def invalidate(self, asset_id):
+        """
+        Discards the snapshot (and cached overrides) of the asset with given id. It will be captured again the next
+        time it is requested
+        :param asset_id: str
+        """
+
+        asset_snapshot = self._snapshots.pop(asset_id, None)
+        if asset_snapshot is not None and asset_snapshot.node:
+            self._get_overrides_cache().invalidate(asset_snapshot.node)
+
+    def clear(self):
+        """
+        Discards all cached snapshots
+        """
+
+        self._snapshots.clear()
+
+    def _get_overrides_cache(self):
+        """
+        Internal function that returns the cache used to retrieve the overrides of the asset nodes
+        :return: SceneOverridesCache
+        """
+
+        return self._overrides_cache if self._overrides_cache is not None else overrides.get_scene_cache()
+
+
+_CACHE = AssetSnapshotCache()
+
+
+def get_cache():
+    """
+    Returns the asset snapshot cache of the current session
+    :return: AssetSnapshotCache
+    """
+
+    return _CACHE
+
+
+def get_snapshot(asset_node, collect_overrides=True):
+    """
+    Returns the snapshot of the given asset node from the snapshot cache of the current session
+    :param asset_node: ArtellaAssetNode
+    :param collect_overrides: bool, whether or not to collect the overrides of the asset node if necessary
+    :return: AssetSnapshot
+    """
+
+    return _CACHE.get(asset_node, collect_overrides=collect_overrides)
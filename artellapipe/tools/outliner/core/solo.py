@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains visibility snapshots used by Artella Outliner solo mode
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+from artellapipe.tools.outliner.core import records
+
+
+class VisibilitySnapshot(object):
+    """
+    Stores the visibility of a list of DCC nodes as a packed bit array (one bit per node)
+    """
+
+    __slots__ = ('nodes', 'bits', 'targets')
+
+    def __init__(self, nodes, visibility, targets=()):
+
+        self.nodes = tuple(nodes)
+        self.targets = frozenset(targets)
+        self.bits = bytearray((len(self.nodes) + 7) // 8)
+        for i, visible in enumerate(visibility):
+            if visible:
+                self.bits[i >> 3] |= 1 << (i & 7)
+
+    def __len__(self):
+        return len(self.nodes)
+
+    @classmethod
+    def from_records(cls, asset_records, targets=()):
+        """
+        Creates a new snapshot from the visibility flags of the given records, so no DCC query is needed
+        Records sharing the same DCC node are stored only once
+        :param asset_records: list(AssetRecord)
+        :param targets: list(str), DCC nodes that are soloed
+        :return: VisibilitySnapshot
+        """
+
+        nodes = list()
+        visibility = list()
+        found_nodes = set()
+        for record in asset_records:
+            if not record.node or record.node in found_nodes:
+                continue
+            found_nodes.add(record.node)
+            nodes.append(record.node)
+            visibility.append(record.has_flag(records.FLAG_VISIBLE))
+
+        return cls(nodes, visibility, targets=targets)
+
+    def is_visible(self, index):
+        """
+        Returns whether or not node stored in the given index was visible when the snapshot was taken
+        :param index: int
+        :return: bool
+        """
+
+        return bool(self.bits[index >> 3] & (1 << (index & 7)))
+
+    def solo_plan(self):
+        """
+        Returns the nodes that must be hidden and shown to solo the snapshot targets
+        :return: tuple(list(str), list(str)), nodes to hide and nodes to show
+        """
+
+        to_hide = list()
+        to_show = list()
+        for i, node in enumerate(self.nodes):
+            is_visible = self.is_visible(i)
+            if node in self.targets:
+                if not is_visible:
+                    to_show.append(node)
+            elif is_visible:
+                to_hide.append(node)
+
+        return to_hide, to_show
+
+    def restore_plan(self):
+        """
+        Returns the nodes that must be hidden and shown to restore the visibility stored in the snapshot
+        :return: tuple(list(str), list(str)), nodes to hide and nodes to show
+        """
+
+        to_show, to_hide = self.solo_plan()
+
+        return to_hide, to_show
@@ -0,0 +1,227 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains sort keys and sorted indices used to order Artella Outliner items
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import bisect
+from collections import OrderedDict
+
+from artellapipe.tools.outliner.core import records
+
+DEFAULT_SORT_KEY = 'name'
+
+
+def _sort_by_name(record, record_table):
+    return (record.name.lower(), )
+
+
+def _sort_by_type(record, record_table):
+    return (record_table.type_name(record.type_id), record.name.lower())
+
+
+def _sort_by_namespace(record, record_table):
+    return ((record.namespace or '').lower(), record.short_name.lower())
+
+
+def _sort_by_visibility(record, record_table):
+    return (not record.has_flag(records.FLAG_VISIBLE), record.name.lower())
+
+
+def _sort_by_override_count(record, record_table):
+    return (-len(record.override_ids), record.name.lower())
+
+
+_SORT_KEYS = OrderedDict([
+    ('name', _sort_by_name),
+    ('type', _sort_by_type),
+    ('namespace', _sort_by_namespace),
+    ('visibility', _sort_by_visibility),
+    ('override count', _sort_by_override_count)
+])
+
+
+def register_sort_key(name, key_fn):
+    """
+    Registers a new sort key that can be used to order outliner items
+    :param name: str
+    :param key_fn: fn, function that receives an AssetRecord and its AssetRecordTable and returns a tuple
+    """
+
+    _SORT_KEYS[name] = key_fn
+
+
+def get_sort_key_names():
+    """
+    Returns the names of all registered sort keys
+    :return: list(str)
+    """
+
+    return list(_SORT_KEYS.keys())
+
+
+def get_sort_key(name):
+    """
+    Returns sort key function registered with the given name
+    :param name: str
+    :return: fn or None
+    """
+
+    return _SORT_KEYS.get(name)
+
+
+class ReversedKey(object):
+    """
+    Wraps a sort key inverting its order
+    """
+
+    __slots__ = ('key', )
+
+    def __init__(self, key):
+        self.key = key
+
+    def __lt__(self, other):
+        return other.key < self.key
+
+    def __gt__(self, other):
+        return other.key > self.key
+
+    def __eq__(self, other):
+        return self.key == other.key
+
+    def __ne__(self, other):
+        return self.key != other.key
+
+    def __le__(self, other):
+        return other.key <= self.key
+
+    def __ge__(self, other):
+        return other.key >= self.key
+
+
+class SortedIndex(object):
+    """
+    Keeps a list of items sorted by a key. Items are inserted with a binary search, so the list is never sorted again
+    while the sort key does not change. Items with equal keys keep their insertion order
+    """
+
+    def __init__(self, key_fn, reverse=False):
+
+        self._key_fn = key_fn
+        self._reverse = reverse
+        self._keys = list()
+        self._items = list()
+        self._item_keys = dict()
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __contains__(self, item):
+        return id(item) in self._item_keys
+
+    @property
+    def items(self):
+        """
+        Returns sorted items
+        :return: list
+        """
+
+        return self._items
+
+    def key(self, item):
+        """
+        Returns the sort key of the given item
+        :param item: object
+        :return: object
+        """
+
+        item_key = self._key_fn(item)
+
+        return ReversedKey(item_key) if self._reverse else item_key
+
+    def insert(self, item):
+        """
+        Inserts given item in its sorted position
+        :param item: object
+        :return: int, position where the item was inserted
+        """
+
+        item_key = self.key(item)
+        position = bisect.bisect_right(self._keys, item_key)
+        self._keys.insert(position, item_key)
+        self._items.insert(position, item)
+        self._item_keys[id(item)] = item_key
+
+        return position
+
+    def index(self, item):
+        """
+        Returns the position of the given item
+        :param item: object
+        :return: int, -1 if the item is not in the index
+        """
+
+        item_key = self._item_keys.get(id(item))
+        if item_key is None:
+            return -1
+
+        position = bisect.bisect_left(self._keys, item_key)
+        while position < len(self._items) and self._items[position] is not item:
+            position += 1
+
+        return position if position < len(self._items) else -1
+
+    def remove(self, item):
+        """
+        Removes given item from the index
+        :param item: object
+        :return: int, position the item was removed from or -1 if the item is not in the index
+        """
+
+        position = self.index(item)
+        if position == -1:
+            return position
+
+        self._keys.pop(position)
+        self._items.pop(position)
+        self._item_keys.pop(id(item), None)
+
+        return position
+
+    def clear(self):
+        """
+        Removes all the items of the index
+        """
+
+        del self._keys[:]
+        del self._items[:]
+        self._item_keys.clear()
+
+    def reset(self, items, key_fn=None, reverse=None):
+        """
+        Sorts again all the given items, optionally with a new sort key
+        :param items: list
+        :param key_fn: fn or None
+        :param reverse: bool or None
+        """
+
+        if key_fn is not None:
+            self._key_fn = key_fn
+        if reverse is not None:
+            self._reverse = reverse
+
+        sorted_items = sorted(((self.key(item), index, item) for index, item in enumerate(items)), key=lambda x: x[:2])
+        self._keys = [item_key for item_key, _, _ in sorted_items]
+        self._items = [item for _, _, item in sorted_items]
+        self._item_keys = dict((id(item), item_key) for item_key, _, item in sorted_items)
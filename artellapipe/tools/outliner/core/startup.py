@@ -0,0 +1,193 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains the progressive startup sequence of Artella Outliner
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import time
+import logging
+from collections import OrderedDict
+
+LOGGER = logging.getLogger()
+
+
+class StartupSequence(object):
+    """
+    Runs the steps needed to populate the outliner one at a time, so the event loop can paint the tool between steps
+    Sequence measures the time spent since it started until the tool is painted for the first time and until the step
+    that makes the tool interactive is finished
+    """
+
+    def __init__(self, clock=None):
+
+        self._clock = clock or time.time
+        self._steps = list()
+        self._timings = OrderedDict()
+        self._start_time = None
+        self._time_to_first_paint = None
+        self._time_to_interactive = None
+
+    def __len__(self):
+        return len(self._steps)
+
+    @property
+    def is_running(self):
+        """
+        Returns whether or not the sequence has started and still has steps to run
+        :return: bool
+        """
+
+        return self._start_time is not None and bool(self._steps)
+
+    @property
+    def is_finished(self):
+        """
+        Returns whether or not all the steps of the sequence were run
+        :return: bool
+        """
+
+        return self._start_time is not None and not self._steps
+
+    @property
+    def is_interactive(self):
+        """
+        Returns whether or not the step that makes the tool interactive was already run
+        :return: bool
+        """
+
+        return self._time_to_interactive is not None
+
+    @property
+    def is_painted(self):
+        """
+        Returns whether or not the tool was already painted since the sequence started
+        :return: bool
+        """
+
+        return self._time_to_first_paint is not None
+
+    @property
+    def time_to_first_paint(self):
+        """
+        Returns the time (in seconds) spent since the sequence started until the tool was painted for the first time
+        :return: float or None
+        """
+
+        return self._time_to_first_paint
+
+    @property
+    def time_to_interactive(self):
+        """
+        Returns the time (in seconds) spent since the sequence started until the tool became interactive
+        :return: float or None
+        """
+
+        return self._time_to_interactive
+
+    @property
+    def timings(self):
+        """
+        Returns the time (in seconds) spent running each one of the finished steps
+        :return: OrderedDict(str, float)
+        """
+
+        return self._timings
+
+    def add_step(self, name, fn, interactive=False):
+        """
+        Appends a new step to the sequence
+        :param name: str
+        :param fn: fn, function called when the step is run
+        :param interactive: bool, whether or not the tool is interactive once this step is finished
+        """
+
+        self._steps.append((name, fn, interactive))
+
+    def start(self, start_time=None):
+        """
+        Starts the sequence. Steps must be run with run_next once the event loop is idle
+        :param start_time: float or None, time the tool started to be created. If not given, current time is used
+        """
+
+        self._timings.clear()
+        self._start_time = self._clock() if start_time is None else start_time
+        self._time_to_first_paint = None
+        self._time_to_interactive = None
+
+    def reset(self):
+        """
+        Removes all the steps of the sequence
+        """
+
+        del self._steps[:]
+        self._timings.clear()
+        self._start_time = None
+        self._time_to_first_paint = None
+        self._time_to_interactive = None
+
+    def mark_first_paint(self):
+        """
+        Records the time spent until the tool is painted for the first time. Following calls are ignored
+        :return: bool, True if the first paint was recorded; False otherwise
+        """
+
+        if self._start_time is None or self._time_to_first_paint is not None:
+            return False
+
+        self._time_to_first_paint = self._clock() - self._start_time
+
+        return True
+
+    def run_next(self):
+        """
+        Runs the next step of the sequence
+        :return: bool, True if there are more steps to run; False otherwise
+        """
+
+        if not self.is_running:
+            return False
+
+        name, fn, interactive = self._steps.pop(0)
+        step_start = self._clock()
+        try:
+            fn()
+        except Exception:
+            LOGGER.exception('Outliner startup step "{}" failed'.format(name))
+        step_end = self._clock()
+        self._timings[name] = step_end - step_start
+
+        if self._time_to_interactive is None and (interactive or not self._steps):
+            self._time_to_interactive = step_end - self._start_time
+
+        return bool(self._steps)
+
+    def run_all(self):
+        """
+        Runs all the pending steps of the sequence at once
+        """
+
+        while self.run_next():
+            pass
+
+    def report(self):
+        """
+        Returns a string with the time spent by each step of the sequence
+        :return: str
+        """
+
+        report = ['Outliner startup']
+        if self._time_to_first_paint is not None:
+            report.append('painted in {:.3f}s'.format(self._time_to_first_paint))
+        if self._time_to_interactive is not None:
+            report.append('interactive in {:.3f}s'.format(self._time_to_interactive))
+        report.append(', '.join('{}: {:.3f}s'.format(name, timing) for name, timing in self._timings.items()))
+
+        return ' | '.join(report)
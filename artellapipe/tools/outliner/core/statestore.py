@@ -0,0 +1,211 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains columnar state store used to run bulk queries over outliner assets
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from artellapipe.tools.outliner.core import records
+
+LOD_HIRES = 0
+LOD_PROXY = 1
+
+
+class AssetStateStore(object):
+    """
+    Stores the state of the assets of an AssetRecordTable as columns. If NumPy is available, columns are NumPy arrays
+    and queries are resolved with vectorized boolean masks; otherwise plain Python lists are used
+    Store observes its table: flag changes update the columns of the record in place, and columns are only rebuilt
+    when records are added or removed
+    """
+
+    COLUMNS = ('category', 'visible', 'lod', 'selected', 'has_override', 'matches_filter')
+
+    def __init__(self, record_table, use_numpy=True):
+
+        self._table = record_table
+        self._use_numpy = bool(use_numpy and numpy is not None)
+        self._records = list()
+        self._columns = dict()
+        self._dirty = True
+        self._table.add_observer(self)
+        self.sync()
+
+    def __len__(self):
+        return len(self._records)
+
+    @property
+    def is_vectorized(self):
+        """
+        Returns whether or not store columns are NumPy arrays
+        :return: bool
+        """
+
+        return self._use_numpy
+
+    def column(self, name):
+        """
+        Returns the column with the given name
+        :param name: str
+        :return: numpy.ndarray or list
+        """
+
+        self.sync()
+
+        return self._columns[name]
+
+    @property
+    def is_dirty(self):
+        """
+        Returns whether or not records were added or removed since the columns were last built
+        :return: bool
+        """
+
+        return self._dirty
+
+    def records_changed(self):
+        """
+        Function called by the records table when records are added or removed
+        Columns are rebuilt the next time the store is queried
+        """
+
+        self._dirty = True
+
+    def record_flags_changed(self, record):
+        """
+        Function called by the records table when the flags of a record change
+        Columns of the record are updated in place
+        :param record: AssetRecord
+        """
+
+        if self._dirty:
+            return
+
+        flags = record.flags
+        index = record.index
+        self._columns['visible'][index] = bool(flags & records.FLAG_VISIBLE)
+        self._columns['lod'][index] = LOD_PROXY if flags & records.FLAG_PROXY else LOD_HIRES
+        self._columns['selected'][index] = bool(flags & records.FLAG_SELECTED)
+        self._columns['has_override'][index] = bool(flags & records.FLAG_HAS_OVERRIDE)
+        self._columns['matches_filter'][index] = bool(flags & records.FLAG_MATCHES_FILTER)
+
+    def sync(self):
+        """
+        Rebuilds the columns of the store if records were added or removed since they were last built
+        """
+
+        if self._dirty:
+            self.rebuild()
+
+    def rebuild(self):
+        """
+        Rebuilds the columns of the store from the current state of the records table
+        """
+
+        self._dirty = False
+        self._records = list(self._table)
+        total_records = len(self._records)
+        if self._use_numpy:
+            flags = numpy.fromiter((record.flags for record in self._records), dtype=numpy.uint8, count=total_records)
+            self._columns = {
+                'category': numpy.fromiter(
+                    (record.type_id for record in self._records), dtype=numpy.int16, count=total_records),
+                'visible': (flags & records.FLAG_VISIBLE) != 0,
+                'lod': ((flags & records.FLAG_PROXY) != 0).astype(numpy.int8),
+                'selected': (flags & records.FLAG_SELECTED) != 0,
+                'has_override': (flags & records.FLAG_HAS_OVERRIDE) != 0,
+                'matches_filter': (flags & records.FLAG_MATCHES_FILTER) != 0
+            }
+        else:
+            self._columns = {
+                'category': [record.type_id for record in self._records],
+                'visible': [record.has_flag(records.FLAG_VISIBLE) for record in self._records],
+                'lod': [LOD_PROXY if record.has_flag(records.FLAG_PROXY) else LOD_HIRES for record in self._records],
+                'selected': [record.has_flag(records.FLAG_SELECTED) for record in self._records],
+                'has_override': [record.has_flag(records.FLAG_HAS_OVERRIDE) for record in self._records],
+                'matches_filter': [record.has_flag(records.FLAG_MATCHES_FILTER) for record in self._records]
+            }
+
+    def mask(self, types=None, visible=None, lod=None, selected=None, has_override=None, matches_filter=None):
+        """
+        Returns a boolean mask with the assets that match all the given criteria
+        Criteria that are None are ignored
+        :param types: list(str) or None, asset types the assets must belong to
+        :param visible: bool or None
+        :param lod: int or None, LOD_HIRES or LOD_PROXY
+        :param selected: bool or None
+        :param has_override: bool or None
+        :param matches_filter: bool or None
+        :return: numpy.ndarray or list(bool)
+        """
+
+        self.sync()
+        criteria = [
+            ('visible', visible), ('lod', lod), ('selected', selected),
+            ('has_override', has_override), ('matches_filter', matches_filter)]
+        type_ids = None
+        if types is not None:
+            type_names = set(type_name.lower() for type_name in types)
+            type_ids = [type_id for type_id, type_name in enumerate(self._table.type_names) if type_name in type_names]
+
+        if self._use_numpy:
+            result = numpy.ones(len(self._records), dtype=bool)
+            if type_ids is not None:
+                result &= numpy.isin(self._columns['category'], type_ids)
+            for column_name, value in criteria:
+                if value is not None:
+                    result &= self._columns[column_name] == value
+            return result
+
+        result = [True] * len(self._records)
+        if type_ids is not None:
+            type_ids = set(type_ids)
+            result = [valid and type_id in type_ids for valid, type_id in zip(result, self._columns['category'])]
+        for column_name, value in criteria:
+            if value is not None:
+                result = [valid and column_value == value for valid, column_value in zip(
+                    result, self._columns[column_name])]
+
+        return result
+
+    def records(self, mask):
+        """
+        Returns the records that are enabled in the given mask
+        :param mask: numpy.ndarray or list(bool)
+        :return: list(AssetRecord)
+        """
+
+        if self._use_numpy:
+            return [self._records[index] for index in numpy.flatnonzero(mask)]
+
+        return [record for record, valid in zip(self._records, mask) if valid]
+
+    def nodes(self, mask):
+        """
+        Returns the DCC node names of the records that are enabled in the given mask
+        :param mask: numpy.ndarray or list(bool)
+        :return: list(str)
+        """
+
+        return [record.node for record in self.records(mask) if record.node]
+
+    def select(self, **criteria):
+        """
+        Returns the records that match given criteria
+        :param criteria: dict, keyword arguments supported by mask function
+        :return: list(AssetRecord)
+        """
+
+        return self.records(self.mask(**criteria))
@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains workers to check asset files status in background threads
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import logging
+
+from Qt.QtCore import *
+
+from artellapipe.tools.outliner.core import filestatus
+
+LOGGER = logging.getLogger()
+
+
+class FileStatusSignals(QObject, object):
+
+    statusChecked = Signal(int, object)
+
+
+class FileStatusRunnable(QRunnable, object):
+    """
+    Runnable that checks the status of a batch of files
+    """
+
+    def __init__(self, generation, files, signals, cache):
+        super(FileStatusRunnable, self).__init__()
+
+        self._generation = generation
+        self._files = files
+        self._signals = signals
+        self._cache = cache
+
+    def run(self):
+        for file_path, published_path in self._files:
+            try:
+                file_status = self._cache.get_status(file_path, published_path=published_path)
+            except Exception as exc:
+                LOGGER.warning('Impossible to check status of file "{}" | {}'.format(file_path, exc))
+                continue
+            self._signals.statusChecked.emit(self._generation, file_status)
+
+
+class FileStatusChecker(QObject, object):
+    """
+    Checks the status of files in a thread pool and streams results back into the main thread as they finish
+    """
+
+    BATCH_SIZE = 16
+
+    statusChecked = Signal(object)
+
+    def __init__(self, max_threads=4, cache=None, parent=None):
+        super(FileStatusChecker, self).__init__(parent)
+
+        self._cache = cache or filestatus.get_cache()
+        self._generation = 0
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(max_threads)
+        self._signals = FileStatusSignals(self)
+        self._signals.statusChecked.connect(self._on_status_checked)
+
+    def check(self, files):
+        """
+        Queues the status check of the given files
+        :param files: list(tuple(str, str)), list of file paths and paths of their published versions
+        """
+
+        for i in range(0, len(files), self.BATCH_SIZE):
+            self._pool.start(FileStatusRunnable(
+                self._generation, files[i:i + self.BATCH_SIZE], self._signals, self._cache))
+
+    def cancel(self):
+        """
+        Cancels all queued checks. Results of checks that are already running are discarded
+        """
+
+        self._generation += 1
+        self._pool.clear()
+
+    def _on_status_checked(self, generation, file_status):
+        """
+        Internal callback function that is called each time a file status is checked in a worker thread
+        :param generation: int
+        :param file_status: FileStatus
+        """
+
+        if generation != self._generation:
+            return
+
+        self.statusChecked.emit(file_status)
@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains the queue used to destroy Artella Outliner widgets in small batches
+"""
+
+from __future__ import print_function, division, absolute_import
+
+__author__ = "Tomas Poveda"
+__license__ = "MIT"
+__maintainer__ = "Tomas Poveda"
+__email__ = "tpovedatd@gmail.com"
+
+import time
+from collections import deque
+
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_TIME_BUDGET = 0.004
+
+
+def _delete_widget(widget):
+    """
+    Internal function that destroys given widget immediately
+    Widgets are not destroyed with deleteLater, because deferred deletion would run outside the batch time budget.
+    Widgets already destroyed together with a parent destroyed in a previous batch are skipped
+    :param widget: QWidget
+    """
+
+    from Qt import QtCompat
+
+    if QtCompat.isValid(widget):
+        QtCompat.delete(widget)
+
+
+class TeardownQueue(object):
+    """
+    Queue of detached widgets waiting to be destroyed. Widgets are destroyed synchronously in batches bounded by
+    number of items and by time, so destroying thousands of widgets does not block the event loop
+    """
+
+    def __init__(self, destroy_fn=None, batch_size=DEFAULT_BATCH_SIZE, time_budget=DEFAULT_TIME_BUDGET, clock=None):
+
+        self._destroy_fn = destroy_fn or _delete_widget
+        self._batch_size = batch_size
+        self._time_budget = time_budget
+        self._clock = clock or time.time
+        self._queue = deque()
+
+    def __len__(self):
+        return len(self._queue)
+
+    @property
+    def is_empty(self):
+        """
+        Returns whether or not there are widgets waiting to be destroyed
+        :return: bool
+        """
+
+        return not self._queue
+
+    def schedule(self, widgets):
+        """
+        Adds given widgets to the queue. Widgets must be already detached from the visible widget hierarchy
+        :param widgets: list(QWidget)
+        """
+
+        self._queue.extend(widgets)
+
+    def run_batch(self):
+        """
+        Destroys next batch of widgets
+        :return: int, number of destroyed widgets
+        """
+
+        destroyed = 0
+        start_time = self._clock()
+        while self._queue and destroyed < self._batch_size:
+            self._destroy_fn(self._queue.popleft())
+            destroyed += 1
+            if self._time_budget and self._clock() - start_time >= self._time_budget:
+                break
+
+        return destroyed
+
+    def flush(self):
+        """
+        Destroys all queued widgets
+        :return: int, number of destroyed widgets
+        """
+
+        destroyed = len(self._queue)
+        while self._queue:
+            self._destroy_fn(self._queue.popleft())
+
+        return destroyed
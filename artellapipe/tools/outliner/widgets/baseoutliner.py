@@ -14,6 +14,7 @@ __email__ = "tpovedatd@gmail.com"
 
 import logging.config
 from functools import partial
+from collections import OrderedDict
 
 from Qt.QtCore import *
 from Qt.QtWidgets import *
@@ -21,8 +22,8 @@ from Qt.QtGui import *
 
 import tpDcc as tp
 
-import artellapipe
-from artellapipe.tools.outliner.core import outlinertree
+from artellapipe.tools.outliner.core import outlinertree, outlineritems, records, statestore, solo, overrides
+from artellapipe.tools.outliner.core import assetindex, query, itempool, bulk, snapshot
 from artellapipe.tools.outliner.widgets import items
 
 LOGGER = logging.getLogger()
@@ -34,43 +35,539 @@ class BaseOutliner(outlinertree.OutlinerTree, object):
     """
 
     OUTLINER_ITEM = items.OutlinerAssetItem
+    ITEM_POOL_SIZE = itempool.DEFAULT_POOL_SIZE
+    FILE_ITEMS = {
+        'model': items.OutlinerModelFileItem
+    }
 
     def __init__(self, project, parent=None):
+
+        self._solo_snapshot = None
+        self._solo_scope = list()
+        self._context_menu = None
+        self._context_records = list()
+        self._override_actions = dict()
+        self._file_items = dict()
+        self._group_items = dict()
+        self._item_pool = itempool.ItemPool(max_size=self.ITEM_POOL_SIZE)
+        self._file_status_checker = None
+
         super(BaseOutliner, self).__init__(project=project, parent=parent)
 
+    @property
+    def is_soloed(self):
+        """
+        Returns whether or not solo mode is enabled in this outliner
+        :return: bool
+        """
+
+        return self._solo_snapshot is not None
+
+    @property
+    def item_pool(self):
+        """
+        Returns the pool used to recycle the item widgets of the outliner
+        :return: ItemPool
+        """
+
+        return self._item_pool
+
+    def get_file_widget_by_category(self, category, file_path=None, parent=None):
+        """
+        Returns a new file item widget for the given asset file category
+        :param category: str
+        :param file_path: str or None
+        :param parent: OutlinerAssetItem
+        :return: OutlinerFileItem or None
+        """
+
+        file_item_class = self.FILE_ITEMS.get(category, outlineritems.OutlinerFileItem)
+        if not file_item_class:
+            return None
+
+        return file_item_class(category=category, file_path=file_path, parent=parent)
+
+    def select_item(self, asset_id):
+        """
+        Overrides base OutlinerTree select_item function
+        If the asset is grouped, its group is expanded so the instance item is created
+        :param asset_id: str
+        """
+
+        record = self._records.get(asset_id)
+        if record is not None and asset_id not in self._items:
+            group_widget = self._group_items.get(record.group_id)
+            if group_widget:
+                self.expand_item(group_widget)
+
+        super(BaseOutliner, self).select_item(asset_id)
+
+    def clear_selection(self):
+        """
+        Overrides base OutlinerTree clear_selection function
+        """
+
+        super(BaseOutliner, self).clear_selection()
+
+        for group_widget in self._group_items.values():
+            if group_widget.is_selected:
+                group_widget.deselect()
+
     def _init(self):
-        assets = artellapipe.AssetsMgr().get_scene_assets(
-            allowed_types=self.CATEGORIES, allowed_tags=self.CATEGORIES) or list()
-        for asset in assets:
-            asset_widget = self.OUTLINER_ITEM(asset)
-            # asset_widget.overrideAdded.connect(self._on_override_added)
-            # asset_widget.overrideRemoved.connect(self._on_override_removed)
-            asset_widget.contextRequested.connect(self._on_show_context_menu)
-            asset_widget.clicked.connect(self._on_item_clicked)
-            asset_widget.viewToggled.connect(self._on_toggle_view)
-            self.append_widget(asset_widget)
-            self._widget_tree[asset_widget] = list()
-            overrides = asset.get_overrides()
-            if overrides:
-                for override in overrides:
-                    self._add_override(override=override, parent=asset_widget)
-
-        #     # self.callbacks.append(mayautils.MCallbackIdWrapper(asset_widget.add_asset_attributes_change_callback()))
-        #     asset_files = asset.get_asset_files()
-        #     asset_files['artella'] = None
-        #     for cat, file_path in asset_files.items():
-        #         file_widget = self.get_file_widget_by_category(category=cat, parent=asset_widget)
-        #         if file_widget is not None:
-        #             asset_widget.add_child(file_widget, category=cat)
-        #             self._widget_tree[asset_widget].append(file_widget)
-        #             if cat == 'model':
-        #                 file_widget.proxyHiresToggled.connect(self._on_toggle_proxy_hires)
-        #             elif cat == 'shading':
-        #                 pass
-        #             elif cat == 'groom':
-        #                 pass
-        #             elif cat == 'artella':
-        #                 pass
+        if self._file_status_checker is not None:
+            self._file_status_checker.cancel()
+        self._file_items.clear()
+        self._group_items.clear()
+        asset_index = assetindex.get_index()
+        asset_index.ensure_built()
+        assets = asset_index.get_nodes(asset_index.match_categories(self.CATEGORIES))
+
+        # When instances are grouped, DCC state and overrides are only read from the first instance of each group. The
+        # other instances are synchronized with the DCC when their group is expanded
+        group_instances = self.group_instances
+        asset_snapshots = snapshot.get_cache().capture(assets, collect_overrides=not group_instances)
+        for asset, asset_snapshot in zip(assets, asset_snapshots):
+            self._add_record(asset, asset_snapshot=asset_snapshot, sync=not group_instances)
+
+        if group_instances:
+            asset_groups = records.group_records(self._records).values()
+            for group_records in asset_groups:
+                self._sync_group_records(group_records)
+        else:
+            asset_groups = [[record] for record in self._records]
+        for group_records in asset_groups:
+            if len(group_records) > 1:
+                self.append_widget(self._create_group_item(group_records))
+            else:
+                self.append_widget(self._create_asset_item(group_records[0]))
+
+        LOGGER.debug('{}: {}'.format(self.NAME, self._item_pool.report()))
+
+    @items.bulk_mutation
+    def set_assets_visibility(self, asset_records, visible):
+        """
+        Shows or hides the DCC nodes of the given records with a single DCC call
+        :param asset_records: list(AssetRecord)
+        :param visible: bool
+        :return: list(AssetRecord), records whose visibility was changed
+        """
+
+        asset_records = [record for record in asset_records if record.node]
+        if not asset_records:
+            return list()
+
+        nodes = [record.node for record in asset_records]
+        if visible:
+            tp.Dcc.show_object(nodes)
+        else:
+            tp.Dcc.hide_object(nodes)
+
+        for outliner in [self] + self._solo_scope:
+            outliner.update_nodes_visibility(nodes, visible)
+
+        return asset_records
+
+    def update_nodes_visibility(self, nodes, visible):
+        """
+        Updates the visibility state stored in the records (and widgets) of the given DCC nodes
+        This function does not modify the DCC nodes
+        :param nodes: list(str)
+        :param visible: bool
+        """
+
+        nodes = set(nodes)
+        for record in self._records:
+            if record.node not in nodes:
+                continue
+            self._records.set_flag(record, records.FLAG_VISIBLE, visible)
+            asset_widget = self._items.get(record.id)
+            if not asset_widget or not asset_widget.display_buttons:
+                continue
+            if visible:
+                asset_widget.display_buttons.show()
+            else:
+                asset_widget.display_buttons.hide()
+
+        bulk.get_bulk_mutation().defer(('group_items', id(self)), self._update_group_items)
+
+    def _update_group_items(self):
+        """
+        Internal function that updates the state displayed by all the group items of the outliner
+        """
+
+        for group_widget in self._group_items.values():
+            self._update_group_item(group_widget)
+
+    def set_solo_scope(self, outliners=None):
+        """
+        Sets the outliners, other than this one, whose assets are hidden when an asset of this outliner is soloed
+        :param outliners: list(BaseOutliner) or None
+        """
+
+        self._solo_scope = [outliner for outliner in outliners or list() if outliner is not self]
+
+    @items.bulk_mutation
+    def solo(self, asset_records):
+        """
+        Hides all the assets of the outliner solo scope except the given ones
+        The previous visibility of the assets is read from the visibility flags of the records and stored so it can be
+        restored by unsolo function. DCC is only called to hide and show the nodes
+        :param asset_records: list(AssetRecord)
+        :return: bool
+        """
+
+        if self._solo_snapshot is not None:
+            self.unsolo()
+
+        scope_records = list(self._records)
+        for outliner in self._solo_scope:
+            scope_records.extend(outliner.records)
+
+        snapshot = solo.VisibilitySnapshot.from_records(
+            scope_records, targets=[record.node for record in asset_records if record.node])
+        if not snapshot.targets:
+            return False
+
+        to_hide, to_show = snapshot.solo_plan()
+        self._apply_visibility_plan(to_hide, to_show)
+        self._solo_snapshot = snapshot
+        self._update_solo_items()
+
+        return True
+
+    @items.bulk_mutation
+    def unsolo(self):
+        """
+        Restores the visibility the assets had before solo mode was enabled
+        :return: bool
+        """
+
+        if self._solo_snapshot is None:
+            return False
+
+        valid_nodes = set(record.node for record in self._records)
+        for outliner in self._solo_scope:
+            valid_nodes.update(record.node for record in outliner.records)
+        to_hide, to_show = self._solo_snapshot.restore_plan()
+        to_hide = [node for node in to_hide if node in valid_nodes]
+        to_show = [node for node in to_show if node in valid_nodes]
+        self._apply_visibility_plan(to_hide, to_show)
+        self._solo_snapshot = None
+        self._update_solo_items()
+
+        return True
+
+    def _apply_visibility_plan(self, to_hide, to_show):
+        """
+        Internal function that hides and shows given DCC nodes with a single DCC call for each list
+        :param to_hide: list(str)
+        :param to_show: list(str)
+        """
+
+        if to_hide:
+            tp.Dcc.hide_object(to_hide)
+        if to_show:
+            tp.Dcc.show_object(to_show)
+
+        for outliner in [self] + self._solo_scope:
+            if to_hide:
+                outliner.update_nodes_visibility(to_hide, False)
+            if to_show:
+                outliner.update_nodes_visibility(to_show, True)
+
+    def _update_solo_items(self):
+        """
+        Internal function that updates the solo state of the outliner items
+        """
+
+        targets = self._solo_snapshot.targets if self._solo_snapshot else frozenset()
+        for asset_widget in list(self._items.values()) + list(self._group_items.values()):
+            item_nodes = set(record.node for record in self._get_item_records(asset_widget))
+            asset_widget.set_solo(bool(item_nodes) and item_nodes.issubset(targets))
+
+    @items.bulk_mutation
+    def switch_assets_lod(self, asset_records, lod):
+        """
+        Switches the given records to proxy or hires within a single undo chunk
+        :param asset_records: list(AssetRecord)
+        :param lod: int, statestore.LOD_PROXY or statestore.LOD_HIRES
+        :return: list(AssetRecord), records whose LOD was changed
+        """
+
+        is_proxy = lod == statestore.LOD_PROXY
+        for record in asset_records:
+            asset_node = self._records.get_node(record)
+            if is_proxy:
+                asset_node.switch_to_proxy()
+            else:
+                asset_node.switch_to_hires()
+
+        nodes = [record.node for record in asset_records]
+        for outliner in [self] + self._solo_scope:
+            outliner.update_nodes_lod(nodes, lod)
+
+        return asset_records
+
+    def update_nodes_lod(self, nodes, lod):
+        """
+        Updates the LOD state stored in the records of the given DCC nodes
+        This function does not modify the DCC nodes
+        :param nodes: list(str)
+        :param lod: int, statestore.LOD_PROXY or statestore.LOD_HIRES
+        """
+
+        nodes = set(nodes)
+        for record in self._records:
+            if record.node in nodes:
+                self._records.set_flag(record, records.FLAG_PROXY, lod == statestore.LOD_PROXY)
+
+    @items.bulk_mutation
+    def add_assets_override(self, asset_records, override_name):
+        """
+        Adds the registered override with given name to the given records that do not have it yet within a single
+        undo chunk
+        :param asset_records: list(AssetRecord)
+        :param override_name: str
+        :return: bool
+        """
+
+        override = overrides.get_registry().get_override(override_name)
+        if not override:
+            return False
+
+        for record in asset_records:
+            if override_name not in self._get_record_override_names(record):
+                self._on_add_override(override, record)
+
+        return True
+
+    @items.bulk_mutation
+    def remove_assets_override(self, asset_records, override_name):
+        """
+        Removes the override with given name from the given records within a single undo chunk
+        :param asset_records: list(AssetRecord)
+        :param override_name: str
+        """
+
+        for record in asset_records:
+            for override in list(self._get_record_overrides(record)):
+                if override.OVERRIDE_NAME == override_name:
+                    self._on_remove_override(override, record)
+
+    @items.bulk_mutation
+    def select_assets(self, asset_records, add=False):
+        """
+        Selects the DCC nodes of the given records with a single DCC call
+        :param asset_records: list(AssetRecord)
+        :param add: bool, whether to add the records to current selection or not
+        """
+
+        if not add:
+            self.clear_selection()
+            tp.Dcc.clear_selection()
+
+        nodes = [record.node for record in asset_records if record.node]
+        if nodes:
+            tp.Dcc.select_object(nodes, add=True)
+
+        for record in asset_records:
+            asset_widget = self._items.get(record.id)
+            if asset_widget:
+                asset_widget.select()
+
+    def _create_asset_item(self, record, parent=None):
+        """
+        Internal function that creates the outliner item of the given record
+        :param record: AssetRecord
+        :param parent: OutlinerItem or None
+        :return: OutlinerAssetItem
+        """
+
+        asset_node = self._records.get_node(record)
+        asset_widget = self._item_pool.acquire(self.OUTLINER_ITEM)
+        if asset_widget is not None:
+            asset_widget.rebind(asset_node, record=record)
+        else:
+            asset_widget = self.OUTLINER_ITEM(asset_node, record=record, parent=parent)
+        if asset_widget.display_buttons and not record.has_flag(records.FLAG_VISIBLE):
+            asset_widget.display_buttons.hide()
+        if record.override_ids:
+            asset_widget.set_override_count(len(record.override_ids))
+
+        return asset_widget
+
+    def _create_group_item(self, group_records):
+        """
+        Internal function that creates an outliner item that groups all the given instances of the same asset
+        :param group_records: list(AssetRecord)
+        :return: OutlinerGroupItem
+        """
+
+        first_record = group_records[0]
+        group_item_class = items.get_group_item_class(self.OUTLINER_ITEM)
+        group_widget = group_item_class(
+            self._records.get_node(first_record), group_records=group_records,
+            group_name=self._records.group_key(first_record.group_id))
+        self._group_items[first_record.group_id] = group_widget
+        self._update_group_item(group_widget)
+
+        return group_widget
+
+    def _update_group_item(self, group_widget):
+        """
+        Internal function that updates the state displayed by the given group item from its records
+        :param group_widget: OutlinerGroupItem
+        """
+
+        if group_widget.display_buttons:
+            if any(record.has_flag(records.FLAG_VISIBLE) for record in group_widget.group_records):
+                group_widget.display_buttons.show()
+            else:
+                group_widget.display_buttons.hide()
+        group_widget.set_override_count(sum(len(record.override_ids) for record in group_widget.group_records))
+
+    def _get_item_records(self, item):
+        """
+        Internal function that returns the records represented by the given item
+        :param item: OutlinerAssetItem
+        :return: list(AssetRecord)
+        """
+
+        if isinstance(item, items.OutlinerGroupItem):
+            return list(item.group_records)
+
+        return [item.record] if item.record is not None else list()
+
+    def _add_record(self, asset_node, asset_snapshot=None, sync=True):
+        """
+        Internal function that creates the data record of the given asset node
+        :param asset_node: ArtellaAssetNode
+        :param asset_snapshot: AssetSnapshot or None, snapshot of the asset node properties
+        :param sync: bool, whether or not to read the DCC state and the overrides of the asset node
+        :return: AssetRecord
+        """
+
+        asset_snapshot = asset_snapshot or snapshot.get_cache().get(asset_node, collect_overrides=sync)
+        namespace = tp.Dcc.node_namespace(asset_snapshot.short_name, check_node=False)
+        record = self._records.add(asset_node, namespace=namespace, asset_snapshot=asset_snapshot)
+        if sync:
+            self._sync_record(record)
+
+        return record
+
+    def _sync_record(self, record, state_record=None):
+        """
+        Internal function that reads the DCC state and the overrides of the given record
+        :param record: AssetRecord
+        :param state_record: AssetRecord or None, if given, visibility and LOD are copied from this record instead of
+            being read from the DCC, and overrides are not read
+        """
+
+        if state_record is not None:
+            for flag in (records.FLAG_VISIBLE, records.FLAG_PROXY):
+                self._records.set_flag(record, flag, state_record.has_flag(flag))
+            return
+
+        asset_node = self._records.get_node(record)
+        if record.node and tp.Dcc.object_exists(record.node):
+            self._records.set_flag(record, records.FLAG_VISIBLE, tp.Dcc.node_is_visible(record.node))
+            self._records.set_flag(record, records.FLAG_PROXY, records.is_asset_proxy(asset_node))
+        asset_snapshot = snapshot.get_cache().get(asset_node)
+        self._records.set_overrides(record, asset_snapshot.override_names or ())
+        self._records.set_flag(record, records.FLAG_SYNCED, True)
+
+    def _sync_group_records(self, group_records):
+        """
+        Internal function that reads the DCC state and the overrides of the first record of the given group and
+        copies its visibility and LOD into the other records of the group that are not synchronized yet
+        :param group_records: list(AssetRecord)
+        """
+
+        first_record = group_records[0]
+        if not first_record.has_flag(records.FLAG_SYNCED):
+            self._sync_record(first_record)
+        for record in group_records[1:]:
+            if not record.has_flag(records.FLAG_SYNCED):
+                self._sync_record(record, state_record=first_record)
+
+    def _update_assets(self, removed_ids, added_nodes):
+        """
+        Overrides base OutlinerTree _update_assets function
+        Asset items are added and removed one by one. Grouped outliners are fully refreshed, because a single
+        asset can change the layout of its whole group
+        :param removed_ids: list(str)
+        :param added_nodes: list(ArtellaAssetNode)
+        :return: bool
+        """
+
+        if self.group_instances:
+            return False
+
+        for asset_id in removed_ids:
+            asset_widget = self._items.get(asset_id)
+            if asset_widget is not None:
+                self.remove_widget(asset_widget)
+            else:
+                self._records.remove(asset_id)
+
+        asset_snapshots = snapshot.get_cache().capture(added_nodes)
+        for asset_node, asset_snapshot in zip(added_nodes, asset_snapshots):
+            record = self._add_record(asset_node, asset_snapshot=asset_snapshot)
+            self.append_widget(self._create_asset_item(record))
+
+        return True
+
+    def _is_record_stale(self, record):
+        """
+        Internal function that returns whether or not the DCC node of the given record does not exist anymore
+        :param record: AssetRecord
+        :return: bool
+        """
+
+        return not record.node or not tp.Dcc.object_exists(record.node)
+
+    def _is_item_stale(self, item):
+        """
+        Overrides base OutlinerTree _is_item_stale function
+        :param item: OutlinerAssetItem
+        :return: bool
+        """
+
+        return any(self._is_record_stale(record) for record in self._get_item_records(item))
+
+    def _repair_items(self, stale_items):
+        """
+        Overrides base OutlinerTree _repair_items function
+        Records whose asset node now points to another existing DCC node are re-resolved and updated in place. The
+        other stale records are removed, together with their override items
+        :param stale_items: list(OutlinerAssetItem)
+        :return: list(str)
+        """
+
+        asset_index = assetindex.get_index()
+        snapshots_cache = snapshot.get_cache()
+        resolved_nodes = list()
+        removed_ids = list()
+        for item in stale_items:
+            for record in self._get_item_records(item):
+                if not self._is_record_stale(record):
+                    continue
+                # Live asset node is queried on purpose: its cached snapshot is the stale data being repaired
+                snapshots_cache.invalidate(record.id)
+                asset_node = self._records.get_node(record)
+                if asset_node.node and asset_node.node != record.node and tp.Dcc.object_exists(asset_node.node):
+                    resolved_nodes.append(asset_node)
+                else:
+                    removed_ids.append(record.id)
+                    asset_index.remove(record.id)
+
+        if removed_ids:
+            LOGGER.info('{}: removing {} assets that do not exist anymore'.format(self.NAME, len(removed_ids)))
+            self.remove_scene_assets(removed_ids)
+        if resolved_nodes:
+            self.add_scene_assets(resolved_nodes)
+
+        return removed_ids
 
     def _add_override(self, override, parent):
         """
@@ -79,13 +576,42 @@ class BaseOutliner(outlinertree.OutlinerTree, object):
         :param parent: OutlinerAssetItem
         """
 
-        override_widget = items.OutlinerOverrideItem(override=override, parent=parent)
-        override_widget.removed.connect(partial(self._on_override_removed, override, parent))
+        override_widget = self._item_pool.acquire(items.OutlinerOverrideItem)
+        if override_widget is not None:
+            override_widget.rebind(override)
+        else:
+            override_widget = items.OutlinerOverrideItem(override=override, parent=parent)
+            override_widget.removed.connect(partial(self._on_override_widget_removed, override_widget))
         parent.add_child(override_widget, name=override.OVERRIDE_NAME)
 
+    def _release_widget(self, asset_widget):
+        """
+        Overrides base OutlinerTree _release_widget function
+        Asset and override items are stored in the item pool so they can be rebound to other assets
+        :param asset_widget: OutlinerItem
+        :return: bool
+        """
+
+        if isinstance(asset_widget, (self.OUTLINER_ITEM, items.OutlinerGroupItem)):
+            for child_widget in asset_widget.take_children():
+                if not self._release_widget(child_widget):
+                    child_widget.deleteLater()
+
+        if type(asset_widget) not in (self.OUTLINER_ITEM, items.OutlinerOverrideItem):
+            return False
+        if not self._item_pool.release(asset_widget):
+            return False
+
+        # Pooled widgets must not be explicitly hidden, so layouts show them again when they are reused
+        asset_widget.setVisible(True)
+        asset_widget.setParent(None)
+
+        return True
+
     def _create_context_menu(self, menu, item):
         """
         Internal function that creates context menu for the given item
+        Called each time the context menu is shown. Actions added here are removed once the menu is closed
         :param menu: QMenu
         :param item: OutlinerItem
         """
@@ -97,14 +623,25 @@ class BaseOutliner(outlinertree.OutlinerTree, object):
             LOGGER.warning('Selected Asset is not valid!')
             return
 
-        asset_name = widget.asset_node.name
+        if isinstance(widget, items.OutlinerGroupItem):
+            item_state = widget.is_selected
+            is_modified = event.modifiers() == Qt.ControlModifier
+            if item_state:
+                self.select_assets(widget.group_records, add=is_modified)
+            elif not is_modified:
+                self.clear_selection()
+                tp.Dcc.clear_selection()
+            widget.set_select(item_state)
+            return
+
+        asset_name = widget.snapshot.name
         item_state = widget.is_selected
         if tp.Dcc.object_exists(asset_name):
             is_modified = event.modifiers() == Qt.ControlModifier
             if not is_modified:
                 tp.Dcc.clear_selection()
 
-            for asset_widget, file_items in self._widget_tree.items():
+            for asset_widget in list(self._items.values()) + list(self._group_items.values()):
                 if asset_widget != widget:
                     if is_modified:
                         if not asset_widget.is_selected:
@@ -114,7 +651,7 @@ class BaseOutliner(outlinertree.OutlinerTree, object):
                 else:
                     if is_modified and widget.is_selected:
                         asset_widget.select()
-                        tp.Dcc.select_object(asset_widget.asset_node.name, add=True)
+                        tp.Dcc.select_object(asset_widget.snapshot.name, add=True)
 
                     # else:
                     #     print('deslecting ...')
@@ -126,10 +663,15 @@ class BaseOutliner(outlinertree.OutlinerTree, object):
             if not is_modified:
                 tp.Dcc.select_object(asset_name)
         else:
-            self._on_refresh_outliner()
+            self.repair_items([widget])
 
     def _on_toggle_view(self, widget):
-        node_name = widget.asset_node.node
+        if isinstance(widget, items.OutlinerGroupItem):
+            is_visible = any(record.has_flag(records.FLAG_VISIBLE) for record in widget.group_records)
+            self.set_assets_visibility(widget.group_records, not is_visible)
+            return
+
+        node_name = widget.snapshot.node
         if tp.Dcc.object_exists(node_name):
             # main_control = widget.asset_node.get_main_control()
             # if main_control:
@@ -143,9 +685,44 @@ class BaseOutliner(outlinertree.OutlinerTree, object):
             if tp.Dcc.node_is_visible(node_name):
                 tp.Dcc.hide_object(node_name)
                 widget.display_buttons.hide()
+                is_visible = False
             else:
                 tp.Dcc.show_object(node_name)
                 widget.display_buttons.show()
+                is_visible = True
+            if widget.record is not None:
+                self._records.set_flag(widget.record, records.FLAG_VISIBLE, is_visible)
+                group_widget = self._group_items.get(widget.record.group_id)
+                if group_widget:
+                    self._update_group_item(group_widget)
+
+    def _on_item_view_pressed(self, item):
+        """
+        Overrides base OutlinerTree _on_item_view_pressed function
+        Alt + Click toggles solo mode of the item
+        :param item: OutlinerAssetItem
+        """
+
+        if QApplication.keyboardModifiers() & Qt.AltModifier:
+            solo = not item.is_solo
+            item.viewSolo.emit(item, solo)
+            self._on_toggle_solo(item, solo)
+        else:
+            item.viewToggled.emit(item)
+            self._on_toggle_view(item)
+
+    def _on_toggle_solo(self, widget, flag):
+        """
+        Internal callback function that is called when an item requests to enable or disable solo mode
+        :param widget: OutlinerAssetItem
+        :param flag: bool
+        """
+
+        item_records = self._get_item_records(widget)
+        if flag and item_records:
+            self.solo(item_records)
+        else:
+            self.unsolo()
 
     def _on_remove(self, item):
         """
@@ -157,120 +734,452 @@ class BaseOutliner(outlinertree.OutlinerTree, object):
             self.remove_widget(item)
             item.removed.emit(item)
 
-    def _create_add_override_menu(self, menu, item):
+    def _get_context_menu(self):
         """
-        Internal function that creates the add override menu
-        :param menu: QMenu
-        :return: bool
+        Internal function that returns the context menu of the outliner
+        Menu is created only once, the first time it is requested, and its actions are reused
+        :return: QMenu
         """
 
-        try:
-            registered_overrides = shotassembler.ShotAssembler.registered_overrides()
-        except Exception as exc:
-            LOGGER.error(exc)
-            return False
+        if self._context_menu is not None:
+            return self._context_menu
 
-        if not registered_overrides:
-            return False
+        self._context_menu = QMenu(self)
+        self._context_menu.setStyleSheet('background-color: rgb(68,68,68);')
+        self._add_override_menu = self._context_menu.addMenu(tp.ResourcesMgr().icon('add'), 'Add Override')
+        self._remove_override_menu = self._context_menu.addMenu(tp.ResourcesMgr().icon('delete'), 'Remove Override')
+        self._save_override_menu = self._context_menu.addMenu(tp.ResourcesMgr().icon('save'), 'Save Override')
+        self._save_overrides_separator = self._save_override_menu.addSeparator()
+        self._save_all_overrides_action = self._save_override_menu.addAction(tp.ResourcesMgr().icon('save'), 'All')
+        self._context_menu.addSeparator()
+        self._proxy_action = self._context_menu.addAction(tp.ResourcesMgr().icon('low_poly'), 'Switch to Proxy')
+        self._hires_action = self._context_menu.addAction(tp.ResourcesMgr().icon('high_poly'), 'Switch to Hires')
 
-        for override_name, override in registered_overrides.items():
-            override_action = QAction(override.OVERRIDE_ICON, override.OVERRIDE_NAME, menu)
-            if self._asset_node.has_override(override):
-                override_action.setEnabled(False)
-                override_action.setText('{} | Already added!'.format(override_action.text()))
-            override_action.triggered.connect(partial(self._on_add_override, override, item))
-            menu.addAction(override_action)
+        self._add_override_menu.triggered.connect(self._on_add_override_action)
+        self._remove_override_menu.triggered.connect(self._on_remove_override_action)
+        self._save_override_menu.triggered.connect(self._on_save_override_action)
+        self._save_all_overrides_action.triggered.connect(self._on_save_all_overrides_action)
+        self._proxy_action.triggered.connect(partial(self._on_switch_context_lod, statestore.LOD_PROXY))
+        self._hires_action.triggered.connect(partial(self._on_switch_context_lod, statestore.LOD_HIRES))
 
-        return True
+        return self._context_menu
 
-    def _create_remove_override_menu(self, menu, item):
+    def _update_context_menu(self, menu, items):
         """
-        Internal that creates the remove overrides menu
+        Internal function that updates the state of the context menu actions before showing it
+        Overrides to update custom context menu actions
         :param menu: QMenu
-        :return: bool
+        :param items: list(OutlinerItem), items the context menu is shown for
         """
 
-        node_overrides = item.asset_node.get_overrides()
-        if not node_overrides:
-            return False
+        pass
+
+    def _get_override_action(self, menu, override_name, override_icon):
+        """
+        Internal function that returns the pooled override action of the given menu, creating it if necessary
+        :param menu: QMenu
+        :param override_name: str
+        :param override_icon: QIcon
+        :return: QAction
+        """
 
-        for override in node_overrides:
-            override_action = QAction(override.OVERRIDE_ICON, override.OVERRIDE_NAME, menu)
-            override_action.triggered.connect(partial(self._on_remove_override, override, item))
-            menu.addAction(override_action)
+        actions_pool = self._override_actions.setdefault(menu, dict())
+        override_action = actions_pool.get(override_name)
+        if override_action is None:
+            override_action = QAction(override_icon, override_name, menu)
+            override_action.setData(override_name)
+            if menu is self._save_override_menu:
+                menu.insertAction(self._save_overrides_separator, override_action)
+            else:
+                menu.addAction(override_action)
+            actions_pool[override_name] = override_action
 
-        return True
+        return override_action
 
-    def _create_save_override_menu(self, menu, item):
+    def _get_record_overrides(self, record):
         """
-        Internal function that reates the save overrides menu
-        :param menu: QMenu
-        :return: bool
+        Internal function that returns the overrides of the given record
+        :param record: AssetRecord
+        :return: list(ArtellaBaseOverride)
         """
 
-        node_overrides = item.asset_node.get_overrides()
-        if not node_overrides:
-            return False
+        if not record.has_flag(records.FLAG_SYNCED):
+            self._sync_record(record)
 
-        added_overrides = list()
-        for override in node_overrides:
-            override_action = QAction(override.OVERRIDE_ICON, override.OVERRIDE_NAME, menu)
-            override_action.triggered.connect(partial(self._on_save_override, override, item))
-            added_overrides.append(override_action)
-            menu.addAction(override_action)
+        # Scene cache is shared by all the outliners, so it can be emptied by the refresh of another outliner after
+        # the record was synced. In that case, overrides of the record are collected again
+        scene_cache = overrides.get_scene_cache()
+        if record.node not in scene_cache:
+            scene_cache.collect([self._records.get_node(record)])
+            override_names = [override.OVERRIDE_NAME for override in scene_cache.get(record.node)]
+            self._records.set_overrides(record, override_names)
+            snapshot.get_cache().update(record.id, override_names=tuple(override_names))
 
-        if len(added_overrides) > 0:
-            menu.addSeparator()
-            save_all_overrides_action = QAction(resource.ResourceManager().icon('save'), 'All', menu)
-            save_all_overrides_action.triggered.connect(self._on_save_all_overrides, item)
-            menu.addAction(save_all_overrides_action)
+        return scene_cache.get(record.node)
 
-        return True
+    def _get_record_override_names(self, record):
+        """
+        Internal function that returns the names of the overrides of the given record
+        :param record: AssetRecord
+        :return: set(str)
+        """
+
+        return set(self._records.override_name(override_id) for override_id in record.override_ids)
+
+    def _update_override_menus(self, asset_records):
+        """
+        Internal function that updates the pooled override actions for the given records
+        :param asset_records: list(AssetRecord)
+        """
+
+        registered_overrides = overrides.get_registry().get_overrides()
+        records_override_names = [self._get_record_override_names(record) for record in asset_records]
+
+        for override_name, override in registered_overrides.items():
+            override_action = self._get_override_action(
+                self._add_override_menu, override_name, override.OVERRIDE_ICON)
+            total_missing = len([names for names in records_override_names if override_name not in names])
+            override_action.setEnabled(total_missing > 0)
+            override_action.setText(override_name if total_missing else '{} | Already added!'.format(override_name))
+        for override_name, override_action in self._override_actions.get(self._add_override_menu, dict()).items():
+            override_action.setVisible(override_name in registered_overrides)
+        self._add_override_menu.setEnabled(bool(registered_overrides))
+
+        found_overrides = OrderedDict()
+        for record in asset_records:
+            for override in self._get_record_overrides(record):
+                found_overrides.setdefault(override.OVERRIDE_NAME, override)
+        for menu in (self._remove_override_menu, self._save_override_menu):
+            for override_name, override in found_overrides.items():
+                self._get_override_action(menu, override_name, override.OVERRIDE_ICON)
+            for override_name, override_action in self._override_actions.get(menu, dict()).items():
+                override_action.setVisible(override_name in found_overrides)
+            menu.setEnabled(bool(found_overrides))
 
-    def _on_add_override(self, new_override, item):
+    def _on_add_override(self, new_override, record):
         """
         Internal callback function that is called when Add Override context button is pressed
         :param new_override: ArtellaBaseOverride
+        :param record: AssetRecord
         """
 
-        valid_override = self._asset_node.add_override(new_override)
+        valid_override = self._records.get_node(record).add_override(new_override)
         if valid_override:
-            self.overrideAdded.emit(valid_override, item)
+            self._on_override_added(valid_override, record)
 
-    def _on_remove_override(self, override_to_remove, item):
+    def _on_remove_override(self, override_to_remove, record):
         """
         Internal callback function that is called when Remove Override context button is pressed
         :param override_to_remove: ArtellaBaseOverride
+        :param record: AssetRecord
         """
 
-        removed_override = self._asset_node.remove_override(override_to_remove)
+        removed_override = self._records.get_node(record).remove_override(override_to_remove)
         if removed_override:
-            self.overrideRemoved.emit(removed_override, item)
+            self._on_override_removed(override_to_remove, record)
 
-    def _on_save_override(self, override_to_save, item):
+    def _on_save_override(self, override_to_save, record):
         """
         Internal callback function that is called when Save Override context button is pressed
         :param override_to_save: ArtellaBaseOverride
+        :param record: AssetRecord
         """
 
-        item.asset_node.save_override(override_to_save)
+        self._records.get_node(record).save_override(override_to_save)
 
-    def _on_save_all_overrides(self, item):
+    def _on_save_all_overrides(self, record):
         """
         Internal callback function that is called when Save All Overrides context action is triggered
+        :param record: AssetRecord
+        """
+
+        self._records.get_node(record).save_all_overrides()
+
+    def _on_add_override_action(self, action):
+        """
+        Internal callback function that is called when an action of the Add Override menu is triggered
+        :param action: QAction
         """
 
-        item.asset_node.save_all_overrides()
+        self.add_assets_override(self._context_records, action.data())
 
-    def _on_override_added(self, override, parent):
-        self._add_override(override=override, parent=parent)
-        parent.expand()
+    def _on_remove_override_action(self, action):
+        """
+        Internal callback function that is called when an action of the Remove Override menu is triggered
+        :param action: QAction
+        """
 
-    def _on_override_removed(self, override, parent):
-        parent.remove_child(override.OVERRIDE_NAME)
+        self.remove_assets_override(self._context_records, action.data())
+
+    def _on_save_override_action(self, action):
+        """
+        Internal callback function that is called when an action of the Save Override menu is triggered
+        :param action: QAction
+        """
+
+        if action is self._save_all_overrides_action:
+            return
+
+        for record in self._context_records:
+            for override in self._get_record_overrides(record):
+                if override.OVERRIDE_NAME == action.data():
+                    self._on_save_override(override, record)
+
+    def _on_save_all_overrides_action(self):
+        """
+        Internal callback function that is called when All action of the Save Override menu is triggered
+        """
+
+        for record in self._context_records:
+            if self._get_record_overrides(record):
+                self._on_save_all_overrides(record)
+
+    def _on_switch_context_lod(self, lod):
+        """
+        Internal callback function that is called when Switch to Proxy or Switch to Hires context actions are triggered
+        :param lod: int
+        """
+
+        self.switch_assets_lod(self._context_records, lod)
+
+    def _on_override_added(self, override, record):
+        self._get_record_overrides(record).append(override)
+        asset_widget = self._items.get(record.id)
+        if asset_widget and asset_widget.children_fetched:
+            self._add_override(override=override, parent=asset_widget)
+        self._update_record_overrides(record)
+        if asset_widget:
+            self.expand_item(asset_widget)
+
+    def _on_override_removed(self, override, record):
+        record_overrides = self._get_record_overrides(record)
+        if override in record_overrides:
+            record_overrides.remove(override)
+        asset_widget = self._items.get(record.id)
+        if asset_widget:
+            override_widget = asset_widget.take_child(override.OVERRIDE_NAME)
+            if override_widget is not None and not self._release_widget(override_widget):
+                override_widget.deleteLater()
+        self._update_record_overrides(record)
+
+    def _on_override_widget_removed(self, override_widget):
+        """
+        Internal callback function that is called when the override of an override item is removed from its node
+        :param override_widget: OutlinerOverrideItem
+        """
+
+        parent_widget = getattr(override_widget, 'parent_elem', None)
+        record = getattr(parent_widget, 'record', None)
+        if record is not None:
+            self._on_override_removed(override_widget.override, record)
+
+    def _on_fetch_item_children(self, item):
+        """
+        Internal callback function that is called when an item is expanded for the first time
+        Instance, override and file rows are only created at this point
+        :param item: OutlinerAssetItem
+        """
+
+        if isinstance(item, items.OutlinerGroupItem):
+            for record in item.group_records:
+                if not record.has_flag(records.FLAG_SYNCED):
+                    self._sync_record(record)
+            self._update_group_item(item)
+            for record in item.group_records:
+                instance_widget = self._create_asset_item(record, parent=item)
+                item.add_child(instance_widget, name=record.id)
+                self._items[record.id] = instance_widget
+                if record.has_flag(records.FLAG_SELECTED):
+                    instance_widget.select()
+            return
+
+        if item.record is not None:
+            for override in self._get_record_overrides(item.record):
+                self._add_override(override=override, parent=item)
+        self._add_file_items(item)
+
+    def _add_file_items(self, item):
+        """
+        Internal function that adds asset file rows to the given item and queues the check of their status
+        :param item: OutlinerAssetItem
+        """
+
+        try:
+            asset_files = dict(item.asset_node.get_asset_files() or dict())
+        except Exception as exc:
+            LOGGER.warning('Impossible to retrieve asset files of "{}" | {}'.format(item.name, exc))
+            asset_files = dict()
+        asset_files['artella'] = None
+
+        files_to_check = list()
+        for category, file_path in asset_files.items():
+            file_widget = self.get_file_widget_by_category(category=category, file_path=file_path, parent=item)
+            if file_widget is None:
+                continue
+            item.add_child(file_widget, name=category)
+            if category == 'model':
+                if item.record is not None:
+                    file_widget.set_lod(
+                        statestore.LOD_PROXY if item.record.has_flag(records.FLAG_PROXY) else statestore.LOD_HIRES)
+                file_widget.proxyHiresToggled.connect(partial(self._on_toggle_proxy_hires, item))
+            if file_path:
+                self._file_items.setdefault(file_path, list()).append(file_widget)
+                files_to_check.append(
+                    (file_path, self._get_published_file_path(item.asset_node, category, file_path)))
+
+        if files_to_check:
+            self._get_file_status_checker().check(files_to_check)
+
+    def _get_file_status_checker(self):
+        """
+        Internal function that returns the checker used to check the status of asset files
+        Checker (and its thread pool) is created only once, the first time file items are displayed
+        :return: FileStatusChecker
+        """
+
+        if self._file_status_checker is None:
+            from artellapipe.tools.outliner.core import statusworker
+            self._file_status_checker = statusworker.FileStatusChecker(parent=self)
+            self._file_status_checker.statusChecked.connect(self._on_file_status_checked)
+
+        return self._file_status_checker
+
+    def _get_published_file_path(self, asset_node, category, file_path):
+        """
+        Internal function that returns the path of the published version of the given asset file
+        Base outliner does not know where published files are stored, so it returns None and file rows only display
+        local or missing status. Overrides in custom outliners to compare local files against their published versions
+        :param asset_node: ArtellaAssetNode
+        :param category: str
+        :param file_path: str
+        :return: str or None
+        """
+
+        return None
+
+    def _on_file_status_checked(self, file_status):
+        """
+        Internal callback function that is called each time the status of an asset file is checked
+        :param file_status: FileStatus
+        """
+
+        for file_widget in self._file_items.get(file_status.path, list()):
+            try:
+                file_widget.set_status(file_status.status)
+            except RuntimeError:
+                pass
+
+    def _on_toggle_proxy_hires(self, item, file_widget, lod):
+        """
+        Internal callback function that is called when proxy/hires option of an asset model row changes
+        :param item: OutlinerAssetItem
+        :param file_widget: OutlinerModelFileItem
+        :param lod: int, statestore.LOD_PROXY or statestore.LOD_HIRES
+        """
+
+        if item.record is None or lod not in (statestore.LOD_PROXY, statestore.LOD_HIRES):
+            return
+
+        self.switch_assets_lod([item.record], lod)
+
+    def _update_record_overrides(self, record):
+        """
+        Internal function that synchronizes the overrides stored in the given record
+        :param record: AssetRecord
+        """
+
+        record_overrides = self._get_record_overrides(record)
+        override_names = [override.OVERRIDE_NAME for override in record_overrides]
+        self._records.set_overrides(record, override_names)
+        snapshot.get_cache().update(record.id, override_names=tuple(override_names))
+        asset_widget = self._items.get(record.id)
+        if asset_widget:
+            asset_widget.set_override_count(len(record_overrides))
+        group_widget = self._group_items.get(record.group_id)
+        if group_widget:
+            self._update_group_item(group_widget)
+
+    def _on_refresh_outliner(self):
+        """
+        Overrides base OutlinerTree _on_refresh_outliner function
+        Registered overrides and scene assets are retrieved again when the outliner is refreshed manually
+        """
+
+        assetindex.invalidate_index()
+        overrides.invalidate_registry()
+        overrides.get_scene_cache().begin_cycle()
+        snapshot.get_cache().clear()
+        super(BaseOutliner, self)._on_refresh_outliner()
+
+    def _get_widget_record(self, asset_widget):
+        """
+        Overrides base OutlinerTree _get_widget_record function
+        Group items are sorted by their first instance
+        :param asset_widget: OutlinerAssetItem
+        :return: AssetRecord or None
+        """
+
+        item_records = self._get_item_records(asset_widget)
+
+        return item_records[0] if item_records else None
+
+    def _get_query_context(self):
+        """
+        Overrides base OutlinerTree _get_query_context function
+        Asset tags are resolved with the shared asset index
+        :return: QueryContext
+        """
+
+        return query.QueryContext(self._records, tag_lookup=assetindex.get_index().with_tag)
+
+    def _on_search_text_changed(self, new_text):
+        """
+        Overrides base OutlinerTree _on_search_text_changed function
+        Group rows are visible while any of their instances matches the search text
+        :param new_text: str
+        """
+
+        super(BaseOutliner, self)._on_search_text_changed(new_text)
+
+        for group_widget in self._group_items.values():
+            group_widget.setVisible(
+                any(record.has_flag(records.FLAG_MATCHES_FILTER) for record in group_widget.group_records))
 
     def _on_show_context_menu(self, item):
-        menu = QMenu()
-        self._create_context_menu(menu, item)
-        action = menu.exec_(QCursor.pos())
+        context_records = self._records.with_flags(records.FLAG_SELECTED)
+        item_records = self._get_item_records(item)
+        if not item_records or not set(record.id for record in item_records).issubset(
+                set(record.id for record in context_records)):
+            context_records = item_records
+        context_items = [self._items[record.id] for record in context_records if record.id in self._items]
+
+        menu = self._get_context_menu()
+        cached_actions = menu.actions()
+        self._context_records = context_records
+        try:
+            self._create_context_menu(menu, item)
+            self._update_override_menus(context_records)
+            self._update_context_menu(menu, context_items or [item])
+            action = menu.exec_(QCursor.pos())
+        finally:
+            self._context_records = list()
+            self._remove_custom_context_actions(menu, cached_actions)
+
         return action
+
+    def _remove_custom_context_actions(self, menu, cached_actions):
+        """
+        Internal function that removes from the context menu the actions added by _create_context_menu
+        :param menu: QMenu
+        :param cached_actions: list(QAction), actions the context menu had before custom ones were added
+        """
+
+        for custom_action in menu.actions():
+            if custom_action in cached_actions:
+                continue
+            menu.removeAction(custom_action)
+            custom_menu = custom_action.menu()
+            if custom_menu is not None and custom_menu.parent() is menu:
+                custom_menu.deleteLater()
+            elif custom_action.parent() is menu:
+                custom_action.deleteLater()
@@ -13,7 +13,6 @@ __maintainer__ = "Tomas Poveda"
 __email__ = "tpovedatd@gmail.com"
 
 import logging
-from functools import partial
 
 from Qt.QtCore import *
 from Qt.QtWidgets import *
@@ -22,7 +21,8 @@ import tpDcc as tp
 from tpDcc.libs.python import decorators
 from tpDcc.libs.qt.widgets import dividers
 
-from artellapipe.tools.outliner.core import outlineritems, buttons
+from artellapipe.tools.outliner.core import outlineritems, buttons, records, dispatcher, icons, bulk, statestore
+from artellapipe.tools.outliner.widgets import buttons as item_buttons
 # from artellapipe.tools.shotmanager.apps import shotassembler
 
 if tp.is_maya():
@@ -31,8 +31,16 @@ if tp.is_maya():
 else:
     undo_decorator = decorators.empty_decorator
 
+bulk_mutation = bulk.bulk_mutation_decorator(undo_decorator)
+
 LOGGER = logging.getLogger()
 
+# Options of the proxy/hires combo of model rows. Both option is displayed but disabled, because asset nodes can only
+# be switched to proxy or to hires
+MODEL_LOD_INDICES = {statestore.LOD_PROXY: 0, statestore.LOD_HIRES: 1}
+MODEL_INDEX_LODS = dict((index, lod) for lod, index in MODEL_LOD_INDICES.items())
+MODEL_BOTH_INDEX = 2
+
 
 class OutlinerAssetItem(outlineritems.OutlinerItem, object):
 
@@ -41,17 +49,85 @@ class OutlinerAssetItem(outlineritems.OutlinerItem, object):
     viewToggled = Signal(object)
     viewSolo = Signal(object, bool)
 
-    def __init__(self, asset_node, parent=None):
-        super(OutlinerAssetItem, self).__init__(asset_node=asset_node, parent=parent)
+    def __init__(self, asset_node, record=None, display_name=None, parent=None):
+
+        self._is_solo = False
+        self._override_count = 0
+
+        super(OutlinerAssetItem, self).__init__(
+            asset_node=asset_node, record=record, display_name=display_name, parent=parent)
+
+    @property
+    def is_solo(self):
+        """
+        Returns whether or not the item is soloed
+        :return: bool
+        """
+
+        return self._is_solo
+
+    @property
+    def override_count(self):
+        """
+        Returns the number of overrides of the item
+        :return: int
+        """
+
+        return self._override_count
+
+    def ui(self):
+        super(OutlinerAssetItem, self).ui()
+
+        self._overrides_lbl = QLabel()
+        self._overrides_lbl.setVisible(False)
+        self._item_layout.addWidget(self._overrides_lbl, 0, 4, 1, 1)
 
     def get_display_widget(self):
         return buttons.AssetDisplayButtons()
 
-    def setup_signals(self):
-        super(OutlinerAssetItem, self).setup_signals()
+    def rebind(self, asset_node, record=None, display_name=None):
+        """
+        Overrides base OutlinerItem rebind function
+        """
+
+        super(OutlinerAssetItem, self).rebind(asset_node=asset_node, record=record, display_name=display_name)
+
+        self.set_solo(False)
+        self.set_override_count(0)
 
+    def set_override_count(self, count):
+        """
+        Sets the number of overrides displayed by the item
+        :param count: int
+        """
+
+        self._override_count = count
+        self._overrides_lbl.setText('({} override{})'.format(count, 's' if count > 1 else ''))
+        self._overrides_lbl.setVisible(count > 0)
+
+    def set_solo(self, flag):
+        """
+        Sets whether or not the item is soloed
+        :param flag: bool
+        """
+
+        self._is_solo = flag
         if self._display_buttons:
-            self._display_buttons.view_btn.clicked.connect(partial(self.viewToggled.emit, self))
+            self._display_buttons.view_btn.setToolTip('Soloed (Alt + Click to unsolo)' if flag else '')
+
+    def hit_test(self, pos):
+        """
+        Overrides base OutlinerItem hit_test function
+        :param pos: QPoint, position in item coordinates
+        :return: str
+        """
+
+        if self._display_buttons:
+            view_btn = self._display_buttons.view_btn
+            if view_btn.isVisible() and view_btn.rect().contains(view_btn.mapFrom(self, pos)):
+                return dispatcher.HIT_VIEW
+
+        return super(OutlinerAssetItem, self).hit_test(pos)
 
     def add_asset_attributes_change_callback(self):
         pass
@@ -75,6 +151,79 @@ class OutlinerAssetItem(outlineritems.OutlinerItem, object):
         #             model_widget.model_buttons.proxy_hires_cbx.setCurrentIndex(plug.asInt())
 
 
+class OutlinerGroupItem(OutlinerAssetItem, object):
+    """
+    Outliner item that groups all the instances of the same asset into a single row
+    """
+
+    def __init__(self, asset_node, group_records, group_name, parent=None):
+
+        self._group_records = group_records
+
+        super(OutlinerGroupItem, self).__init__(
+            asset_node=asset_node, display_name='{} (x{})'.format(group_name, len(group_records)), parent=parent)
+
+    @property
+    def group_records(self):
+        """
+        Returns the records of all the instances grouped by this item
+        :return: list(AssetRecord)
+        """
+
+        return self._group_records
+
+    @property
+    def instance_count(self):
+        """
+        Returns the number of instances grouped by this item
+        :return: int
+        """
+
+        return len(self._group_records)
+
+    def select(self):
+        """
+        Overrides base OutlinerItem select function
+        """
+
+        super(OutlinerGroupItem, self).select()
+        for record in self._group_records:
+            record.set_flag(records.FLAG_SELECTED, True)
+
+    def deselect(self):
+        """
+        Overrides base OutlinerItem deselect function
+        """
+
+        super(OutlinerGroupItem, self).deselect()
+        for record in self._group_records:
+            record.set_flag(records.FLAG_SELECTED, False)
+
+
+_GROUP_ITEM_CLASSES = dict()
+
+
+def get_group_item_class(item_class):
+    """
+    Returns the group item class that displays the groups of an outliner whose asset items are of the given class
+    Group item behaviour is combined with the given class, so group rows look and behave like the asset rows of the
+    outliner
+    :param item_class: class, OutlinerAssetItem subclass
+    :return: class
+    """
+
+    if issubclass(item_class, OutlinerGroupItem):
+        return item_class
+
+    group_item_class = _GROUP_ITEM_CLASSES.get(item_class)
+    if group_item_class is None:
+        group_item_class = type(item_class)(
+            '{}Group'.format(item_class.__name__), (OutlinerGroupItem, item_class), dict())
+        _GROUP_ITEM_CLASSES[item_class] = group_item_class
+
+    return group_item_class
+
+
 class OutlinerOverrideItem(outlineritems.OutlinerTreeItemWidget, object):
 
     removed = Signal()
@@ -85,29 +234,36 @@ class OutlinerOverrideItem(outlineritems.OutlinerTreeItemWidget, object):
 
         super(OutlinerOverrideItem, self).__init__(name=override.OVERRIDE_NAME, parent=parent)
 
+    @property
+    def override(self):
+        """
+        Returns the override wrapped by the item
+        :return: ArtellaBaseOverride
+        """
+
+        return self._override
+
     def ui(self):
         super(OutlinerOverrideItem, self).ui()
 
-        self.setMouseTracking(True)
-
         self._item_widget.setFrameStyle(QFrame.Raised | QFrame.StyledPanel)
         self.setStyleSheet('background-color: rgb(45,45,45);')
 
-        icon_lbl = QLabel()
-        icon_lbl.setMaximumWidth(18)
-        icon_lbl.setPixmap(self._override.OVERRIDE_ICON.pixmap(self._override.OVERRIDE_ICON.actualSize(QSize(20, 20))))
+        self._icon_lbl = QLabel()
+        self._icon_lbl.setMaximumWidth(18)
+        self._icon_lbl.setPixmap(self._get_icon_pixmap())
         self._target_lbl = QLabel(self._name.title())
         self._editor_btn = QPushButton('Editor')
         self._editor_btn.setFlat(True)
         self._save_btn = QPushButton()
-        self._editor_btn.setIcon(tp.ResourcesMgr().icon('editor'))
+        self._editor_btn.setIcon(icons.get_icon('editor'))
         self._save_btn.setFlat(True)
-        self._save_btn.setIcon(tp.ResourcesMgr().icon('save'))
+        self._save_btn.setIcon(icons.get_icon('save'))
         self._delete_btn = QPushButton()
         self._delete_btn.setFlat(True)
-        self._delete_btn.setIcon(tp.ResourcesMgr().icon('delete'))
+        self._delete_btn.setIcon(icons.get_icon('delete'))
 
-        self._item_layout.addWidget(icon_lbl, 0, 1, 1, 1)
+        self._item_layout.addWidget(self._icon_lbl, 0, 1, 1, 1)
         self._item_layout.addWidget(dividers.get_horizontal_separator_widget(), 0, 2, 1, 1)
         self._item_layout.addWidget(self._target_lbl, 0, 3, 1, 1)
         self._item_layout.addWidget(dividers.get_horizontal_separator_widget(), 0, 4, 1, 1)
@@ -121,6 +277,25 @@ class OutlinerOverrideItem(outlineritems.OutlinerTreeItemWidget, object):
         self._save_btn.clicked.connect(self._on_save_override)
         self._delete_btn.clicked.connect(self._on_remove_override)
 
+    def rebind(self, override):
+        """
+        Binds the item to a new override, so the widget can be reused instead of creating a new one
+        :param override: ArtellaBaseOverride
+        """
+
+        self._override = override
+        self._long_name = self._name = override.OVERRIDE_NAME
+        self._icon_lbl.setPixmap(self._get_icon_pixmap())
+        self._target_lbl.setText(self._name.title())
+
+    def _get_icon_pixmap(self):
+        """
+        Internal function that returns the pixmap displayed by the item icon
+        :return: QPixmap
+        """
+
+        return self._override.OVERRIDE_ICON.pixmap(self._override.OVERRIDE_ICON.actualSize(QSize(20, 20)))
+
     def _on_open_override_editor(self):
         """
         Internal callback function that is called when Editor button is pressed
@@ -145,3 +320,71 @@ class OutlinerOverrideItem(outlineritems.OutlinerTreeItemWidget, object):
             self.removed.emit()
 
         return self._override
+
+
+class OutlinerModelFileItem(outlineritems.OutlinerFileItem, object):
+
+    proxyHiresToggled = Signal(object, int)
+
+    def __init__(self, category='model', file_path=None, parent=None):
+
+        self._lod = None
+
+        super(OutlinerModelFileItem, self).__init__(category=category, file_path=file_path, parent=parent)
+
+    @property
+    def lod(self):
+        """
+        Returns the LOD displayed by the proxy/hires option of the item
+        :return: int or None, statestore.LOD_PROXY or statestore.LOD_HIRES
+        """
+
+        return self._lod
+
+    def ui(self):
+        super(OutlinerModelFileItem, self).ui()
+
+        self.model_buttons = item_buttons.ModelDisplayButtons()
+        self._item_layout.addWidget(self.model_buttons, 0, 4, 1, 1)
+
+        both_item = self.model_buttons.proxy_hires_cbx.model().item(MODEL_BOTH_INDEX)
+        if both_item is not None:
+            both_item.setEnabled(False)
+            both_item.setToolTip('Loading proxy and hires at the same time is not supported')
+
+    def setup_signals(self):
+        self.model_buttons.proxy_hires_cbx.currentIndexChanged.connect(self._on_proxy_hires_changed)
+
+    def set_lod(self, lod):
+        """
+        Sets current proxy/hires option without notifying it
+        :param lod: int, statestore.LOD_PROXY or statestore.LOD_HIRES
+        """
+
+        index = MODEL_LOD_INDICES.get(lod)
+        if index is None:
+            return
+
+        self._lod = lod
+        self.model_buttons.proxy_hires_cbx.blockSignals(True)
+        try:
+            self.model_buttons.proxy_hires_cbx.setCurrentIndex(index)
+        finally:
+            self.model_buttons.proxy_hires_cbx.blockSignals(False)
+
+    def _on_proxy_hires_changed(self, index):
+        """
+        Internal callback function that is called when proxy/hires option changes
+        Emits the LOD of the selected option. Options that do not map to a LOD restore the previous one
+        :param index: int
+        """
+
+        lod = MODEL_INDEX_LODS.get(index)
+        if lod is None:
+            LOGGER.warning('Proxy/hires option "{}" is not supported'.format(
+                self.model_buttons.proxy_hires_cbx.itemText(index)))
+            self.set_lod(self._lod)
+            return
+
+        self._lod = lod
+        self.proxyHiresToggled.emit(self, lod)
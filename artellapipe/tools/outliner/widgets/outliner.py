@@ -12,6 +12,7 @@ __license__ = "MIT"
 __maintainer__ = "Tomas Poveda"
 __email__ = "tpovedatd@gmail.com"
 
+import time
 import logging
 import inspect
 import importlib
@@ -24,7 +25,7 @@ from Qt.QtWidgets import *
 import tpDcc as tp
 from tpDcc.libs.python import python
 from tpDcc.libs.qt.core import qtutils, base
-from tpDcc.libs.qt.widgets import stack, dividers
+from tpDcc.libs.qt.widgets import stack, dividers, search
 
 if python.is_python2():
     import pkgutil as loader
@@ -34,11 +35,17 @@ else:
 import tpDcc
 
 import artellapipe
+from artellapipe.tools.outliner.core import statestore, overrides, assetindex, query, nameindex, startup, prewarm
+from artellapipe.tools.outliner.core import governor, snapshot, records
+from artellapipe.tools.outliner.widgets import items
 
 # from artellapipe.utils import shader
 
 LOGGER = logging.getLogger()
 
+MAX_GLOBAL_SEARCH_RESULTS = 200
+INSTANT_SWITCH_ITEM_COUNT = 500
+
 
 class ArtellaOutlinerSettings(base.BaseWidget, object):
 
@@ -61,18 +68,36 @@ class ArtellaOutlinerSettings(base.BaseWidget, object):
 class ArtellaOutlinerWidget(artellapipe.ToolWidget, object):
     def __init__(self, project, config, settings, parent=None):
 
+        self._startup_time = time.time()
         self._project = project
         self._config = config
         self._outliners = OrderedDict()
+        self._outliner_indices = dict()
         self._registered_outliner_classes = OrderedDict()
+        self._tag_filters = set()
+        self._tag_chips = dict()
+        self._name_index = nameindex.NameIndex()
+        self._dirty_name_categories = set()
+        self._startup = startup.StartupSequence()
 
         super(ArtellaOutlinerWidget, self).__init__(project=project, config=config, settings=settings, parent=parent)
 
         self._register_outliner_classes()
         self._create_outliners()
+        self.update_categories()
+
         self._init_outliners()
 
-        self.update_categories()
+    def paintEvent(self, event):
+        """
+        Overrides base ToolWidget paintEvent function
+        Records the time spent since the tool started to be created until it is painted for the first time
+        :param event: QPaintEvent
+        """
+
+        super(ArtellaOutlinerWidget, self).paintEvent(event)
+        if not self._startup.is_painted:
+            self._startup.mark_first_paint()
 
     def ui(self):
         super(ArtellaOutlinerWidget, self).ui()
@@ -90,6 +115,10 @@ class ArtellaOutlinerWidget(artellapipe.ToolWidget, object):
         self._outliner_layout.setSpacing(2)
         self._outliner_widget.setLayout(self._outliner_layout)
 
+        self._global_search = search.SearchFindWidget()
+        self._global_search.setToolTip('Search assets in all categories')
+        self._outliner_layout.addWidget(self._global_search)
+
         top_layout = QHBoxLayout()
         top_layout.setContentsMargins(0, 0, 0, 0)
         top_layout.setSpacing(2)
@@ -104,11 +133,29 @@ class ArtellaOutlinerWidget(artellapipe.ToolWidget, object):
         self._tags_btn_grp = QButtonGroup(self)
         self._tags_btn_grp.setExclusive(True)
 
+        self._tag_chips_layout = QHBoxLayout()
+        self._tag_chips_layout.setContentsMargins(0, 0, 0, 0)
+        self._tag_chips_layout.setSpacing(2)
+        self._tag_chips_layout.setAlignment(Qt.AlignCenter)
+
+        self._global_results = QListWidget()
+        self._global_results.setVisible(False)
+
         self._outliners_stack = stack.SlidingStackedWidget()
         self._outliner_layout.addLayout(top_layout)
+        self._outliner_layout.addLayout(self._tag_chips_layout)
         self._outliner_layout.addLayout(dividers.DividerLayout())
+        self._outliner_layout.addWidget(self._global_results)
         self._outliner_layout.addWidget(self._outliners_stack)
 
+        self._global_search.textChanged.connect(self._on_global_search_text_changed)
+        self._global_results.itemActivated.connect(self._on_global_result_activated)
+        self._global_results.itemClicked.connect(self._on_global_result_activated)
+
+        self._startup_timer = QTimer(self)
+        self._startup_timer.setInterval(0)
+        self._startup_timer.timeout.connect(self._on_startup_timeout)
+
         self._settings_widget = ArtellaOutlinerSettings()
 
         self._main_stack.addWidget(self._outliner_widget)
@@ -147,6 +194,42 @@ class ArtellaOutlinerWidget(artellapipe.ToolWidget, object):
                 new_btn.blockSignals(False)
             total_buttons += 1
 
+        self._update_tag_chips()
+
+    def set_tag_filters(self, tags=None):
+        """
+        Sets the tags an asset must have to be displayed in the outliners
+        :param tags: list(str) or None, if empty, tag filter is disabled
+        """
+
+        self._tag_filters = set(tag.lower() for tag in tags or list())
+        asset_ids = assetindex.get_index().match_tags(self._tag_filters) if self._tag_filters else None
+        for outliner in self._outliners.values():
+            outliner.set_filter_ids(asset_ids)
+
+    def _update_tag_chips(self):
+        """
+        Internal function that creates a filter chip for each one of the tags of the scene assets
+        """
+
+        qtutils.clear_layout(self._tag_chips_layout)
+        self._tag_chips.clear()
+
+        asset_index = assetindex.get_index()
+        tag_names = asset_index.tag_names()
+        self._tag_filters.intersection_update(tag_names)
+        for tag_name in tag_names:
+            tag_chip = QPushButton('{} ({})'.format(tag_name, asset_index.tag_count(tag_name)))
+            tag_chip.setCheckable(True)
+            tag_chip.setChecked(tag_name in self._tag_filters)
+            tag_chip.setFlat(True)
+            tag_chip.setSizePolicy(QSizePolicy.Maximum, QSizePolicy.Preferred)
+            tag_chip.toggled.connect(partial(self._on_toggle_tag_filter, tag_name))
+            self._tag_chips_layout.addWidget(tag_chip)
+            self._tag_chips[tag_name] = tag_chip
+
+        self.set_tag_filters(self._tag_filters)
+
     def add_outliner(self, outliner_type, outliner_widget):
         """
         Adds a new outliner to the stack widget
@@ -159,7 +242,115 @@ class ArtellaOutlinerWidget(artellapipe.ToolWidget, object):
             return
 
         self._outliners[outliner_type] = outliner_widget
-        self._outliners_stack.addWidget(outliner_widget)
+        self._outliner_indices[outliner_type] = self._outliners_stack.addWidget(outliner_widget)
+        self._dirty_name_categories.add(outliner_type)
+        outliner_widget.refreshed.connect(partial(self._on_outliner_refreshed, outliner_type))
+        outliner_widget.staleItemsFound.connect(partial(self._on_outliner_stale_items_found, outliner_type))
+
+    def show_outliner(self, outliner_type):
+        """
+        Activates the outliner of the given type
+        :param outliner_type: str
+        :return: BaseOutliner or None
+        """
+
+        outliner = self._outliners.get(outliner_type)
+        if not outliner:
+            return None
+
+        for btn in self._tags_btn_grp.buttons():
+            if btn.category == outliner_type:
+                btn.blockSignals(True)
+                btn.setChecked(True)
+                btn.blockSignals(False)
+                break
+        self._switch_outliner(outliner_type)
+
+        return outliner
+
+    def add_scene_assets(self, asset_nodes):
+        """
+        Notifies the outliners that the given assets were added to (or changed in) the scene
+        Should be called from DCC scene callbacks. Hidden outliners queue the changes until they are shown
+        :param asset_nodes: list(ArtellaAssetNode)
+        """
+
+        if not asset_nodes:
+            return
+
+        asset_index = assetindex.get_index()
+        snapshots_cache = snapshot.get_cache()
+        for asset_node in asset_nodes:
+            snapshots_cache.invalidate(asset_node.id)
+            asset_index.add(asset_node)
+        snapshots_cache.capture(asset_nodes)
+
+        for outliner in self._outliners.values():
+            category_ids = asset_index.match_categories(outliner.CATEGORIES)
+            outliner_nodes = list()
+            stale_ids = list()
+            for asset_node in asset_nodes:
+                if asset_node.id in category_ids:
+                    outliner_nodes.append(asset_node)
+                elif asset_node.id in outliner.records:
+                    stale_ids.append(asset_node.id)
+            if stale_ids:
+                outliner.remove_scene_assets(stale_ids)
+            if outliner_nodes:
+                outliner.add_scene_assets(outliner_nodes)
+
+    def remove_scene_assets(self, asset_ids):
+        """
+        Notifies the outliners that the assets with the given ids were removed from the scene
+        Should be called from DCC scene callbacks. Hidden outliners queue the changes until they are shown
+        :param asset_ids: list(str)
+        """
+
+        if not asset_ids:
+            return
+
+        asset_index = assetindex.get_index()
+        snapshots_cache = snapshot.get_cache()
+        for asset_id in asset_ids:
+            snapshots_cache.invalidate(asset_id)
+            asset_index.remove(asset_id)
+
+        for outliner in self._outliners.values():
+            outliner.remove_scene_assets(asset_ids)
+
+    def search_assets(self, text, limit=MAX_GLOBAL_SEARCH_RESULTS):
+        """
+        Searches the assets of all the outliners whose name matches the given text
+        :param text: str
+        :param limit: int or None, maximum number of results to return
+        :return: list(SearchResult), results sorted by relevance
+        """
+
+        self._update_name_index()
+
+        return self._name_index.search(text, limit=limit)
+
+    def jump_to_asset(self, outliner_type, asset_id):
+        """
+        Activates the outliner of the given type and scrolls to the item of the given asset
+        Other outliners are not refreshed
+        :param outliner_type: str
+        :param asset_id: str
+        :return: bool
+        """
+
+        outliner = self.show_outliner(outliner_type)
+        if not outliner:
+            return False
+
+        if self._tag_filters and asset_id not in assetindex.get_index().match_tags(self._tag_filters):
+            for tag_chip in self._tag_chips.values():
+                tag_chip.blockSignals(True)
+                tag_chip.setChecked(False)
+                tag_chip.blockSignals(False)
+            self.set_tag_filters(None)
+
+        return outliner.scroll_to_item(asset_id)
 
     def _setup_toolbar(self):
         """
@@ -168,15 +359,19 @@ class ArtellaOutlinerWidget(artellapipe.ToolWidget, object):
 
         low_resolution_action = QToolButton(self)
         low_resolution_action.setText('All Low')
-        low_resolution_action.setToolTip('Enable High Resolution Mesh in all assets in current scene')
-        low_resolution_action.setStatusTip('Enable High Resolution Mesh in all assets in current scene')
+        low_resolution_action.setToolTip(
+            'Enable Low Resolution Mesh in all assets in current scene (or in assets matching current search)')
+        low_resolution_action.setStatusTip(
+            'Enable Low Resolution Mesh in all assets in current scene (or in assets matching current search)')
         low_resolution_action.setIcon(tpDcc.ResourcesMgr().icon('low_poly', key='tools'))
         low_resolution_action.setToolButtonStyle(Qt.ToolButtonTextUnderIcon)
 
         high_resolution_action = QToolButton(self)
         high_resolution_action.setText('All High')
-        high_resolution_action.setToolTip('Enable High Resolution Mesh in all assets in current scene')
-        high_resolution_action.setStatusTip('Enable High Resolution Mesh in all assets in current scene')
+        high_resolution_action.setToolTip(
+            'Enable High Resolution Mesh in all assets in current scene (or in assets matching current search)')
+        high_resolution_action.setStatusTip(
+            'Enable High Resolution Mesh in all assets in current scene (or in assets matching current search)')
         high_resolution_action.setIcon(tpDcc.ResourcesMgr().icon('high_poly'))
         high_resolution_action.setToolButtonStyle(Qt.ToolButtonTextUnderIcon)
 
@@ -208,6 +403,24 @@ class ArtellaOutlinerWidget(artellapipe.ToolWidget, object):
         export_overrides_action.setIcon(tpDcc.ResourcesMgr().icon('save'))
         export_overrides_action.setToolButtonStyle(Qt.ToolButtonTextUnderIcon)
 
+        self._solo_all_action = QToolButton(self)
+        self._solo_all_action.setText('Solo All')
+        self._solo_all_action.setToolTip('Solo (Alt + Click on view button) hides assets of all categories')
+        self._solo_all_action.setStatusTip('Solo (Alt + Click on view button) hides assets of all categories')
+        self._solo_all_action.setIcon(tpDcc.ResourcesMgr().icon('eye'))
+        self._solo_all_action.setToolButtonStyle(Qt.ToolButtonTextUnderIcon)
+        self._solo_all_action.setCheckable(True)
+
+        self._presets_menu = QMenu(self)
+        presets_action = QToolButton(self)
+        presets_action.setText('Presets')
+        presets_action.setToolTip('Save and apply visibility and LOD state presets of current scene')
+        presets_action.setStatusTip('Save and apply visibility and LOD state presets of current scene')
+        presets_action.setIcon(tpDcc.ResourcesMgr().icon('eye'))
+        presets_action.setToolButtonStyle(Qt.ToolButtonTextUnderIcon)
+        presets_action.setPopupMode(QToolButton.InstantPopup)
+        presets_action.setMenu(self._presets_menu)
+
         settings_action = QToolButton(self)
         settings_action.setText('Settings')
         settings_action.setToolTip('Outliner Settings')
@@ -225,12 +438,17 @@ class ArtellaOutlinerWidget(artellapipe.ToolWidget, object):
         self._toolbar.addSeparator()
         self._toolbar.addWidget(export_overrides_action)
         self._toolbar.addSeparator()
+        self._toolbar.addWidget(self._solo_all_action)
+        self._toolbar.addWidget(presets_action)
+        self._toolbar.addSeparator()
         self._toolbar.addWidget(settings_action)
 
         low_resolution_action.clicked.connect(self._on_lowres_assets)
         high_resolution_action.clicked.connect(self._on_hires_assets)
         load_scene_shaders_action.clicked.connect(self._on_load_scene_shaders)
         unload_scene_shaders_action.clicked.connect(self._on_unload_scene_shaders)
+        self._solo_all_action.toggled.connect(self._on_toggle_solo_all)
+        self._presets_menu.aboutToShow.connect(self._on_update_presets_menu)
         # settings_action.clicked.connect(self.open_settings)
 
     def register_outliner_class(self, outliner_type, outliner_class):
@@ -243,6 +461,129 @@ class ArtellaOutlinerWidget(artellapipe.ToolWidget, object):
         self._registered_outliner_classes[outliner_type] = outliner_class
         return True
 
+    def save_preset(self, preset_name):
+        """
+        Stores current visibility and LOD state of all outliner assets into a preset of the current scene
+        :param preset_name: str
+        :return: bool
+        """
+
+        presets_file = self._get_presets_file()
+        if not presets_file:
+            LOGGER.warning('Impossible to save outliner preset because current scene is not saved!')
+            return False
+
+        from artellapipe.tools.outliner.core import presets
+
+        preset = presets.StatePreset.capture(
+            preset_name, self._get_unique_records().values(), state_fn=self._get_live_record_state)
+
+        return presets_file.add_preset(preset)
+
+    @items.bulk_mutation
+    def apply_preset(self, preset_name):
+        """
+        Applies the preset with the given name to current scene
+        Only assets whose state differs from the stored one are modified
+        :param preset_name: str
+        :return: bool
+        """
+
+        presets_file = self._get_presets_file()
+        preset = presets_file.get_preset(preset_name) if presets_file else None
+        if not preset:
+            LOGGER.warning('Outliner preset "{}" does not exist!'.format(preset_name))
+            return False
+
+        unique_records = self._get_unique_records()
+        plan = preset.diff(unique_records.values(), state_fn=self._get_live_record_state)
+
+        to_hide = [record.node for record in plan['to_hide']]
+        to_show = [record.node for record in plan['to_show']]
+        if to_hide:
+            tp.Dcc.hide_object(to_hide)
+        if to_show:
+            tp.Dcc.show_object(to_show)
+
+        for lod, lod_records in ((statestore.LOD_PROXY, plan['to_proxy']), (statestore.LOD_HIRES, plan['to_hires'])):
+            if not lod_records:
+                continue
+            for outliner in self._outliners.values():
+                outliner_records = [record for record in lod_records if outliner.records.get(record.id) is record]
+                if outliner_records:
+                    outliner.switch_assets_lod(outliner_records, lod)
+
+        lod_nodes = (
+            (statestore.LOD_PROXY, [record.node for record in plan['to_proxy']]),
+            (statestore.LOD_HIRES, [record.node for record in plan['to_hires']]))
+        for outliner in self._outliners.values():
+            if to_hide:
+                outliner.update_nodes_visibility(to_hide, False)
+            if to_show:
+                outliner.update_nodes_visibility(to_show, True)
+            for lod, nodes in lod_nodes:
+                if nodes:
+                    outliner.update_nodes_lod(nodes, lod)
+
+        return True
+
+    def get_bulk_targets(self, query_text=None):
+        """
+        Returns the records toolbar bulk actions are applied to, grouped by the outliner that owns them
+        If a filter query is given (or typed in the search box of current outliner), only the records of current
+        outliner that match it are returned; otherwise the records of all outliners are returned
+        :param query_text: str or None
+        :return: list(tuple(BaseOutliner, list(AssetRecord)))
+        """
+
+        current_outliner = self._outliners_stack.currentWidget()
+        if current_outliner is not None:
+            if query_text is None:
+                query_text = current_outliner.search_text
+            if query_text and query_text.strip():
+                try:
+                    return [(current_outliner, current_outliner.search_records(query_text))]
+                except query.QueryError as exc:
+                    LOGGER.warning('Invalid outliner filter query "{}" | {}'.format(query_text, exc))
+                    return list()
+
+        unique_records = self._get_unique_records()
+        bulk_targets = list()
+        for outliner in self._outliners.values():
+            outliner_records = [
+                record for record in outliner.records if unique_records.get(record.node) is record]
+            if outliner_records:
+                bulk_targets.append((outliner, outliner_records))
+
+        return bulk_targets
+
+    @items.bulk_mutation
+    def switch_assets_lod(self, lod, query_text=None):
+        """
+        Switches toolbar bulk action targets to proxy or hires
+        :param lod: int, statestore.LOD_PROXY or statestore.LOD_HIRES
+        :param query_text: str or None, filter query used to select the assets to switch
+        """
+
+        for outliner, outliner_records in self.get_bulk_targets(query_text):
+            outliner.switch_assets_lod(outliner_records, lod)
+
+    @items.bulk_mutation
+    def load_scene_shaders(self):
+        """
+        Loads and applies all the shaders of the current scene
+        """
+
+        artellapipe.ShadersMgr().load_scene_shaders()
+
+    @items.bulk_mutation
+    def unload_scene_shaders(self):
+        """
+        Unloads all the shaders of the current scene
+        """
+
+        artellapipe.ShadersMgr().unload_shaders()
+
     def select_asset(self, *args, **kwargs):
         current_outliner = self._outliners_stack.currentWidget()
         if not current_outliner:
@@ -276,51 +617,323 @@ class ArtellaOutlinerWidget(artellapipe.ToolWidget, object):
             new_outliner = outliner_class(project=self._project)
             self.add_outliner(outliner_type, new_outliner)
 
+    @property
+    def startup(self):
+        """
+        Returns the sequence used to populate the outliners when the tool is opened
+        :return: StartupSequence
+        """
+
+        return self._startup
+
     def _init_outliners(self):
         """
         Internal function that initializes current outliners
+        Outliners are populated progressively once the tool is painted: current outliner is populated first, so the
+        tool becomes interactive as soon as possible, and the other ones are populated one by one afterwards
+        """
+
+        self._startup_timer.stop()
+        self._startup.reset()
+        self._startup.add_step('scene', self._build_scene_data)
+        current_outliner = self._outliners_stack.currentWidget()
+        outliners = sorted(self._outliners.items(), key=lambda item: item[1] is not current_outliner)
+        for outliner_type, outliner in outliners:
+            self._startup.add_step(
+                outliner_type, partial(self._populate_outliner, outliner), interactive=outliner is current_outliner)
+        self._startup.add_step('tags', self._update_tag_chips)
+        self._startup.start(start_time=self._startup_time)
+        self._startup_time = None
+        self._startup_timer.start()
+
+    def _build_scene_data(self):
+        """
+        Internal function that collects the scene assets displayed by the outliners
+        Asset snapshots are captured later, by each outliner, only for the assets it displays
+        Scene data collected while the DCC was idle is reused the first time the tool is opened
+        """
+
+        prewarm.stop()
+        if prewarm.consume_scene_data():
+            return
+
+        assetindex.get_index().build()
+        overrides.get_scene_cache().begin_cycle()
+        snapshot.get_cache().clear()
+
+    def _populate_outliner(self, outliner):
+        """
+        Internal function that populates the given outliner. Outliner is suspended again if it is not the current one
+        :param outliner: BaseOutliner
+        """
+
+        outliner.refresh()
+        outliner.resume()
+        if outliner is not self._outliners_stack.currentWidget():
+            outliner.suspend()
+
+    def _switch_outliner(self, outliner_type):
+        """
+        Internal function that makes the outliner of the given type the current one of the outliners stack
+        Sliding animation renders both outliners each frame, so it is skipped if any of them has too many items
+        :param outliner_type: str
+        :return: bool
+        """
+
+        outliner_index = self._outliner_indices.get(outliner_type)
+        if outliner_index is None:
+            return False
+
+        current_outliner = self._outliners_stack.currentWidget()
+        outliner = self._outliners[outliner_type]
+        if current_outliner is outliner:
+            return True
+
+        self._set_active_outliner(outliner)
+        max_items = self._config.get('instant_switch_item_count', default=INSTANT_SWITCH_ITEM_COUNT)
+        outliners_items = [len(outliner.records)]
+        if current_outliner is not None:
+            outliners_items.append(len(current_outliner.records))
+        if max(outliners_items) > max_items:
+            self._outliners_stack.setCurrentIndex(outliner_index)
+        else:
+            self._outliners_stack.slide_in_index(outliner_index)
+
+        return True
+
+    def _set_active_outliner(self, active_outliner):
         """
+        Internal function that resumes the given outliner and suspends all the other ones, so hidden outliners do not
+        paint nor update their items
+        :param active_outliner: BaseOutliner
+        """
+
+        for outliner in self._outliners.values():
+            if outliner is not active_outliner:
+                outliner.suspend()
+        if active_outliner in self._outliners.values():
+            active_outliner.resume()
+
+    def _get_presets_file(self):
+        """
+        Internal function that returns the presets file of the current scene
+        :return: StatePresetsFile or None
+        """
+
+        from artellapipe.tools.outliner.core import presets
+
+        presets_path = presets.get_scene_presets_file(tp.Dcc.scene_name())
+        if not presets_path:
+            return None
+
+        return presets.StatePresetsFile(presets_path)
+
+    def _get_live_record_state(self, record):
+        """
+        Internal function that returns the current visibility and LOD state of the DCC node of the given record
+        State is queried from the DCC, because records are not updated when nodes are modified outside the outliner
+        :param record: AssetRecord
+        :return: tuple(bool, bool), whether the node is visible and whether it is proxy
+        """
+
+        if record.table is None or not tp.Dcc.object_exists(record.node):
+            return record.has_flag(records.FLAG_VISIBLE), record.has_flag(records.FLAG_PROXY)
 
+        return tp.Dcc.node_is_visible(record.node), records.is_asset_proxy(record.table.get_node(record))
+
+    def _get_unique_records(self):
+        """
+        Internal function that returns the records of all outliners. Assets that are listed in more than one outliner
+        are only returned once
+        :return: OrderedDict(str, AssetRecord), dictionary that maps DCC node names with their records
+        """
+
+        unique_records = OrderedDict()
         for outliner in self._outliners.values():
-            outliner.refresh()
+            for record in outliner.records:
+                if record.node and record.node not in unique_records:
+                    unique_records[record.node] = record
+
+        return unique_records
+
+    def _update_name_index(self):
+        """
+        Internal function that indexes again the names of the outliners that were refreshed since last search
+        """
+
+        for outliner_type in self._dirty_name_categories:
+            self._name_index.remove_category(outliner_type)
+            outliner = self._outliners.get(outliner_type)
+            if not outliner:
+                continue
+            for record in outliner.records:
+                self._name_index.add(record.name, outliner_type, record.id)
+        self._dirty_name_categories.clear()
 
     def _on_lowres_assets(self):
         """
         Internal function that is called when Low Res Assets menubar button is pressed
         """
 
-        scene_assets = artellapipe.AssetsMgr().get_scene_assets()
-        if not scene_assets:
-            return
-
-        for scene_asset in scene_assets:
-            scene_asset.switch_to_proxy()
+        self.switch_assets_lod(statestore.LOD_PROXY)
 
     def _on_hires_assets(self):
         """
         Internal function that is called when High Res Assets menubar button is pressed
         """
 
-        scene_assets = artellapipe.AssetsMgr().get_scene_assets()
-        if not scene_assets:
-            return
-
-        for scene_asset in scene_assets:
-            scene_asset.switch_to_hires()
+        self.switch_assets_lod(statestore.LOD_HIRES)
 
     def _on_load_scene_shaders(self):
         """
         Internal callback function that is called when Load Scene Shaders menubar button is pressed
         """
 
-        artellapipe.ShadersMgr().load_scene_shaders()
+        self.load_scene_shaders()
 
     def _on_unload_scene_shaders(self):
         """
         Internal callback function that is called when Unload Scene Shaders menubar button is pressed
         """
 
-        artellapipe.ShadersMgr().unload_shaders()
+        self.unload_scene_shaders()
+
+    def _on_update_presets_menu(self):
+        """
+        Internal callback function that is called before presets menu is shown
+        """
+
+        self._presets_menu.clear()
+        save_action = self._presets_menu.addAction(tpDcc.ResourcesMgr().icon('save'), 'Save Current State ...')
+        save_action.triggered.connect(self._on_save_preset)
+
+        presets_file = self._get_presets_file()
+        preset_names = presets_file.preset_names() if presets_file else list()
+        if not preset_names:
+            return
+
+        self._presets_menu.addSeparator()
+        delete_menu = QMenu('Delete', self._presets_menu)
+        for preset_name in preset_names:
+            apply_action = self._presets_menu.addAction(preset_name)
+            apply_action.triggered.connect(partial(self.apply_preset, preset_name))
+            delete_action = delete_menu.addAction(preset_name)
+            delete_action.triggered.connect(partial(presets_file.remove_preset, preset_name))
+        self._presets_menu.addSeparator()
+        self._presets_menu.addMenu(delete_menu)
+
+    def _on_save_preset(self):
+        """
+        Internal callback function that is called when Save Current State presets menu action is triggered
+        """
+
+        preset_name, ok = QInputDialog.getText(self, 'Save Outliner Preset', 'Preset Name:')
+        if not ok or not preset_name:
+            return
+
+        self.save_preset(preset_name)
+
+    @items.bulk_mutation
+    def _on_toggle_solo_all(self, flag):
+        """
+        Internal callback function that is called when Solo All toolbar button is toggled
+        :param flag: bool
+        """
+
+        all_outliners = list(self._outliners.values())
+        for outliner in all_outliners:
+            if outliner.is_soloed:
+                outliner.unsolo()
+            outliner.set_solo_scope(all_outliners if flag else None)
+
+    def _on_startup_timeout(self):
+        """
+        Internal callback function that runs the next step of the startup sequence each time the event loop is idle
+        """
+
+        if not governor.get_governor().gate_timer(self._startup_timer):
+            return
+        if self._startup.run_next():
+            return
+
+        self._startup_timer.stop()
+        LOGGER.debug(self._startup.report())
+
+    def _on_toggle_tag_filter(self, tag_name, flag):
+        """
+        Internal callback function that is called when a tag filter chip is toggled
+        :param tag_name: str
+        :param flag: bool
+        """
+
+        tag_filters = set(self._tag_filters)
+        if flag:
+            tag_filters.add(tag_name)
+        else:
+            tag_filters.discard(tag_name)
+        self.set_tag_filters(tag_filters)
+
+    def _on_outliner_refreshed(self, outliner_type):
+        """
+        Internal callback function that is called each time an outliner is refreshed
+        :param outliner_type: str
+        """
+
+        self._dirty_name_categories.add(outliner_type)
+
+    def _on_outliner_stale_items_found(self, outliner_type, asset_ids):
+        """
+        Internal callback function that is called each time an outliner finds assets that do not exist anymore
+        Those assets are removed from the other outliners, whose items are validated the next time they are visible
+        :param outliner_type: str
+        :param asset_ids: list(str)
+        """
+
+        for other_type, outliner in self._outliners.items():
+            if other_type == outliner_type:
+                continue
+            stale_ids = [asset_id for asset_id in asset_ids if asset_id in outliner.records]
+            if stale_ids:
+                outliner.remove_scene_assets(stale_ids)
+            outliner.invalidate_items()
+
+    def _on_global_search_text_changed(self, text):
+        """
+        Internal callback function that is called each time global search text changes
+        :param text: str
+        """
+
+        self._global_results.clear()
+        if not text or not text.strip():
+            self._global_results.setVisible(False)
+            self._outliners_stack.setVisible(True)
+            return
+
+        category_icons = dict()
+        for result in self.search_assets(text):
+            outliner = self._outliners.get(result.category)
+            category_name = outliner.NAME if outliner and outliner.NAME else result.category.title()
+            category_icon = category_icons.get(result.category)
+            if category_icon is None:
+                category_icon = category_icons[result.category] = tpDcc.ResourcesMgr().icon(
+                    result.category.strip().lower())
+            result_item = QListWidgetItem(category_icon, '{}  [{}]'.format(result.name, category_name))
+            result_item.setData(Qt.UserRole, (result.category, result.asset_id))
+            self._global_results.addItem(result_item)
+
+        self._outliners_stack.setVisible(False)
+        self._global_results.setVisible(True)
+
+    def _on_global_result_activated(self, result_item):
+        """
+        Internal callback function that is called when a global search result is clicked
+        :param result_item: QListWidgetItem
+        """
+
+        outliner_type, asset_id = result_item.data(Qt.UserRole)
+        self._global_search.set_text('')
+        self._on_global_search_text_changed('')
+        self.jump_to_asset(outliner_type, asset_id)
 
     def _on_change_outliner(self, toggled_btn):
         """
@@ -328,14 +941,7 @@ class ArtellaOutlinerWidget(artellapipe.ToolWidget, object):
         :param toggled_btn: QPushButon, button toggled
         """
 
-        for btn in self._tags_btn_grp.buttons():
-            if btn == toggled_btn:
-                selected_category = toggled_btn.text()
-                for outliner in self._outliners.values():
-                    if outliner.NAME == selected_category:
-                        outliner_index = self._outliners_stack.indexOf(outliner)
-                        self._outliners_stack.slide_in_index(outliner_index)
-                        break
+        self._switch_outliner(toggled_btn.category)
 
     def _register_outliner_classes(self):
         """
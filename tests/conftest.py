@@ -0,0 +1,30 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains shared helpers for artellapipe-tools-outliner tests
+"""
+
+
+class AssetNode(object):
+    """
+    Fake ArtellaAssetNode used by the tests. Counts the number of times its getters are queried
+    """
+
+    def __init__(self, asset_id, node=None, category=None, tags=None, name=None, asset=None, overrides=None):
+        self.id = asset_id
+        self.node = asset_id if node is None else node
+        self.name = name
+        self.category = category
+        self.tags = tags
+        self.asset = asset
+        self.queries = 0
+        self._overrides = overrides
+
+    def get_short_name(self):
+        self.queries += 1
+        return self.node.split('|')[-1]
+
+    def get_overrides(self):
+        self.queries += 1
+        return self._overrides
@@ -0,0 +1,70 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe-tools-outliner asset index
+"""
+
+from artellapipe.tools.outliner.core import assetindex
+
+from tests.conftest import AssetNode
+
+
+def _build_index():
+    asset_nodes = [
+        AssetNode('tree_01', category='Prop', tags=['Env', 'hero']),
+        AssetNode('rock_01', category='Prop', tags=['env']),
+        AssetNode('hero_01', category='Character', tags=['hero']),
+        AssetNode('house_01', category='Set'),
+    ]
+    asset_index = assetindex.AssetIndex(loader=lambda: asset_nodes)
+    asset_index.ensure_built()
+
+    return asset_index
+
+
+def test_category_membership():
+    asset_index = _build_index()
+    assert asset_index.is_built
+    assert asset_index.match_categories(['prop']) == {'tree_01', 'rock_01'}
+    assert asset_index.match_categories(['Character', 'env']) == {'hero_01', 'tree_01', 'rock_01'}
+    assert len(asset_index.match_categories(None)) == 4
+    assert [node.id for node in asset_index.get_nodes({'house_01', 'tree_01'})] == ['tree_01', 'house_01']
+
+
+def test_tag_filters():
+    asset_index = _build_index()
+    assert asset_index.tag_names() == ['env', 'hero']
+    assert asset_index.tag_count('hero') == 2
+    assert asset_index.match_tags(['env', 'hero']) == {'tree_01'}
+    assert asset_index.match_tags(['hero'], asset_ids={'hero_01', 'rock_01'}) == {'hero_01'}
+    assert asset_index.match_tags(['unknown']) == set()
+
+
+def test_incremental_updates():
+    asset_index = _build_index()
+    asset_index.remove('hero_01')
+    assert asset_index.tag_count('hero') == 1
+    assert 'character' not in asset_index.type_names()
+
+    asset_index.add(AssetNode('tree_01', category='Prop', tags=['forest']))
+    assert asset_index.with_tag('hero') == set()
+    assert asset_index.with_tag('forest') == {'tree_01'}
+    assert asset_index.get_nodes()[-1].id == 'tree_01'
+
+    asset_index.invalidate()
+    assert not asset_index.is_built and not len(asset_index)
+
+
+def test_index_can_be_built_in_chunks():
+    asset_nodes = [AssetNode('prop_{}'.format(i), category='Prop') for i in range(5)]
+    asset_index = assetindex.AssetIndex(loader=lambda: asset_nodes)
+    build_steps = asset_index.iter_build(chunk_size=2)
+    next(build_steps)
+    assert not asset_index.is_built and len(asset_index) == 0
+    next(build_steps)
+    assert len(asset_index) == 2
+    for _ in build_steps:
+        pass
+    assert asset_index.is_built
+    assert len(asset_index.match_categories(['prop'])) == 5
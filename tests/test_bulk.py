@@ -0,0 +1,87 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe-tools-outliner bulk mutation scope
+"""
+
+import pytest
+
+from artellapipe.tools.outliner.core import bulk
+
+
+def _create_scope(calls):
+    return bulk.BulkMutation(suspend_fn=lambda: calls.append('suspend'), resume_fn=lambda: calls.append('resume'))
+
+
+def test_nested_scopes_suspend_and_flush_once():
+    calls = list()
+    scope = _create_scope(calls)
+    with scope:
+        scope.defer('groups', lambda: calls.append('groups'))
+        with scope:
+            scope.defer('groups', lambda: calls.append('groups'))
+            scope.defer('solo', lambda: calls.append('solo'))
+        assert calls == ['suspend']
+    assert calls == ['suspend', 'groups', 'solo', 'resume']
+    assert not scope.is_active
+
+
+def test_deferred_functions_run_immediately_outside_scope():
+    calls = list()
+    scope = _create_scope(calls)
+    scope.defer('groups', lambda: calls.append('groups'))
+    assert calls == ['groups']
+
+
+def test_refresh_is_resumed_on_errors():
+    calls = list()
+    scope = _create_scope(calls)
+    with pytest.raises(RuntimeError):
+        with scope:
+            raise RuntimeError('failed')
+    assert calls == ['suspend', 'resume']
+
+
+def test_decorator_wraps_undo_chunk():
+    calls = list()
+
+    def _undo_decorator(fn):
+        def wrapper(*args, **kwargs):
+            calls.append('open_chunk')
+            result = fn(*args, **kwargs)
+            calls.append('close_chunk')
+            return result
+        return wrapper
+
+    @bulk.bulk_mutation_decorator(_undo_decorator)
+    def _switch(value):
+        calls.append(bulk.get_bulk_mutation().is_active)
+        return value
+
+    assert _switch(3) == 3
+    assert calls == ['open_chunk', True, 'close_chunk']
+
+
+def test_dcc_refresh_hooks_need_both_functions():
+    calls = list()
+
+    class _Dcc(object):
+        @staticmethod
+        def suspend_viewport_refresh():
+            calls.append('suspend')
+
+        @staticmethod
+        def resume_viewport_refresh():
+            calls.append('resume')
+
+    scope = bulk.BulkMutation(*bulk.get_dcc_refresh_hooks(_Dcc))
+    with scope:
+        pass
+    assert calls == ['suspend', 'resume']
+
+    del _Dcc.resume_viewport_refresh
+    assert bulk.get_dcc_refresh_hooks(_Dcc) == (None, None)
+
+    fallback_hooks = (lambda: calls.append('fallback_suspend'), lambda: calls.append('fallback_resume'))
+    assert bulk.get_dcc_refresh_hooks(_Dcc, fallback_hooks=fallback_hooks) == fallback_hooks
@@ -0,0 +1,43 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe-tools-outliner scene changes queue
+"""
+
+from artellapipe.tools.outliner.core import deltas
+
+
+def test_changes_are_collapsed():
+    queue = deltas.DeltaQueue()
+    queue.push_add('tree', 'tree_node')
+    queue.push_remove('tree')
+    queue.push_remove('rock')
+    queue.push_add('rock', 'rock_node')
+    queue.push_add('hero', 'hero_node')
+    queue.push_update('hero', 'hero_node_v2')
+    queue.push_update('house', 'house_node')
+    queue.push_remove('house')
+
+    assert queue.take() == [
+        (deltas.DELTA_UPDATE, 'rock', 'rock_node'),
+        (deltas.DELTA_ADD, 'hero', 'hero_node_v2'),
+        (deltas.DELTA_REMOVE, 'house', None)]
+    assert not len(queue)
+
+
+def test_overflow():
+    queue = deltas.DeltaQueue(max_size=2)
+    queue.push_add('tree')
+    queue.push_add('rock')
+    queue.push_remove('tree')
+    assert not queue.overflowed
+    queue.push_add('hero')
+    queue.push_add('house')
+    assert queue.overflowed
+    assert not len(queue)
+
+    queue.push_add('car')
+    assert not len(queue)
+    queue.clear()
+    assert not queue.overflowed
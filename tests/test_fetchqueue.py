@@ -0,0 +1,61 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe-tools-outliner lazy children fetch queue
+"""
+
+from artellapipe.tools.outliner.core import fetchqueue
+
+
+class _Item(object):
+    def __init__(self, name, is_expanded=True):
+        self.name = name
+        self.is_expanded = is_expanded
+        self.children_fetched = False
+
+    def can_fetch_more(self):
+        return not self.children_fetched
+
+    def fetch_more(self):
+        self.children_fetched = True
+
+
+def test_items_are_fetched_only_once():
+    fetched = list()
+    queue = fetchqueue.FetchQueue(lambda item: fetched.append(item.name))
+    item = _Item('chair')
+    assert queue.add(item)
+    assert item in queue
+
+    assert queue.fetch(item)
+    assert item.children_fetched and item not in queue
+    assert not queue.fetch(item)
+    assert not queue.add(item)
+    assert fetched == ['chair']
+
+
+def test_visible_items_are_fetched_first():
+    fetched = list()
+    queue = fetchqueue.FetchQueue(lambda item: fetched.append(item.name))
+    items = [_Item('asset{}'.format(i)) for i in range(10)]
+    for item in items:
+        queue.add(item)
+    assert len(queue) == 10
+
+    assert queue.fetch_visible(items[2:4]) == items[2:4]
+    assert fetched == ['asset2', 'asset3']
+    assert len(queue) == 8
+    assert not items[5].children_fetched
+
+
+def test_collapsed_items_are_discarded():
+    queue = fetchqueue.FetchQueue()
+    item = _Item('table', is_expanded=False)
+    queue.add(item)
+    assert queue.fetch_visible([item]) == []
+    assert item not in queue and item.can_fetch_more()
+
+    queue.add(item)
+    queue.clear()
+    assert not queue and queue.fetch_visible([item]) == []
@@ -0,0 +1,29 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe-tools-outliner file status checks
+"""
+
+import os
+
+from artellapipe.tools.outliner.core import filestatus
+
+
+def test_file_status_is_cached_by_mtime(tmp_path):
+    local_file = tmp_path / 'chair_model.ma'
+    published_file = tmp_path / 'chair_model_published.ma'
+    local_file.write_text(u'model')
+    published_file.write_text(u'model')
+
+    cache = filestatus.FileStatusCache()
+    assert cache.get_status(str(tmp_path / 'missing.ma')).status == filestatus.STATUS_MISSING
+    assert cache.get_status(str(local_file)).status == filestatus.STATUS_LOCAL
+
+    status = cache.get_status(str(local_file), published_path=str(published_file))
+    assert status.status == filestatus.STATUS_PUBLISHED
+    assert cache.get_status(str(local_file), published_path=str(published_file)) is status
+
+    local_file.write_text(u'modified model')
+    os.utime(str(local_file), (status.mtime + 10, status.mtime + 10))
+    assert cache.get_status(str(local_file), published_path=str(published_file)).status == filestatus.STATUS_MODIFIED
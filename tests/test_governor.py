@@ -0,0 +1,118 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe-tools-outliner background work governor
+"""
+
+from collections import OrderedDict
+
+from artellapipe.tools.outliner.core import governor
+
+
+class _Clock(object):
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class _Timer(object):
+    def __init__(self):
+        self._interval = 0
+
+    def interval(self):
+        return self._interval
+
+    def setInterval(self, interval):
+        self._interval = interval
+
+
+def _create_governor(state, clock):
+    probes = OrderedDict([('playback', lambda: state['playback']), ('viewport', lambda: state['viewport'])])
+    return governor.WorkGovernor(probes=probes, poll_interval=0.05, cooldown=0.3, busy_interval=250, clock=clock)
+
+
+def test_work_is_paused_while_dcc_is_busy():
+    state = {'playback': False, 'viewport': False}
+    clock = _Clock()
+    work_governor = _create_governor(state, clock)
+    assert work_governor.can_run()
+
+    state['playback'] = True
+    clock.now = 1.0
+    assert not work_governor.can_run()
+    assert work_governor.busy_reason == 'playback'
+
+    # Playback stopped, but work only resumes once cooldown is over
+    state['playback'] = False
+    clock.now = 1.1
+    assert not work_governor.can_run()
+    clock.now = 1.4
+    assert work_governor.can_run()
+
+
+def test_probes_are_polled_once_per_interval():
+    calls = list()
+    clock = _Clock()
+    work_governor = governor.WorkGovernor(probes={'playback': lambda: calls.append(True)}, clock=clock)
+    work_governor.is_busy()
+    work_governor.is_busy()
+    assert len(calls) == 1
+    clock.now = 1.0
+    work_governor.is_busy()
+    assert len(calls) == 2
+
+
+def test_failing_probes_are_ignored():
+    def _broken_probe():
+        raise RuntimeError('no DCC')
+
+    work_governor = governor.WorkGovernor(probes={'playback': _broken_probe}, clock=_Clock())
+    assert work_governor.can_run()
+
+
+def test_timers_are_throttled_while_busy():
+    state = {'playback': True, 'viewport': False}
+    clock = _Clock()
+    work_governor = _create_governor(state, clock)
+    timer = _Timer()
+    assert not work_governor.gate_timer(timer)
+    assert timer.interval() == 250
+
+    state['playback'] = False
+    clock.now = 1.0
+    assert work_governor.gate_timer(timer)
+    assert timer.interval() == 0
+
+
+def test_dcc_probes_use_implemented_functions():
+    class _Dcc(object):
+        @staticmethod
+        def is_playing_back():
+            return True
+
+        @staticmethod
+        def is_viewport_manipulated():
+            return False
+
+    probes = governor.get_dcc_probes(_Dcc)
+    assert list(probes.keys()) == ['playback', 'viewport']
+    work_governor = governor.WorkGovernor(probes=probes, clock=_Clock())
+    assert not work_governor.can_run()
+    assert work_governor.busy_reason == 'playback'
+
+
+def test_fallback_probes_are_used_for_missing_functions(caplog):
+    class _Dcc(object):
+        @staticmethod
+        def is_playing_back():
+            return False
+
+    probes = governor.get_dcc_probes(_Dcc, fallback_probes={'playback': None, 'scrubbing': lambda: True})
+    assert list(probes.keys()) == ['playback', 'scrubbing']
+    assert probes['playback'] is _Dcc.is_playing_back
+
+    assert not governor.get_dcc_probes(object(), fallback_probes={})
+    assert 'No busy probes available' in caplog.text
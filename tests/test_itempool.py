@@ -0,0 +1,37 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe-tools-outliner item widgets pool
+"""
+
+from artellapipe.tools.outliner.core import itempool
+
+
+class _AssetItem(object):
+    pass
+
+
+class _OverrideItem(object):
+    pass
+
+
+def test_items_are_reused_by_class():
+    pool = itempool.ItemPool(max_size=4)
+    asset_item = _AssetItem()
+    assert pool.acquire(_AssetItem) is None
+    assert pool.release(asset_item)
+    assert pool.acquire(_OverrideItem) is None
+    assert pool.acquire(_AssetItem) is asset_item
+    assert len(pool) == 0
+    assert pool.reuse_rate == 1.0 / 3
+    assert '1/3 reused' in pool.report()
+
+
+def test_pool_is_bounded():
+    pool = itempool.ItemPool(max_size=2)
+    assert [pool.release(_AssetItem()) for _ in range(3)] == [True, True, False]
+    assert len(pool) == 2
+    assert pool.stats()['discards'] == 1
+    assert len(pool.clear()) == 2
+    assert pool.acquire(_AssetItem) is None
@@ -0,0 +1,38 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe-tools-outliner global search name index
+"""
+
+from artellapipe.tools.outliner.core import nameindex
+
+
+def _build_index():
+    name_index = nameindex.NameIndex()
+    name_index.add('tree', 'props', 'tree_id')
+    name_index.add('tree_big_01', 'props', 'tree_big_id')
+    name_index.add('env_tree_01', 'sets', 'env_tree_id')
+    name_index.add('street_01', 'sets', 'street_id')
+    name_index.add('hero_01', 'characters', 'hero_id')
+
+    return name_index
+
+
+def test_results_are_ranked():
+    results = _build_index().search('Tree')
+    assert [result.asset_id for result in results] == ['tree_id', 'tree_big_id', 'env_tree_id', 'street_id']
+    assert [result.score for result in results] == [
+        nameindex.SCORE_EXACT, nameindex.SCORE_PREFIX, nameindex.SCORE_WORD_PREFIX, nameindex.SCORE_SUBSTRING]
+    assert results[2].category == 'sets'
+
+
+def test_limit_and_removal():
+    name_index = _build_index()
+    assert len(name_index.search('tree', limit=2)) == 2
+    assert not name_index.search('  ')
+
+    name_index.remove_category('sets')
+    assert [result.asset_id for result in name_index.search('tree')] == ['tree_id', 'tree_big_id']
+    assert name_index.remove('characters', 'hero_id')
+    assert not name_index.search('hero')
@@ -0,0 +1,49 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe-tools-outliner override registry
+"""
+
+from artellapipe.tools.outliner.core import overrides
+
+from tests.conftest import AssetNode
+
+
+class _ShadingOverride(object):
+    OVERRIDE_NAME = 'Shading'
+
+
+def test_registry_is_cached_until_invalidated():
+    calls = list()
+
+    def _loader():
+        calls.append(True)
+        return {'shading': _ShadingOverride}
+
+    registry = overrides.OverrideRegistry(loader=_loader)
+    assert registry.get_override('Shading') is _ShadingOverride
+    assert list(registry.get_overrides().keys()) == ['Shading']
+    assert len(calls) == 1
+
+    registry.invalidate()
+    assert not registry.is_loaded
+    registry.get_overrides()
+    assert len(calls) == 2
+
+
+def test_scene_cache_queries_each_asset_once_per_cycle():
+    cache = overrides.SceneOverridesCache()
+    chair = AssetNode('chair', overrides=[_ShadingOverride()])
+    table = AssetNode('table')
+    cache.begin_cycle()
+    cache.collect([chair, table])
+    cache.collect([chair])
+    assert chair.queries == 1
+    assert cache.count('chair') == 1
+    assert cache.get('table') == []
+
+    cache.begin_cycle()
+    cache.collect([chair])
+    assert chair.queries == 2
+    assert 'chair' in cache and 'table' not in cache
@@ -0,0 +1,50 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe-tools-outliner state presets
+"""
+
+import json
+
+from artellapipe.tools.outliner.core import records, presets
+
+from tests.conftest import AssetNode
+
+
+def test_presets_are_delta_encoded_and_applied_as_diff(tmp_path):
+    table = records.AssetRecordTable()
+    for i in range(4):
+        table.add(AssetNode('asset{}'.format(i)))
+    table.set_flag(table.get('asset1'), records.FLAG_VISIBLE, False)
+    table.set_flag(table.get('asset2'), records.FLAG_PROXY, True)
+
+    presets_path = presets.get_scene_presets_file(str(tmp_path / 'shot.ma'))
+    presets_file = presets.StatePresetsFile(presets_path)
+    assert presets_file.add_preset(presets.StatePreset.capture('layout', table))
+    with open(presets_path) as fh:
+        assert json.load(fh)['presets'] == {'layout': {'hidden': ['asset1'], 'proxy': ['asset2']}}
+
+    table.set_flag(table.get('asset1'), records.FLAG_VISIBLE, True)
+    table.set_flag(table.get('asset3'), records.FLAG_PROXY, True)
+
+    preset = presets.StatePresetsFile(presets_path).get_preset('layout')
+    plan = preset.diff(table)
+    assert [record.id for record in plan['to_hide']] == ['asset1']
+    assert [record.id for record in plan['to_hires']] == ['asset3']
+    assert not plan['to_show'] and not plan['to_proxy']
+
+
+def test_presets_use_given_state():
+    table = records.AssetRecordTable()
+    for i in range(3):
+        table.add(AssetNode('asset{}'.format(i)))
+    live_state = {'asset0': (False, False), 'asset1': (True, True), 'asset2': (True, False)}
+
+    preset = presets.StatePreset.capture('live', table, state_fn=lambda record: live_state[record.node])
+    assert preset.hidden == frozenset(['asset0']) and preset.proxy == frozenset(['asset1'])
+
+    live_state['asset1'] = (True, False)
+    plan = preset.diff(table, state_fn=lambda record: live_state[record.node])
+    assert [record.id for record in plan['to_proxy']] == ['asset1']
+    assert not plan['to_hide'] and not plan['to_show'] and not plan['to_hires']
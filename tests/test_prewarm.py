@@ -0,0 +1,112 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe-tools-outliner idle prewarming
+"""
+
+from artellapipe.tools.outliner.core import prewarm, assetindex
+
+
+def _counter_task(calls, name, units):
+    def _task():
+        for i in range(units):
+            calls.append('{}{}'.format(name, i))
+            yield
+    return _task
+
+
+def test_slices_are_bounded_by_time_budget():
+    ticks = iter(range(1000))
+    calls = list()
+    prewarmer = prewarm.Prewarmer(time_budget=2, clock=lambda: next(ticks))
+    prewarmer.add_task('modules', _counter_task(calls, 'm', 2))
+    prewarmer.add_task('icons', _counter_task(calls, 'i', 3))
+
+    assert prewarmer.run_slice()
+    assert calls == ['m0', 'm1']
+    assert prewarmer.run_slice()
+    assert prewarmer.is_finished_task('modules')
+    while prewarmer.run_slice():
+        pass
+    assert calls == ['m0', 'm1', 'i0', 'i1', 'i2']
+    assert prewarmer.finished_tasks == ['modules', 'icons']
+
+
+def test_slices_are_skipped_while_dcc_is_busy():
+    busy = [True]
+    calls = list()
+    prewarmer = prewarm.Prewarmer(time_budget=None, can_run=lambda: not busy[0])
+    prewarmer.add_task('modules', _counter_task(calls, 'm', 2))
+
+    assert prewarmer.run_slice()
+    assert not calls
+    busy[0] = False
+    assert not prewarmer.run_slice()
+    assert calls == ['m0', 'm1'] and prewarmer.is_finished
+
+
+def test_failing_task_does_not_stop_prewarm():
+    def _broken_task():
+        yield
+        raise RuntimeError('broken')
+
+    calls = list()
+    prewarmer = prewarm.Prewarmer(time_budget=None)
+    prewarmer.add_task('broken', _broken_task)
+    prewarmer.add_task('icons', _counter_task(calls, 'i', 1))
+    assert not prewarmer.run_slice()
+    assert calls == ['i0']
+    assert prewarmer.finished_tasks == ['icons']
+
+
+def test_stale_scene_data_is_discarded(monkeypatch):
+    scene_name = ['shot_010.ma']
+    monkeypatch.setattr(prewarm, '_get_scene_name', lambda: scene_name[0])
+    monkeypatch.setattr(prewarm, '_SCENE_DATA_KEY', prewarm.get_scene_key())
+    assert prewarm.consume_scene_data()
+    assert not prewarm.consume_scene_data()
+
+    monkeypatch.setattr(prewarm, '_SCENE_DATA_KEY', prewarm.get_scene_key())
+    scene_name[0] = 'shot_020.ma'
+    assert not prewarm.consume_scene_data()
+
+    monkeypatch.setattr(prewarm, '_SCENE_DATA_KEY', prewarm.get_scene_key())
+    assetindex.invalidate_index()
+    assert not prewarm.consume_scene_data()
+
+    # Assets referenced or removed in the same scene are notified by DCC scene callbacks
+    monkeypatch.setattr(prewarm, '_SCENE_DATA_KEY', prewarm.get_scene_key())
+    prewarm._on_scene_changed()
+    assert not prewarm.consume_scene_data()
+
+
+def test_outliner_classes_are_resolved():
+    outliners_data = {
+        'assets': {'class': 'artellapipe.tools.outliner.core.fetchqueue.FetchQueue'},
+        'missing': {'class': 'artellapipe.tools.outliner.core.missing_module.MissingOutliner'},
+        'empty': {}
+    }
+    prewarmer = prewarm.Prewarmer(time_budget=None)
+    prewarmer.add_task('classes', lambda: prewarm._resolve_outliner_classes(outliners_data))
+    assert not prewarmer.run_slice()
+    assert prewarmer.finished_tasks == ['classes']
+
+
+class _Config(object):
+    def __init__(self, data):
+        self._data = data
+
+    def get(self, key, default=None):
+        return self._data.get(key, default)
+
+
+def test_config_is_read_from_tool_config():
+    assert prewarm.load_config() == prewarm.DEFAULT_CONFIG
+    assert not prewarm.load_config(_Config({}))['enabled']
+
+    outliners_data = {'assets': {'class': 'artellapipe.tools.outliner.widgets.baseoutliner.BaseOutliner'}}
+    config = prewarm.load_config(_Config({'prewarm': {'enabled': True, 'scene': False}, 'outliners': outliners_data}))
+    assert config['enabled'] and config['interval'] == prewarm.DEFAULT_INTERVAL
+    assert config['outliners'] == outliners_data
+    assert prewarm.create_prewarmer(config).pending_tasks == ['modules', 'icons', 'classes']
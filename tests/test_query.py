@@ -0,0 +1,61 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe-tools-outliner filter queries
+"""
+
+import pytest
+
+from artellapipe.tools.outliner.core import records, statestore, query
+
+from tests.conftest import AssetNode
+
+
+def _build_table():
+    table = records.AssetRecordTable()
+    table.add(AssetNode('env_tree_01', 'env_tree_01:root', 'Prop'), namespace='env_tree_01')
+    rock = table.add(AssetNode('env_rock_01', 'env_rock_01:root', 'Prop'), namespace='env_rock_01')
+    hero = table.add(AssetNode('hero_01', 'hero_01:root', 'Character'), namespace='hero_01')
+    table.set_flag(rock, records.FLAG_VISIBLE, False)
+    table.set_flag(hero, records.FLAG_PROXY, True)
+    table.set_overrides(hero, ['Shading'])
+
+    return table
+
+
+def _select(table, text, use_numpy=True):
+    store = statestore.AssetStateStore(table, use_numpy=use_numpy)
+    context = query.QueryContext(table, tag_lookup=lambda tag: {'hero_01'} if tag == 'hero' else set())
+
+    return sorted(record.id for record in query.get_query(text).select(store, context))
+
+
+@pytest.mark.parametrize('use_numpy', [True, False])
+def test_query_terms(use_numpy):
+    table = _build_table()
+    assert _select(table, 'type:prop', use_numpy) == ['env_rock_01', 'env_tree_01']
+    assert _select(table, 'type:prop hidden:true', use_numpy) == ['env_rock_01']
+    assert _select(table, 'lod:proxy has:override', use_numpy) == ['hero_01']
+    assert _select(table, 'ns:env_* -type:character', use_numpy) == ['env_rock_01', 'env_tree_01']
+    assert _select(table, 'tag:hero', use_numpy) == ['hero_01']
+    assert _select(table, 'tree', use_numpy) == ['env_tree_01']
+    assert _select(table, 'hidden:true visible:true', use_numpy) == []
+    assert len(_select(table, '', use_numpy)) == 3
+
+
+def test_matches_agrees_with_select():
+    table = _build_table()
+    context = query.QueryContext(table)
+    compiled_query = query.get_query('type:prop -hidden:true')
+    assert [record.id for record in compiled_query.filter(table, context)] == ['env_tree_01']
+
+
+def test_queries_are_cached():
+    assert query.get_query('type:prop  ') is query.get_query('type:prop')
+
+
+def test_invalid_queries():
+    for text in ('lod:medium', 'has:files', 'hidden:maybe', 'color:red'):
+        with pytest.raises(query.QueryError):
+            query.get_query(text)
@@ -0,0 +1,71 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe-tools-outliner asset records
+"""
+
+import sys
+
+from artellapipe.tools.outliner.core import records
+
+from tests.conftest import AssetNode
+
+
+def _create_asset_node(name, category='prop'):
+    return AssetNode(name, '{}:root'.format(name), category, name=name)
+
+
+def test_add_and_get_record():
+    table = records.AssetRecordTable()
+    record = table.add(_create_asset_node('chair'), namespace=':chair')
+    assert len(table) == 1
+    assert table.get('chair') is record
+    assert record.name == 'chair'
+    assert table.type_name(record.type_id) == 'prop'
+    assert record.has_flag(records.FLAG_VISIBLE)
+
+
+def test_remove_keeps_indices_compact():
+    table = records.AssetRecordTable()
+    nodes = [_create_asset_node('asset{}'.format(i)) for i in range(5)]
+    for node in nodes:
+        table.add(node, namespace=node.id)
+    table.remove('asset1')
+    assert len(table) == 4
+    assert 'asset1' not in table
+    for record in table:
+        assert table.get_node(record).id == record.id
+
+
+def test_flags_and_overrides():
+    table = records.AssetRecordTable()
+    record = table.add(_create_asset_node('tree', category='set'), namespace='tree')
+    table.set_overrides(record, ['shading', 'model'])
+    assert record.has_flag(records.FLAG_HAS_OVERRIDE)
+    assert [table.override_name(i) for i in record.override_ids] == ['shading', 'model']
+    table.set_flag(record, records.FLAG_VISIBLE, False)
+    assert table.with_flags(records.FLAG_VISIBLE, state=False) == [record]
+
+
+def test_record_is_compact():
+    table = records.AssetRecordTable()
+    record = table.add(_create_asset_node('rock'), namespace='rock')
+    assert not hasattr(record, '__dict__')
+    assert sys.getsizeof(record) < 200
+
+
+def test_group_instances_of_same_asset():
+    table = records.AssetRecordTable()
+    for name in ('chair', 'chair1', 'chair2', 'table'):
+        table.add(_create_asset_node(name), namespace=name)
+    groups = records.group_records(table)
+    assert sorted(len(group) for group in groups.values()) == [1, 3]
+    assert table.group_key(table.get('chair2').group_id) == 'chair'
+
+
+def test_asset_proxy_state():
+    asset_node = _create_asset_node('chair')
+    assert not records.is_asset_proxy(asset_node)
+    asset_node.is_proxy = lambda: True
+    assert records.is_asset_proxy(asset_node)
@@ -0,0 +1,96 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe-tools-outliner asset snapshots
+"""
+
+import pytest
+
+from artellapipe.tools.outliner.core import snapshot, overrides, records
+
+from tests.conftest import AssetNode
+
+
+class _ShadingOverride(object):
+    OVERRIDE_NAME = 'Shading'
+
+
+class _Asset(object):
+    def __init__(self, name):
+        self.name = name
+
+    def get_name(self):
+        return self.name
+
+
+def _create_asset_node(asset_id, node, asset=None):
+    return AssetNode(asset_id, node, 'Prop', name=node, asset=asset, overrides=[_ShadingOverride])
+
+
+def test_snapshots_are_captured_once():
+    asset_nodes = [
+        _create_asset_node('tree_01', '|tree_01:root', asset=_Asset('tree')),
+        _create_asset_node('rock_01', '|rock_01:root')]
+    snapshots_cache = snapshot.AssetSnapshotCache(overrides_cache=overrides.SceneOverridesCache())
+    tree_snapshot, rock_snapshot = snapshots_cache.capture(asset_nodes)
+    assert tree_snapshot.short_name == 'tree_01:root'
+    assert tree_snapshot.node == '|tree_01:root'
+    assert tree_snapshot.asset_id == 'tree' and rock_snapshot.asset_id is None
+    assert tree_snapshot.category == 'Prop'
+    assert tree_snapshot.override_names == ('Shading',)
+    assert rock_snapshot.id == 'rock_01'
+
+    snapshots_cache.capture(asset_nodes)
+    assert snapshots_cache.get(asset_nodes[0]) is tree_snapshot
+    assert [asset_node.queries for asset_node in asset_nodes] == [2, 2]
+
+
+def test_snapshots_are_immutable():
+    snapshots_cache = snapshot.AssetSnapshotCache(overrides_cache=overrides.SceneOverridesCache())
+    asset_snapshot = snapshots_cache.get(_create_asset_node('tree_01', '|tree_01:root'))
+    with pytest.raises(AttributeError):
+        asset_snapshot.node = '|other'
+
+    updated_snapshot = snapshots_cache.update('tree_01', override_names=())
+    assert updated_snapshot.override_names == () and asset_snapshot.override_names == ('Shading',)
+    assert snapshots_cache.update('missing', override_names=()) is None
+
+
+def test_invalidated_snapshots_are_captured_again():
+    asset_node = _create_asset_node('tree_01', '|tree_01:root')
+    snapshots_cache = snapshot.AssetSnapshotCache(overrides_cache=overrides.SceneOverridesCache())
+    snapshots_cache.get(asset_node)
+
+    asset_node.node = '|tree_02:root'
+    assert snapshots_cache.get(asset_node).node == '|tree_01:root'
+    snapshots_cache.invalidate('tree_01')
+    assert 'tree_01' not in snapshots_cache
+    assert snapshots_cache.get(asset_node).node == '|tree_02:root'
+    assert asset_node.queries == 4
+
+
+def test_records_read_snapshots():
+    asset_node = _create_asset_node('tree_01', '|tree_01:root', asset=_Asset('tree'))
+    other_node = _create_asset_node('pine_01', '|pine_01:root', asset=_Asset('tree'))
+    asset_snapshots = [snapshot.take_snapshot(asset_node), snapshot.take_snapshot(other_node)]
+    queries = asset_node.queries
+    asset_node.asset = other_node.asset = None
+    table = records.AssetRecordTable()
+    record = table.add(asset_node, namespace=':tree_01', asset_snapshot=asset_snapshots[0])
+    other_record = table.add(other_node, namespace=':pine_01', asset_snapshot=asset_snapshots[1])
+    assert record.node == '|tree_01:root' and record.name == 'tree_01'
+    assert record.group_id == other_record.group_id
+    assert asset_node.queries == queries
+
+
+def test_overrides_can_be_collected_later():
+    asset_node = _create_asset_node('tree_01', '|tree_01:root')
+    snapshots_cache = snapshot.AssetSnapshotCache(overrides_cache=overrides.SceneOverridesCache())
+    asset_snapshot = snapshots_cache.capture([asset_node], collect_overrides=False)[0]
+    assert asset_snapshot.override_names is None
+    assert snapshots_cache.get(asset_node, collect_overrides=False) is asset_snapshot
+
+    assert snapshots_cache.collect_overrides([asset_node])[0].override_names == ('Shading',)
+    assert snapshots_cache.get(asset_node).override_names == ('Shading',)
+    assert asset_node.queries == 2
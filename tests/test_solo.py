@@ -0,0 +1,28 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe-tools-outliner solo mode
+"""
+
+from artellapipe.tools.outliner.core import records, solo
+
+from tests.conftest import AssetNode
+
+
+def test_solo_and_restore_plans():
+    table = records.AssetRecordTable()
+    for i in range(10):
+        table.add(AssetNode('asset{}'.format(i)))
+    table.set_flag(table.get('asset3'), records.FLAG_VISIBLE, False)
+    table.set_flag(table.get('asset5'), records.FLAG_VISIBLE, False)
+
+    snapshot = solo.VisibilitySnapshot.from_records(table, targets=['asset5'])
+    assert len(snapshot.bits) == 2
+    to_hide, to_show = snapshot.solo_plan()
+    assert to_show == ['asset5']
+    assert sorted(to_hide) == sorted('asset{}'.format(i) for i in range(10) if i not in (3, 5))
+
+    restore_hide, restore_show = snapshot.restore_plan()
+    assert restore_hide == ['asset5']
+    assert sorted(restore_show) == sorted(to_hide)
@@ -0,0 +1,63 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe-tools-outliner item sorting
+"""
+
+from artellapipe.tools.outliner.core import records, sorting
+
+from tests.conftest import AssetNode
+
+
+def _build_records():
+    table = records.AssetRecordTable()
+    for asset_id, category in (('rock', 'Prop'), ('hero', 'Character'), ('tree', 'Prop'), ('house', 'Set')):
+        table.add(AssetNode(asset_id, '{}:root'.format(asset_id), category), namespace=asset_id)
+
+    return table
+
+
+def _sorted_ids(table, sort_name, reverse=False):
+    key_fn = sorting.get_sort_key(sort_name)
+    index = sorting.SortedIndex(lambda record: key_fn(record, table) + (record.id, ), reverse=reverse)
+    for record in table:
+        index.insert(record)
+
+    return [record.id for record in index]
+
+
+def test_incremental_insertion_matches_full_sort():
+    table = _build_records()
+    assert _sorted_ids(table, 'name') == ['hero', 'house', 'rock', 'tree']
+    assert _sorted_ids(table, 'name', reverse=True) == ['tree', 'rock', 'house', 'hero']
+    assert _sorted_ids(table, 'type') == ['hero', 'rock', 'tree', 'house']
+
+    table.set_flag(table.get('rock'), records.FLAG_VISIBLE, False)
+    table.set_overrides(table.get('tree'), ['Shading'])
+    assert _sorted_ids(table, 'visibility')[-1] == 'rock'
+    assert _sorted_ids(table, 'override count')[0] == 'tree'
+
+
+def test_insert_remove_and_reset():
+    index = sorting.SortedIndex(lambda item: item[0])
+    items = [(3, 'a'), (1, 'b'), (2, 'c'), (1, 'd')]
+    assert [index.insert(item) for item in items] == [0, 0, 1, 1]
+    assert index.items == [(1, 'b'), (1, 'd'), (2, 'c'), (3, 'a')]
+    assert index.index(items[3]) == 1
+
+    assert index.remove(items[1]) == 0
+    assert index.remove(items[1]) == -1
+    assert index.items == [(1, 'd'), (2, 'c'), (3, 'a')]
+
+    index.reset(items, key_fn=lambda item: item[1], reverse=True)
+    assert [item[1] for item in index] == ['d', 'c', 'b', 'a']
+    assert index.insert((0, 'bb')) == 2
+
+
+def test_custom_sort_key():
+    sorting.register_sort_key('name length', lambda record, table: (len(record.name), ))
+    try:
+        assert _sorted_ids(_build_records(), 'name length') == ['hero', 'rock', 'tree', 'house']
+    finally:
+        sorting._SORT_KEYS.pop('name length')
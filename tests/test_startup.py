@@ -0,0 +1,168 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains startup budget tests for artellapipe-tools-outliner
+"""
+
+import re
+import sys
+import importlib
+import subprocess
+
+import pytest
+
+from artellapipe.tools.outliner.core import records, assetindex, icons, startup
+
+from tests.conftest import AssetNode
+
+# Cumulative import time (in seconds) allowed for the modules of the outliner data layer
+IMPORT_BUDGET = 0.5
+
+# Time (in seconds) allowed to index a scene of SCENE_SIZE assets and build the records of one category. Only the
+# data layer is measured: the toolset shell, outliner widgets and item widgets are not created
+RECORDS_BUILD_BUDGET = 0.5
+SCENE_SIZE = 5000
+
+DATA_MODULES = [
+    'artellapipe.tools.outliner.core.records',
+    'artellapipe.tools.outliner.core.statestore',
+    'artellapipe.tools.outliner.core.assetindex',
+    'artellapipe.tools.outliner.core.query',
+    'artellapipe.tools.outliner.core.nameindex',
+    'artellapipe.tools.outliner.core.sorting',
+    'artellapipe.tools.outliner.core.icons',
+]
+
+BUTTONS_MODULES = [
+    'artellapipe.tools.outliner.core.buttons',
+    'artellapipe.tools.outliner.widgets.buttons',
+]
+
+
+def _get_import_times(modules):
+    """
+    Returns the cumulative import time of the given modules, as reported by python -X importtime
+    :param modules: list(str)
+    :return: dict(str, float), dictionary that maps module names with their import time in seconds
+    """
+
+    process = subprocess.Popen(
+        [sys.executable, '-X', 'importtime', '-c', 'import {}'.format(', '.join(modules))],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    _, stderr = process.communicate()
+    assert process.returncode == 0, stderr
+
+    import_times = dict()
+    for line in stderr.decode('utf-8', 'replace').splitlines():
+        match = re.match(r'import time:\s*\d+\s*\|\s*(\d+)\s*\|\s*(\S+)', line)
+        if match:
+            import_times[match.group(2)] = int(match.group(1)) / 1000000.0
+
+    return import_times
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason='python -X importtime requires Python 3.7+')
+def test_data_layer_import_time():
+    import_times = _get_import_times(DATA_MODULES)
+    assert all(module_name in import_times for module_name in DATA_MODULES)
+    assert sum(import_times[module_name] for module_name in DATA_MODULES) < IMPORT_BUDGET
+
+
+def test_icon_cache_loads_on_first_use():
+    calls = list()
+    icon_cache = icons.IconCache(loader=lambda icon_name: calls.append(icon_name) or icon_name)
+    assert not calls
+    assert icon_cache.get('eye') == 'eye'
+    assert icon_cache.get('eye') == 'eye'
+    assert calls == ['eye']
+
+    icon_cache.clear()
+    assert 'eye' not in icon_cache
+    icon_cache.get('eye')
+    assert calls == ['eye', 'eye']
+
+
+def test_icons_are_not_loaded_on_import(monkeypatch):
+    pytest.importorskip('Qt.QtWidgets')
+    tpDcc = pytest.importorskip('tpDcc')
+    pytest.importorskip('tpDcc.libs.qt.widgets.dividers')
+
+    calls = list()
+    monkeypatch.setattr(tpDcc, 'ResourcesMgr', lambda *args, **kwargs: calls.append(args))
+    for module_name in BUTTONS_MODULES:
+        monkeypatch.delitem(sys.modules, module_name, raising=False)
+    monkeypatch.setattr(icons, '_CACHE', icons.IconCache())
+
+    for module_name in BUTTONS_MODULES:
+        importlib.import_module(module_name)
+
+    assert not calls
+    assert not len(icons.get_cache())
+
+
+def _create_asset_node(index, category):
+    asset_id = 'asset_{}'.format(index)
+    return AssetNode(asset_id, '|{}:{}_grp'.format(asset_id, category), category, tags=[category])
+
+
+def test_startup_steps_run_one_at_a_time():
+    ticks = iter(range(100))
+    calls = list()
+    sequence = startup.StartupSequence(clock=lambda: next(ticks))
+    sequence.add_step('scene', lambda: calls.append('scene'))
+    sequence.add_step('props', lambda: calls.append('props'), interactive=True)
+    sequence.add_step('broken', lambda: 1 / 0)
+    sequence.add_step('tags', lambda: calls.append('tags'))
+    assert not sequence.run_next()
+
+    sequence.start()
+    assert sequence.run_next()
+    assert calls == ['scene'] and not sequence.is_interactive
+    assert sequence.run_next()
+    assert sequence.is_interactive and sequence.time_to_interactive == 4
+    sequence.run_all()
+    assert calls == ['scene', 'props', 'tags']
+    assert sequence.is_finished
+    assert list(sequence.timings.keys()) == ['scene', 'props', 'broken', 'tags']
+    assert 'interactive in' in sequence.report()
+
+
+def test_time_to_first_paint_is_recorded_once():
+    now = [10.0]
+    sequence = startup.StartupSequence(clock=lambda: now[0])
+    sequence.add_step('scene', lambda: None)
+    assert not sequence.mark_first_paint()
+
+    # Sequence starts when the tool started to be created, so the time spent creating the shell is measured too
+    sequence.start(start_time=9.5)
+    now[0] = 10.25
+    assert sequence.mark_first_paint()
+    now[0] = 11.0
+    assert not sequence.mark_first_paint()
+    assert sequence.is_painted and sequence.time_to_first_paint == 0.75
+    assert 'painted in 0.750s' in sequence.report()
+
+    sequence.reset()
+    assert not sequence.is_painted
+
+
+def test_scene_index_and_category_records_build_time():
+    categories = ['prop', 'character', 'set', 'camera']
+    asset_nodes = [_create_asset_node(i, categories[i % len(categories)]) for i in range(SCENE_SIZE)]
+    asset_index = assetindex.AssetIndex(loader=lambda: asset_nodes)
+    record_table = records.AssetRecordTable()
+
+    def _populate():
+        for asset_node in asset_index.get_nodes(asset_index.match_categories(['prop'])):
+            record_table.add(asset_node)
+
+    sequence = startup.StartupSequence()
+    sequence.add_step('scene', asset_index.build)
+    sequence.add_step('prop', _populate, interactive=True)
+    sequence.add_step('tags', asset_index.tag_names)
+    sequence.start()
+    sequence.run_all()
+
+    assert len(record_table) == SCENE_SIZE // len(categories)
+    assert sequence.time_to_interactive < RECORDS_BUILD_BUDGET
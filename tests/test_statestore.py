@@ -0,0 +1,59 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe-tools-outliner asset state store
+"""
+
+import pytest
+
+from artellapipe.tools.outliner.core import records, statestore
+
+from tests.conftest import AssetNode
+
+
+def _build_table():
+    table = records.AssetRecordTable()
+    for i, category in enumerate(['prop', 'prop', 'character', 'prop']):
+        record = table.add(AssetNode('asset{}'.format(i), category=category))
+        if i % 2:
+            table.set_overrides(record, ['shading'])
+    return table
+
+
+@pytest.mark.parametrize('use_numpy', [False, True])
+def test_state_store_masks(use_numpy):
+    if use_numpy:
+        pytest.importorskip('numpy')
+    table = _build_table()
+    table.set_flag(table.get('asset3'), records.FLAG_VISIBLE, False)
+    store = statestore.AssetStateStore(table, use_numpy=use_numpy)
+    assert store.is_vectorized == use_numpy
+
+    found = store.select(types=['prop'], has_override=True)
+    assert sorted(record.id for record in found) == ['asset1', 'asset3']
+
+    found = store.select(types=['Prop'], has_override=True, visible=True)
+    assert [record.id for record in found] == ['asset1']
+    assert store.nodes(store.mask(visible=False)) == ['asset3']
+    assert store.select(types=['vehicle']) == []
+
+
+@pytest.mark.parametrize('use_numpy', [False, True])
+def test_state_store_tracks_flag_changes(use_numpy):
+    if use_numpy:
+        pytest.importorskip('numpy')
+    table = _build_table()
+    store = statestore.AssetStateStore(table, use_numpy=use_numpy)
+    assert not store.is_dirty
+
+    table.set_flag(table.get('asset0'), records.FLAG_PROXY, True)
+    table.get('asset2').set_flag(records.FLAG_SELECTED, True)
+    assert not store.is_dirty
+    assert [record.id for record in store.select(lod=statestore.LOD_PROXY)] == ['asset0']
+    assert [record.id for record in store.select(selected=True)] == ['asset2']
+
+    table.remove('asset0')
+    assert store.is_dirty
+    assert store.select(lod=statestore.LOD_PROXY) == []
+    assert not store.is_dirty
@@ -0,0 +1,45 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for artellapipe-tools-outliner deferred widgets teardown
+"""
+
+from artellapipe.tools.outliner.core import teardown
+
+ITEM_COST = 0.001
+
+
+class _Clock(object):
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_batches_are_bounded():
+    destroyed = list()
+    queue = teardown.TeardownQueue(destroy_fn=destroyed.append, batch_size=50, time_budget=None)
+    queue.schedule(range(120))
+    assert [queue.run_batch() for _ in range(4)] == [50, 50, 20, 0]
+    assert queue.is_empty
+    assert destroyed == list(range(120))
+
+
+def test_batches_are_bounded_by_time_budget():
+    clock = _Clock()
+
+    def _destroy(widget):
+        clock.now += ITEM_COST
+
+    queue = teardown.TeardownQueue(destroy_fn=_destroy, batch_size=1000, time_budget=0.004, clock=clock)
+    queue.schedule(range(10))
+    assert [queue.run_batch() for _ in range(4)] == [4, 4, 2, 0]
+
+
+def test_flush():
+    queue = teardown.TeardownQueue(destroy_fn=lambda widget: None)
+    queue.schedule(range(10))
+    assert queue.flush() == 10
+    assert len(queue) == 0